@@ -1,6 +1,11 @@
-"""Run a small demo from the package entrypoint."""
+"""Package entrypoint: the CLI (see dna_storage.cli), or the demo when run without arguments."""
+import sys
+
+from dna_storage.cli import main as cli_main
 from dna_storage.examples.basic_rs_pipeline import main
 
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(cli_main())
     main()
@@ -0,0 +1,483 @@
+"""Command-line interface: `python -m dna_storage <command> ...`.
+
+Commands:
+- encode INPUT...: split every file into messages, encode and map them,
+  write one FASTA of strands per file
+- simulate STRANDS...: send strand FASTA files through the configured
+  channel, write one FASTA of reads per file
+- decode READS...: group reads (FASTA/FASTQ, plain or .gz) by strand, align,
+  decode and write the recovered file
+- bench [INPUT...]: encode -> simulate -> decode in memory and report
+  recovery (a random payload when no input is given)
+
+Inputs may be files, directories (all files in them) or glob patterns. The
+components are built once from the config and shared by all files, so
+precomputed tables (generator/interpolation matrices, GF lookups) are set up
+once per process. Every command prints per-stage throughput.
+
+Strand and read FASTA headers carry `sid=<strand> size=<bytes> total=<file
+bytes>`, which is how `decode` puts strands back in order without keeping
+any state between commands.
+"""
+
+import argparse
+import glob
+import os
+import re
+import sys
+import time
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+import numpy as np
+
+from dna_storage.components.channel.chained import ChainedChannel
+from dna_storage.components.channel.fastq_reader import FastqReader
+from dna_storage.core.registry import build, build_channel, load_spec
+from dna_storage.utils.diagnostics import DECODED, FAILED, MISSING, DecodeStatus
+from dna_storage.utils.gf4 import pack_gf4, unpack_gf4
+from dna_storage.utils.packed import as_str
+
+DEFAULT_CONFIG: Dict[str, object] = {
+    "encoder": {"type": "ReedSolomonEncoder", "n": 39, "k": 30},
+    "mapper": {"type": "RotatingMapper"},
+    "channel": [
+        {"type": "SoupDuplicator", "copies": 20},
+        {"type": "IDSChannel", "sub_p": 0.01, "del_p": 0.01},
+    ],
+    "aligner": {"type": "SimpleAligner"},
+    "decoder": {"type": "ReedSolomonDecoder"},
+}
+
+# suffixes stripped from input names when naming outputs
+_SUFFIXES = (".gz", ".reads.fa", ".reads.fastq", ".fastq", ".fq", ".fasta", ".fa")
+_FIELD = re.compile(r"(\w+)=(\S+)")
+
+# per-process aligner, installed once by the pool initializer
+_worker_aligner = None
+
+Record = Tuple[int, int, int, str]  # sid, size, total, sequence
+
+
+def load_config(path: str | None) -> Dict[str, object]:
+    """Read a JSON/TOML/YAML config (see core.registry.load_spec); missing sections use DEFAULT_CONFIG."""
+    cfg = dict(DEFAULT_CONFIG)
+    if path is not None:
+        cfg.update(load_spec(path))
+    return cfg
+
+
+def build_components(cfg: Dict[str, object]) -> Dict[str, object]:
+    """Build encoder, mapper, channel, aligner and decoder from a config dict.
+
+    The decoder inherits n/k from the encoder and gets the mapper unless its
+    spec sets them. `chunk_size` (bytes per strand) defaults to encoder.k.
+    An optional `compressor` section compresses files before encoding, and
+    an optional `screener` section checks strands for synthesis constraints
+    (re-mapping failing ones when the mapper is a ScramblingMapper).
+    """
+    encoder = build("encoder", cfg["encoder"])
+    mapper = build("mapper", cfg["mapper"])
+    defaults = {key: getattr(encoder, key) for key in ("n", "k") if hasattr(encoder, key)}
+    return {
+        "encoder": encoder,
+        "mapper": mapper,
+        "channel": ChainedChannel(*build_channel(cfg.get("channel")), fuse=bool(cfg.get("fuse_channels"))),
+        "aligner": build("aligner", cfg.get("aligner")),
+        "decoder": build("decoder", cfg["decoder"], mapper=mapper, **defaults),
+        "compressor": build("compressor", cfg.get("compressor")),
+        "screener": build("screener", cfg.get("screener")),
+        "chunk_size": int(cfg.get("chunk_size") or getattr(encoder, "k", 16)),
+    }
+
+
+def expand_inputs(patterns: Iterable[str]) -> List[str]:
+    """Files named by `patterns`: paths, directories (their files) or glob patterns."""
+    out: List[str] = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            names = sorted(os.path.join(pattern, n) for n in os.listdir(pattern))
+            out.extend(n for n in names if os.path.isfile(n))
+        elif any(ch in pattern for ch in "*?["):
+            out.extend(n for n in sorted(glob.glob(pattern)) if os.path.isfile(n))
+        elif os.path.isfile(pattern):
+            out.append(pattern)
+        else:
+            raise ValueError(f"no such input: {pattern}")
+    return out
+
+
+def _stem(path: str) -> str:
+    name = os.path.basename(path)
+    stripped = True
+    while stripped:
+        stripped = False
+        for suffix in _SUFFIXES:
+            if name.endswith(suffix) and len(name) > len(suffix):
+                name = name[: -len(suffix)]
+                stripped = True
+    return name
+
+
+class Throughput:
+    """Accumulates items, bytes and seconds per stage and prints a summary."""
+
+    def __init__(self):
+        self.stages: Dict[str, List[float]] = {}
+
+    def add(self, stage: str, items: int, nbytes: int, seconds: float) -> None:
+        acc = self.stages.setdefault(stage, [0, 0, 0.0])
+        acc[0] += items
+        acc[1] += nbytes
+        acc[2] += seconds
+
+    def report(self) -> str:
+        lines = ["stage        items       bytes  seconds      items/s       KB/s"]
+        for stage, (items, nbytes, secs) in self.stages.items():
+            rate = 1 / secs if secs > 0 else float("inf")
+            lines.append(
+                f"{stage:<10} {int(items):>7} {int(nbytes):>11} {secs:>8.3f} {items * rate:>12.1f} {nbytes * rate / 1e3:>10.1f}"
+            )
+        return "\n".join(lines)
+
+
+# --- stages ----------------------------------------------------------------
+def encode_bytes(data: bytes, comps: Dict[str, object], batch_size: int = 0) -> List[Record]:
+    """Split `data` into chunk_size messages and return (sid, size, total, strand) records.
+
+    With batch_size > 0 and an encoder/mapper pair that supports it
+    (encode_batch / map_batch) messages are encoded batch_size at a time as
+    one matrix product. With a screener, each batch (or the whole payload
+    when unbatched) is mapped and screened at once.
+    """
+    encoder, mapper, chunk = comps["encoder"], comps["mapper"], comps["chunk_size"]
+    screener = comps.get("screener")
+    if screener is not None:
+        screener.reset_stats()
+    messages = [data[i : i + chunk] for i in range(0, len(data), chunk)]
+    sizes = [len(m) for m in messages]
+    batched = (
+        batch_size > 0
+        and hasattr(encoder, "encode_batch")
+        and hasattr(mapper, "map_batch")
+        and chunk == getattr(encoder, "k", None)
+    )
+    strands: List[str] = []
+    if batched:
+        for lo in range(0, len(messages), batch_size):
+            block = messages[lo : lo + batch_size]
+            arr = np.zeros((len(block), chunk), dtype=np.uint8)
+            for i, m in enumerate(block):
+                arr[i, : len(m)] = np.frombuffer(m, dtype=np.uint8)
+            codewords = unpack_gf4(encoder.encode_batch(arr))
+            if screener is not None:
+                strands.extend(screener.screen(codewords, mapper, accumulate=True))
+            else:
+                strands.extend(mapper.map_batch(codewords))
+    elif screener is not None:
+        strands = screener.screen([encoder.encode(m) for m in messages], mapper, accumulate=True)
+    else:
+        strands = [mapper.map(encoder.encode(m)) for m in messages]
+    return [(sid, size, len(data), s) for sid, (size, s) in enumerate(zip(sizes, strands))]
+
+
+def simulate_records(records: Iterable[Record], comps: Dict[str, object]) -> Iterator[Record]:
+    """Send every strand through the channel; reads keep their strand's header."""
+    channel = comps["channel"]
+    for sid, size, total, strand in records:
+        for r in channel.transmit([strand]):
+            yield sid, size, total, as_str(r)
+
+
+def _init_worker(aligner) -> None:
+    global _worker_aligner
+    _worker_aligner = aligner
+
+
+def _consensus(aligner, reads: List[str]) -> str:
+    return as_str(list(aligner.align(reads))[0]) if reads else ""
+
+
+def _worker_consensus(reads: List[str]) -> str:
+    return _consensus(_worker_aligner, reads)
+
+
+def _decode_strands(consensus: List[str], comps: Dict[str, object], batch_size: int) -> List[Tuple[bytes, tuple]]:
+    """(message, (status, corrected, erased)) per consensus read; status codes from utils.diagnostics."""
+    decoder, mapper = comps["decoder"], comps["mapper"]
+    out: List[Tuple[bytes, tuple]] = [(b"", (FAILED, 0, 0))] * len(consensus)
+    todo = list(range(len(consensus)))
+    n = getattr(decoder, "n", None)
+    if batch_size > 0 and n and hasattr(decoder, "decode_batch") and hasattr(mapper, "reverse_batch"):
+        # consensus reads of exactly 4n clean bases (plus a ScramblingMapper's
+        # seed bases) decode as one matrix
+        length = 4 * n + getattr(mapper, "prefix_bases", 0)
+        full = [i for i in todo if len(consensus[i]) == length and set(consensus[i]) <= set("ACGT")]
+        for lo in range(0, len(full), batch_size):
+            ids = full[lo : lo + batch_size]
+            rows = decoder.decode_batch(pack_gf4(mapper.reverse_batch([consensus[i] for i in ids])))
+            for i, row in zip(ids, rows):
+                out[i] = (row.tobytes(), (DECODED, 0, 0))
+        done = set(full)
+        todo = [i for i in todo if i not in done]
+    for i in todo:
+        if consensus[i]:
+            try:
+                raw = decoder.decode([consensus[i]])
+            except ValueError:
+                # eg. non-ACGT symbols in a real read
+                continue
+            status = getattr(decoder, "last_status", None)
+            out[i] = (raw, status[0][1:] if status else (DECODED, 0, 0))
+    return out
+
+
+def decode_records(
+    records: Iterable[Record],
+    comps: Dict[str, object],
+    workers: int = 0,
+    batch_size: int = 0,
+    stats: Throughput | None = None,
+    status: DecodeStatus | None = None,
+) -> Tuple[bytes, Dict[str, int]]:
+    """Reassemble the payload from reads tagged with their strand header.
+
+    Reads are grouped by sid, reduced to one consensus per strand (aligned
+    in `workers` processes when > 0) and decoded. Strands without reads or
+    that fail to decode are zero-filled so later strands keep their offsets.
+    Returns (payload, counts) with counts strands, missing, failed,
+    corrected and erased; `status`, if given, receives one entry per sid.
+    """
+    groups: Dict[int, List[str]] = {}
+    sizes: Dict[int, int] = {}
+    total = 0
+    for sid, size, tot, seq in records:
+        groups.setdefault(sid, []).append(seq)
+        sizes[sid] = size
+        total = max(total, tot)
+    chunk = comps["chunk_size"]
+    count = max(-(-total // chunk), max(groups, default=-1) + 1)
+    sids = list(range(count))
+    read_groups = [groups.get(sid, []) for sid in sids]
+
+    t0 = time.perf_counter()
+    aligner = comps["aligner"]
+    if aligner is None:
+        consensus = [as_str(g[0]) if g else "" for g in read_groups]
+    elif workers > 0:
+        # imported here: most runs never start a pool
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(aligner,),
+        ) as pool:
+            consensus = list(pool.map(_worker_consensus, read_groups, chunksize=max(1, count // (8 * workers))))
+    else:
+        consensus = [_consensus(aligner, g) for g in read_groups]
+    t1 = time.perf_counter()
+    decoded = _decode_strands(consensus, comps, batch_size)
+    t2 = time.perf_counter()
+
+    parts: List[bytes] = []
+    status = status if status is not None else DecodeStatus()
+    for sid, (raw, (code, corrected, erased)) in zip(sids, decoded):
+        size = sizes.get(sid, max(0, min(chunk, total - sid * chunk)))
+        if sid not in groups:
+            code, corrected, erased = MISSING, 0, 0
+        elif len(raw) < size:
+            code = FAILED
+        if code >= FAILED:
+            raw = b""
+        status.record(code, corrected, erased, strand=sid)
+        parts.append(raw[:size].ljust(size, b"\0"))
+    if stats is not None:
+        nreads = sum(len(g) for g in read_groups)
+        stats.add("align", nreads, sum(len(r) for g in read_groups for r in g), t1 - t0)
+        stats.add("decode", count, total, t2 - t1)
+    found = status.counts()
+    counts = {"strands": count, **{key: found[key] for key in ("missing", "failed", "corrected", "erased")}}
+    return b"".join(parts), counts
+
+
+def compress_payload(data: bytes, comps: Dict[str, object]) -> bytes:
+    """Payload as stored: `data` through the configured compressor, if any."""
+    compressor = comps.get("compressor")
+    return compressor.compress(data) if compressor is not None else data
+
+
+def decompress_payload(payload: bytes, comps: Dict[str, object]) -> Tuple[bytes, int]:
+    """Inverse of compress_payload: (data, corrupt blocks); corrupt blocks are zero-filled."""
+    compressor = comps.get("compressor")
+    if compressor is None:
+        return payload, 0
+    try:
+        data = compressor.decompress(payload)
+    except ValueError:
+        # stream header lost
+        return b"", 1
+    return data, len(compressor.last_stats["corrupt"])
+
+
+# --- FASTA io ----------------------------------------------------------------
+def write_fasta(path: str, records: Iterable[Record]) -> int:
+    count = 0
+    with open(path, "w", encoding="ascii") as fh:
+        for sid, size, total, seq in records:
+            fh.write(f">sid={sid} size={size} total={total}\n{seq}\n")
+            count += 1
+    return count
+
+
+def read_fasta(path: str) -> Iterator[Record]:
+    """Records of a strand/read file written by this CLI (FASTA or FASTQ, plain or .gz)."""
+    for name, seq, _ in FastqReader(path, with_quality=False).read_records():
+        fields = dict(_FIELD.findall(name))
+        if "sid" not in fields:
+            raise ValueError(f"{path}: read header {name!r} has no sid= field")
+        yield int(fields["sid"]), int(fields.get("size", 0)), int(fields.get("total", 0)), seq
+
+
+# --- commands ----------------------------------------------------------------
+def _output_path(outdir: str, path: str, suffix: str) -> str:
+    os.makedirs(outdir, exist_ok=True)
+    return os.path.join(outdir, _stem(path) + suffix)
+
+
+def cmd_encode(args, comps, stats: Throughput) -> int:
+    for path in expand_inputs(args.inputs):
+        with open(path, "rb") as fh:
+            data = fh.read()
+        t0 = time.perf_counter()
+        stored = compress_payload(data, comps)
+        records = encode_bytes(stored, comps, args.batch_size)
+        stats.add("encode", len(records), len(data), time.perf_counter() - t0)
+        out = _output_path(args.output, path, ".fa")
+        t0 = time.perf_counter()
+        write_fasta(out, records)
+        stats.add("write", len(records), sum(len(r[3]) for r in records), time.perf_counter() - t0)
+        packed = f" ({len(stored)} compressed)" if comps.get("compressor") is not None else ""
+        screened = ""
+        if comps.get("screener") is not None:
+            found = comps["screener"].last_stats
+            screened = f" ({found['remapped']} re-mapped, {found['unresolved']} failing screening)"
+        print(f"{path}: {len(data)} bytes{packed} -> {len(records)} strands in {out}{screened}")
+    return 0
+
+
+def cmd_simulate(args, comps, stats: Throughput) -> int:
+    for path in expand_inputs(args.inputs):
+        strands = list(read_fasta(path))
+        t0 = time.perf_counter()
+        reads = list(simulate_records(strands, comps))
+        stats.add("simulate", len(strands), sum(len(r[3]) for r in strands), time.perf_counter() - t0)
+        out = _output_path(args.output, path, ".reads.fa")
+        write_fasta(out, reads)
+        print(f"{path}: {len(strands)} strands -> {len(reads)} reads in {out}")
+    return 0
+
+
+def cmd_decode(args, comps, stats: Throughput) -> int:
+    status = 0
+    for path in expand_inputs(args.inputs):
+        t0 = time.perf_counter()
+        reads = list(read_fasta(path))
+        stats.add("read", len(reads), sum(len(r[3]) for r in reads), time.perf_counter() - t0)
+        failures = DecodeStatus()
+        payload, counts = decode_records(reads, comps, args.workers, args.batch_size, stats, failures)
+        payload, corrupt = decompress_payload(payload, comps)
+        out = _output_path(args.output, path, ".decoded")
+        with open(out, "wb") as fh:
+            fh.write(payload)
+        if args.failure_map:
+            failures.save(_output_path(args.output, path, f".failures.{args.failure_map}"))
+        print(
+            f"{path}: {counts['strands']} strands ({counts['missing']} missing, "
+            f"{counts['failed']} failed) -> {len(payload)} bytes in {out}"
+            + (f" ({corrupt} corrupt compressed blocks)" if corrupt else "")
+        )
+        if counts["missing"] or counts["failed"] or corrupt:
+            status = 1
+    return status
+
+
+def cmd_bench(args, comps, stats: Throughput) -> int:
+    if args.inputs:
+        payloads = []
+        for path in expand_inputs(args.inputs):
+            with open(path, "rb") as fh:
+                payloads.append((path, fh.read()))
+    else:
+        rng = np.random.default_rng(args.seed)
+        payloads = [("random", rng.integers(0, 256, args.size, dtype=np.uint8).tobytes())]
+    for name, data in payloads:
+        t0 = time.perf_counter()
+        strands = encode_bytes(compress_payload(data, comps), comps, args.batch_size)
+        t1 = time.perf_counter()
+        reads = list(simulate_records(strands, comps))
+        t2 = time.perf_counter()
+        stats.add("encode", len(strands), len(data), t1 - t0)
+        stats.add("simulate", len(strands), sum(len(r[3]) for r in strands), t2 - t1)
+        payload, counts = decode_records(reads, comps, args.workers, args.batch_size, stats)
+        payload, _ = decompress_payload(payload, comps)
+        a = np.frombuffer(data, dtype=np.uint8)
+        b = np.frombuffer(payload, dtype=np.uint8)[: len(a)]
+        same = int((a[: len(b)] == b).sum())
+        pct = 100.0 * same / len(a) if len(a) else 100.0
+        print(
+            f"{name}: {len(data)} bytes, {counts['strands']} strands, {len(reads)} reads, "
+            f"{counts['failed'] + counts['missing']} strands lost, {pct:.2f}% bytes recovered"
+        )
+    return 0
+
+
+_COMMANDS = {"encode": cmd_encode, "simulate": cmd_simulate, "decode": cmd_decode, "bench": cmd_bench}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="dna_storage", description="Encode, simulate and decode DNA storage files.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    helps = {
+        "encode": "files -> strand FASTA",
+        "simulate": "strand FASTA -> read FASTA through the channel",
+        "decode": "read FASTA/FASTQ -> files",
+        "bench": "encode, simulate and decode in memory",
+    }
+    for name, text in helps.items():
+        p = sub.add_parser(name, help=text)
+        p.add_argument("inputs", nargs="*" if name == "bench" else "+", help="files, directories or glob patterns")
+        p.add_argument("-c", "--config", help="JSON/TOML component config (default: built-in RS pipeline)")
+        p.add_argument("-o", "--output", default=".", help="output directory (default: current directory)")
+        p.add_argument("--batch-size", type=int, default=0, help="encode/decode this many strands per matrix op (0: per strand)")
+        p.add_argument("--workers", type=int, default=0, help="align in this many processes (0: inline)")
+        p.add_argument("-q", "--quiet", action="store_true", help="do not print the throughput table")
+        if name == "decode":
+            p.add_argument(
+                "--failure-map",
+                choices=("csv", "npy"),
+                help="also write per-strand decode status (decoded/corrected/erased/failed/missing) as <name>.failures.csv|npy",
+            )
+        if name == "bench":
+            p.add_argument("--size", type=int, default=10000, help="random payload bytes when no input is given")
+            p.add_argument("--seed", type=int, default=None)
+    return parser
+
+
+def main(argv: List[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        comps = build_components(load_config(args.config))
+        stats = Throughput()
+        status = _COMMANDS[args.command](args, comps, stats)
+    except ValueError as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 2
+    if not args.quiet:
+        print(stats.report())
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,7 @@
 """Top-level components package."""
 __all__ = [
     "inputter",
+    "compressor",
     "encoder",
     "mapper",
     "channel",
@@ -1,3 +1,14 @@
-from .simple_aligner import SimpleAligner
+from dna_storage.utils.lazy import lazy_exports
 
-__all__ = ["SimpleAligner"]
+__all__ = ["SimpleAligner", "BeamSearchAligner", "ProgressiveAligner", "AdaptiveConsensusAligner"]
+
+# submodules are imported on first access (PEP 562)
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".simple_aligner": ["SimpleAligner"],
+        ".beam_aligner": ["BeamSearchAligner"],
+        ".progressive_aligner": ["ProgressiveAligner"],
+        ".adaptive_aligner": ["AdaptiveConsensusAligner"],
+    },
+)
@@ -0,0 +1,111 @@
+from typing import Iterable, List
+
+import numpy as np
+
+from dna_storage.utils.packed import as_str
+
+from .simple_aligner import _global_align
+from .progressive_aligner import _star_consensus
+
+# vote columns: A, C, G, T, gap
+_SYMBOLS = "ACGT-"
+_CODE = np.full(256, 4, dtype=np.int64)
+for _i, _b in enumerate("ACGT"):
+    _CODE[ord(_b)] = _i
+
+
+class AdaptiveConsensusAligner:
+    """Consensus that consumes reads incrementally and stops once it is confident.
+
+    Behavior:
+    - Build a reference from the first `min_reads` reads (star consensus, so
+      bases missing from individual reads are restored)
+    - Align further reads one at a time to the reference and accumulate
+      per-column votes (A/C/G/T/gap)
+    - Stop when every column's vote margin (top count minus runner-up) is at
+      least `margin`, or when `max_reads` reads have been used
+    - If the consensus of the reads used so far differs from the reference,
+      re-center on it, recount and continue until it is stable, repeats an
+      earlier reference (the consensus can oscillate) or after `max_iter`
+      passes
+    - Reads beyond the stopping point are never aligned (nor consumed from a
+      lazy iterable)
+
+    The number of reads used per call to `align` (ie. per strand when the
+    pipeline groups reads) is appended to `reads_used`; the final minimum
+    column margin of the last strand is kept in `last_margin`.
+    """
+
+    def __init__(self, margin: int = 5, min_reads: int = 5, max_reads: int | None = None, max_iter: int = 4):
+        assert margin >= 1 and min_reads >= 1 and max_iter >= 1
+        self.margin = margin
+        self.min_reads = min_reads
+        self.max_reads = max_reads
+        self.max_iter = max_iter
+        self.reads_used: List[int] = []
+        self.last_margin = 0
+
+    def _votes(self, ref: str, read: str) -> np.ndarray:
+        """Symbol code per reference column for one read (4 = gap)."""
+        a_ref, a_r = _global_align(ref, read)
+        ref_cols = np.frombuffer(a_ref.encode("ascii"), dtype=np.uint8) != ord("-")
+        return _CODE[np.frombuffer(a_r.encode("ascii"), dtype=np.uint8)[ref_cols]]
+
+    def _count(self, ref: str, reads: List[str]) -> np.ndarray:
+        counts = np.zeros((len(ref), 5), dtype=np.int64)
+        cols = np.arange(len(ref))
+        for r in reads:
+            np.add.at(counts, (cols, self._votes(ref, r)), 1)
+        return counts
+
+    @staticmethod
+    def _min_margin(counts: np.ndarray) -> int:
+        if counts.size == 0:
+            return 0
+        top2 = np.sort(counts, axis=1)[:, -2:]
+        return int((top2[:, 1] - top2[:, 0]).min())
+
+    def align(self, reads: Iterable[str]) -> Iterable[str]:
+        it = map(as_str, reads)
+        first: List[str] = []
+        for r in it:
+            if r:
+                first.append(r)
+            if len(first) >= self.min_reads:
+                break
+        if not first:
+            return []
+
+        used_reads = list(first)
+        ref = _star_consensus(max(first, key=len), first) or max(first, key=len)
+        counts = self._count(ref, used_reads)
+        seen = {ref}
+
+        for _ in range(self.max_iter):
+            margin = self._min_margin(counts)
+            while margin < self.margin:
+                if self.max_reads is not None and len(used_reads) >= self.max_reads:
+                    break
+                r = next(it, None)
+                if r is None:
+                    break
+                if not r:
+                    continue
+                used_reads.append(r)
+                np.add.at(counts, (np.arange(len(ref)), self._votes(ref, r)), 1)
+                margin = self._min_margin(counts)
+
+            # re-center when the votes moved away from the reference (eg. it
+            # lost bases); recount the reads used so far and keep going
+            consensus = _star_consensus(ref, used_reads)
+            if not consensus or consensus in seen:
+                break
+            ref = consensus
+            seen.add(ref)
+            counts = self._count(ref, used_reads)
+            margin = self._min_margin(counts)
+
+        used = len(used_reads)
+        self.reads_used.append(used)
+        self.last_margin = margin
+        return [ref]
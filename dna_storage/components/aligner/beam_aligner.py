@@ -0,0 +1,205 @@
+from collections import Counter
+from math import ceil
+from typing import Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+from dna_storage.utils.packed import as_str
+
+# ASCII -> base code; anything that is not A/C/G/T becomes 4 and never matches
+_BASES = "ACGT"
+_CODE = np.full(256, 4, dtype=np.int8)
+for _i, _b in enumerate(_BASES):
+    _CODE[ord(_b)] = _i
+
+
+def _encode_reads(reads: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """Pack reads into a (reads, max_len) code array padded with 4, plus lengths."""
+    lens = np.array([len(r) for r in reads], dtype=np.int64)
+    arr = np.full((len(reads), max(int(lens.max()), 1)), 4, dtype=np.int8)
+    for i, r in enumerate(reads):
+        arr[i, : len(r)] = _CODE[np.frombuffer(r.encode("ascii", "replace"), dtype=np.uint8)]
+    return arr, lens
+
+
+def _kmer_graph(reads: Sequence[str], k: int) -> Counter:
+    """de Bruijn graph as k-mer multiplicities: edge (k-1)-mer -> next base."""
+    counts: Counter = Counter()
+    for r in reads:
+        for i in range(len(r) - k + 1):
+            counts[r[i : i + k]] += 1
+    return counts
+
+
+class BeamSearchAligner:
+    """Trace reconstruction by bidirectional beam search in a de Bruijn graph.
+
+    Behavior:
+    - Build a k-mer de Bruijn graph from the strand's reads; only extensions
+      along edges seen in at least `min_kmer_frac` of the reads are explored
+      (all four bases when the context has no such edge)
+    - Score hypotheses with a Markov model of the deletion/substitution
+      channel: for every read a forward recursion tracks the probability of
+      having emitted each read prefix, so a hypothesis' score is the joint
+      likelihood of all read prefixes
+    - Run the search forward on the reads and backward on the reversed reads,
+      then merge the reliable halves (forward start, backward end) and keep
+      the candidate with the highest full likelihood
+    - Channel parameters adapt to the reads: p_del from the length deficit,
+      p_sub re-estimated from full-length reads after the forward pass
+
+    Parameters:
+    - beam_width: hypotheses kept per step (accuracy vs throughput)
+    - kmer: de Bruijn k-mer size
+    - length: target strand length in bases; if None it is chosen by maximum
+      likelihood between the longest read and `max_extra` bases beyond it
+    - sub_p / del_p: fixed channel rates (None = estimate from the reads)
+    - max_reads: reads used per strand (first N), bounding the cost
+    """
+
+    def __init__(
+        self,
+        beam_width: int = 8,
+        kmer: int = 6,
+        length: int | None = None,
+        sub_p: float | None = None,
+        del_p: float | None = None,
+        min_kmer_frac: float = 0.1,
+        max_reads: int | None = 64,
+        max_extra: int = 8,
+    ):
+        assert beam_width >= 1 and kmer >= 2
+        self.beam_width = beam_width
+        self.kmer = kmer
+        self.length = length
+        self.sub_p = sub_p
+        self.del_p = del_p
+        self.min_kmer_frac = min_kmer_frac
+        self.max_reads = max_reads
+        self.max_extra = max_extra
+
+    # --- channel model -------------------------------------------------
+    # The forward recursion runs in the probability domain; each (hypothesis,
+    # read) row is rescaled to sum to one after every step and the scale is
+    # accumulated in log space, so no per-element logs are needed.
+    @staticmethod
+    def _model(sub_p: float, del_p: float) -> Tuple[float, float, float]:
+        sub_p = min(max(sub_p, 1e-4), 0.5)
+        del_p = min(max(del_p, 1e-4), 0.5)
+        return del_p, (1 - del_p) * (1 - sub_p), (1 - del_p) * sub_p / 3
+
+    def _likelihood(self, seq: str, codes: np.ndarray, lens: np.ndarray, model) -> float:
+        """log P(all reads | seq) under the channel model."""
+        p_del, p_match, p_sub = model
+        n, lmax = codes.shape
+        f = np.zeros((n, lmax + 1))
+        f[:, 0] = 1.0
+        logscale = np.zeros(n)
+        for ch in seq:
+            emit = np.where(codes == _BASES.index(ch), p_match, p_sub)
+            new = f * p_del
+            new[:, 1:] += f[:, :-1] * emit
+            total = new.sum(axis=1)
+            f = new / total[:, None]
+            logscale += np.log(total)
+        with np.errstate(divide="ignore"):
+            return float((np.log(f[np.arange(n), lens]) + logscale).sum())
+
+    # --- beam search ---------------------------------------------------
+    def _search(self, reads: Sequence[str], lo: int, hi: int, model) -> str:
+        """Best hypothesis with length in [lo, hi] (by full likelihood)."""
+        p_del, p_match, p_sub = model
+        codes, lens = _encode_reads(reads)
+        n, lmax = codes.shape
+        valid = (np.arange(lmax + 1)[None, :] <= lens[:, None]).astype(float)
+        emit = np.stack([np.where(codes == b, p_match, p_sub) for b in range(4)]) * valid[None, :, 1:]
+
+        graph = _kmer_graph(reads, self.kmer)
+        min_count = max(1, ceil(self.min_kmer_frac * n))
+        ctx_len = self.kmer - 1
+
+        seqs = [""]
+        f = np.zeros((1, n, lmax + 1))
+        f[0, :, 0] = 1.0
+        logscale = np.zeros((1, n))
+        best = (-np.inf, "")
+        rows = np.arange(n)
+
+        for i in range(hi):
+            new = np.empty((len(seqs), 4, n, lmax + 1))
+            new[...] = f[:, None] * p_del
+            new[..., 1:] += f[:, None, :, :-1] * emit[None]
+            totals = new.sum(axis=-1)
+            with np.errstate(divide="ignore"):
+                scores = (np.log(totals) + logscale[:, None]).sum(axis=-1)
+
+            # restrict extensions to well-supported de Bruijn edges
+            if i >= ctx_len:
+                for h, sq in enumerate(seqs):
+                    ctx = sq[-ctx_len:]
+                    allowed = np.array([graph[ctx + b] >= min_count for b in _BASES])
+                    if allowed.any():
+                        scores[h, ~allowed] = -np.inf
+
+            flat = np.argsort(scores, axis=None)[::-1][: self.beam_width]
+            flat = flat[np.isfinite(scores.ravel()[flat])]
+            if flat.size == 0:
+                break
+            hs, bs = np.unravel_index(flat, scores.shape)
+            seqs = [seqs[h] + _BASES[b] for h, b in zip(hs, bs)]
+            f = new[hs, bs] / totals[hs, bs][..., None]
+            logscale = logscale[hs] + np.log(totals[hs, bs])
+
+            if i + 1 >= lo:
+                with np.errstate(divide="ignore"):
+                    complete = (np.log(f[:, rows, lens]) + logscale).sum(axis=1)
+                top = int(complete.argmax())
+                if complete[top] > best[0]:
+                    best = (float(complete[top]), seqs[top])
+
+        return best[1] if best[1] else seqs[0]
+
+    def reconstruct(self, reads: Iterable[str]) -> str:
+        """Return the reconstructed strand for a cluster of reads."""
+        reads = [as_str(r) for r in reads if r]
+        if not reads:
+            return ""
+        if self.max_reads is not None:
+            reads = reads[: self.max_reads]
+
+        codes, lens = _encode_reads(reads)
+        mean_len = float(lens.mean())
+        longest = int(lens.max())
+        sub_p = self.sub_p if self.sub_p is not None else 0.01
+
+        # forward pass; target length fixed or chosen by likelihood
+        if self.length is not None:
+            lo = hi = self.length
+        else:
+            lo, hi = longest, longest + self.max_extra
+        del_p = self.del_p if self.del_p is not None else 1 - mean_len / max(lo, 1)
+        forward = self._search(reads, lo, hi, self._model(sub_p, del_p))
+        length = len(forward)
+
+        # adapt the channel model to the chosen length before going backward
+        if self.del_p is None:
+            del_p = 1 - mean_len / max(length, 1)
+        if self.sub_p is None:
+            full = [r for r in reads if len(r) == length]
+            if full:
+                mism = sum(a != b for r in full for a, b in zip(r, forward))
+                sub_p = mism / (len(full) * length)
+        model = self._model(sub_p, del_p)
+
+        backward = self._search([r[::-1] for r in reads], length, length, model)[::-1]
+
+        half = length // 2
+        merged = forward[:half] + backward[half:]
+        candidates = {forward, backward, merged}
+        return max(candidates, key=lambda s: self._likelihood(s, codes, lens, model))
+
+    def align(self, reads: Iterable[str]) -> Iterable[str]:
+        reads = list(reads)
+        if not reads:
+            return []
+        return [self.reconstruct(reads)]
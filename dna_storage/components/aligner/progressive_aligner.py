@@ -0,0 +1,78 @@
+from collections import Counter
+from typing import Dict, Iterable, List, Tuple
+
+from dna_storage.utils.packed import as_str
+
+from .simple_aligner import _global_align
+
+
+def _star_consensus(ref: str, reads: List[str]) -> str:
+    """Align every read to `ref` and vote per reference column and insertion slot.
+
+    Reference columns keep the majority symbol, where a gap may win (the
+    reference base is dropped). Bases that reads insert after reference
+    position p are collected in slots (p, offset) and kept when more than
+    half of the reads carry one there.
+    """
+    columns: List[Counter] = [Counter() for _ in ref]
+    inserts: Dict[Tuple[int, int], Counter] = {}
+
+    for r in reads:
+        a_ref, a_r = _global_align(ref, r)
+        pos = -1
+        offset = 0
+        for ca, cr in zip(a_ref, a_r):
+            if ca != "-":
+                pos += 1
+                offset = 0
+                columns[pos][cr] += 1
+            else:
+                inserts.setdefault((pos, offset), Counter())[cr] += 1
+                offset += 1
+
+    half = len(reads) / 2
+    out: List[str] = []
+    for pos in range(-1, len(ref)):
+        if pos >= 0:
+            best = columns[pos].most_common(1)[0][0]
+            if best != "-":
+                out.append(best)
+        offset = 0
+        while (pos, offset) in inserts and sum(inserts[(pos, offset)].values()) > half:
+            out.append(inserts[(pos, offset)].most_common(1)[0][0])
+            offset += 1
+    return "".join(out)
+
+
+class ProgressiveAligner:
+    """Iterative star alignment with a re-centered reference.
+
+    Behavior:
+    - First pass: align all reads to the longest read (like SimpleAligner)
+      and build a consensus that can also re-insert bases the reference lost
+    - Re-align every read against that consensus and vote again
+    - Stop when the consensus no longer changes or after `max_iter` passes
+
+    The number of passes used for the last strand is kept in `last_iterations`.
+    """
+
+    def __init__(self, max_iter: int = 4):
+        assert max_iter >= 1
+        self.max_iter = max_iter
+        self.last_iterations = 0
+
+    def align(self, reads: Iterable[str]) -> Iterable[str]:
+        reads = [as_str(r) for r in reads if r]
+        if not reads:
+            return []
+
+        ref = max(reads, key=len)
+        self.last_iterations = 0
+        for _ in range(self.max_iter):
+            self.last_iterations += 1
+            cons = _star_consensus(ref, reads)
+            if cons == ref:
+                # consensus is stable
+                break
+            ref = cons
+        return [ref]
@@ -1,22 +1,32 @@
 from typing import Iterable, List
 
+import numpy as np
+
+from dna_storage.utils.packed import as_str
+from dna_storage.utils.reads import QualityRead, base_weights, column_posteriors, prob_to_phred
+
+_CODE = {"A": 0, "C": 1, "G": 2, "T": 3}
+
 
 def _global_align(a: str, b: str, match=1, mismatch=0, gap=-1):
     # simple Needleman-Wunsch global alignment returning aligned a', b'
     la, lb = len(a), len(b)
-    # score matrix
-    dp = [[0] * (lb + 1) for _ in range(la + 1)]
+    # score matrix, filled one row at a time with NumPy: the diagonal and
+    # vertical moves are element-wise, and the horizontal (gap) move
+    # dp[i][j] = max(dp[i][j], dp[i][j-1] + gap) is a running maximum of
+    # dp[i][j] - gap * j, shifted back by gap * j
+    a_codes = np.frombuffer(a.encode(), dtype=np.uint8)
+    b_codes = np.frombuffer(b.encode(), dtype=np.uint8)
+    j_gap = gap * np.arange(lb + 1)
+    dp_arr = np.empty((la + 1, lb + 1), dtype=np.int64)
+    dp_arr[0] = j_gap
     for i in range(1, la + 1):
-        dp[i][0] = dp[i - 1][0] + gap
-    for j in range(1, lb + 1):
-        dp[0][j] = dp[0][j - 1] + gap
-
-    for i in range(1, la + 1):
-        for j in range(1, lb + 1):
-            score_sub = dp[i - 1][j - 1] + (match if a[i - 1] == b[j - 1] else mismatch)
-            score_del = dp[i - 1][j] + gap
-            score_ins = dp[i][j - 1] + gap
-            dp[i][j] = max(score_sub, score_del, score_ins)
+        prev = dp_arr[i - 1]
+        row = dp_arr[i]
+        row[0] = prev[0] + gap
+        np.maximum(prev[:-1] + np.where(b_codes == a_codes[i - 1], match, mismatch), prev[1:] + gap, out=row[1:])
+        row[:] = np.maximum.accumulate(row - j_gap) + j_gap
+    dp = dp_arr.tolist()
 
     # traceback
     i, j = la, lb
@@ -46,6 +56,26 @@ def _global_align(a: str, b: str, match=1, mismatch=0, gap=-1):
     return "".join(reversed(a_al)), "".join(reversed(b_al))
 
 
+def _aligned_weights(read: str, aligned: str) -> List[float]:
+    """Vote weight per column of `aligned` (the alignment row of `read`).
+
+    Reads without qualities vote 1 per base; gaps get 0.
+    """
+    probs = base_weights(read)
+    if probs is None:
+        return [0 if c == "-" else 1 for c in aligned]
+    probs = probs.tolist()
+    out: List[float] = []
+    pos = 0
+    for c in aligned:
+        if c == "-":
+            out.append(0)
+        else:
+            out.append(probs[pos])
+            pos += 1
+    return out
+
+
 class SimpleAligner:
     """Align reads to the longest read then create a simple column-majority consensus.
 
@@ -53,14 +83,24 @@ class SimpleAligner:
     - Choose the longest read as reference
     - Align every read to the reference using a simple global aligner
     - Build consensus by picking the most common non-gap base per column
+    - Reads carrying Phred qualities (eg. `QualityRead` from FastqReader)
+      vote with the probability that each base is correct instead of 1
     - Return a single consensus string (or empty if no reads)
+
+    With posteriors=True the consensus is a `QualityRead` whose Phred scores
+    are the posterior probability of each called base given the column's
+    votes (see utils.reads.column_posteriors). Bases of reads without
+    qualities count as correct with probability 1 - error_rate. Soft
+    decoders (eg. SystematicReedSolomonDecoder(soft=True)) use them to
+    erase the least reliable symbols.
     """
 
-    def __init__(self):
-        pass
+    def __init__(self, posteriors: bool = False, error_rate: float = 0.01):
+        self.posteriors = posteriors
+        self.error_rate = error_rate
 
     def align(self, reads: Iterable[str]) -> Iterable[str]:
-        reads = list(reads)
+        reads = [as_str(r) for r in reads]
         if not reads:
             return []
 
@@ -68,6 +108,8 @@ class SimpleAligner:
         ref = max(reads, key=len)
 
         aligned_columns: List[List[str]] = []
+        # vote weight per entry of aligned_columns (1 for reads without qualities)
+        column_weights: List[List[float]] = []
 
         # Keep track of how many reads have been merged so far so we can
         # pad columns when a new alignment is longer/shorter than earlier ones.
@@ -77,32 +119,36 @@ class SimpleAligner:
         for r in reads:
             a_ref, a_r = _global_align(ref, r)
             L = len(a_ref)
+            weights = _aligned_weights(r, a_r)
 
             # If aligned_columns shorter than this alignment, extend and pad
             if len(aligned_columns) < L:
                 # extend with empty columns and pad them with '-' for previous reads
                 for _ in range(len(aligned_columns), L):
                     aligned_columns.append(["-"] * reads_seen)
+                    column_weights.append([0] * reads_seen)
 
             # Now for each existing column index, append the corresponding base or a gap
             for idx in range(len(aligned_columns)):
                 if idx < L:
                     aligned_columns[idx].append(a_r[idx])
+                    column_weights[idx].append(weights[idx])
                 else:
                     # This read did not produce this column -> gap
                     aligned_columns[idx].append("-")
+                    column_weights[idx].append(0)
 
             reads_seen += 1
 
         # build consensus per column
         cons = []
-        for col in aligned_columns:
+        for col, col_weights in zip(aligned_columns, column_weights):
             # count non-gap bases
             counts = {}
-            for c in col:
+            for c, w in zip(col, col_weights):
                 if c == "-":
                     continue
-                counts[c] = counts.get(c, 0) + 1
+                counts[c] = counts.get(c, 0) + w
             if not counts:
                 # if all gaps, choose gap
                 cons.append("-")
@@ -113,4 +159,19 @@ class SimpleAligner:
 
         # compress gaps out of consensus (simple strategy)
         consensus = "".join([c for c in cons if c != "-"])
+        if self.posteriors:
+            return [self._with_posteriors(consensus, cons, aligned_columns, column_weights)]
         return [consensus]
+
+    def _with_posteriors(self, consensus: str, cons: List[str], columns: List[List[str]], weights: List[List[float]]):
+        kept = [i for i, c in enumerate(cons) if c != "-"]
+        if not kept:
+            return QualityRead(consensus)
+        codes = np.array([[_CODE.get(c, 4) for c in columns[i]] for i in kept], dtype=np.uint8)
+        probs = np.array([weights[i] for i in kept], dtype=np.float64)
+        # vote weight 1 means the read has no qualities
+        probs[probs >= 1.0] = 1.0 - self.error_rate
+        # a called non-ACGT symbol (eg. N) gets posterior 0
+        post = np.hstack([column_posteriors(codes, probs), np.zeros((len(kept), 1))])
+        called = np.array([_CODE.get(c, 4) for c in consensus])
+        return QualityRead(consensus, prob_to_phred(post[np.arange(len(called)), called]))
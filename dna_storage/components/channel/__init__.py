@@ -1,4 +1,17 @@
-from .ids_channel import IDSChannel
-from .soup_duplicator import SoupDuplicator
+from dna_storage.utils.lazy import lazy_exports
 
-__all__ = ["IDSChannel", "SoupDuplicator"]
+__all__ = ["IDSChannel", "SoupDuplicator", "RSInnerChannel", "BatchRSInnerChannel", "FastqReader",
+           "PrimerAttacher", "PrimerTrimmer", "StrandFlipper", "ChainedChannel", "FusedDuplicateIDS"]
+
+# submodules are imported on first access (PEP 562)
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".ids_channel": ["IDSChannel"],
+        ".soup_duplicator": ["SoupDuplicator"],
+        ".rs_inner_channel": ["RSInnerChannel", "BatchRSInnerChannel"],
+        ".fastq_reader": ["FastqReader"],
+        ".primers": ["PrimerAttacher", "PrimerTrimmer", "StrandFlipper"],
+        ".chained": ["ChainedChannel", "FusedDuplicateIDS"],
+    },
+)
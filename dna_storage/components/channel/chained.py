@@ -0,0 +1,112 @@
+from typing import Iterable, Iterator, List, Sequence
+
+import numpy as np
+
+from dna_storage.components.channel.ids_channel import IDSChannel
+from dna_storage.components.channel.soup_duplicator import SoupDuplicator
+from dna_storage.utils.packed import PackedSequence, seq_codes
+
+_BASE_ASCII = np.frombuffer(b"ACGT", dtype=np.uint8)
+
+
+class FusedDuplicateIDS:
+    """SoupDuplicator followed by IDSChannel as one vectorized pass.
+
+    Equal-length strands of a batch are stacked, repeated `copies` times and
+    mutated with whole-array draws (deletion mask, substitution mask and
+    offsets) instead of one Python `random` call per base; the reads are cut
+    out of a single joined buffer, so no per-copy intermediate list is built.
+    Output order matches the unfused chain (all copies of strand 0, then
+    strand 1, ...) and the per-base error model is the same, but the random
+    stream is numpy's, so seeded runs differ from the unfused chain.
+    Strands must be plain ACGT; PackedSequence strands come out as
+    PackedSequence reads.
+    """
+
+    def __init__(self, copies: int, sub_p: float, del_p: float, seed: int | None = None, batch_size: int = 1024):
+        self.copies = copies
+        self.sub_p = sub_p
+        self.del_p = del_p
+        self.batch_size = batch_size
+        self._rng = np.random.default_rng(seed)
+
+    def _mutate(self, codes: np.ndarray) -> List[np.ndarray]:
+        # codes: (B, L) strands -> B * copies reads of base codes
+        reads = np.repeat(codes, self.copies, axis=0)
+        rng = self._rng
+        sub = rng.random(reads.shape) < self.sub_p
+        # a substituted base moves to one of the 3 other bases
+        reads = np.where(sub, (reads + rng.integers(1, 4, reads.shape)) % 4, reads).astype(np.uint8)
+        keep = rng.random(reads.shape) >= self.del_p
+        flat = reads[keep]
+        ends = np.cumsum(keep.sum(axis=1))
+        return np.split(flat, ends[:-1])
+
+    def _batch(self, strands: Sequence) -> Iterator:
+        packed = [isinstance(s, PackedSequence) for s in strands]
+        out: List = [None] * len(strands)
+        by_len: dict = {}
+        for i, s in enumerate(strands):
+            by_len.setdefault(len(s), []).append(i)
+        for ids in by_len.values():
+            if len(strands[ids[0]]) == 0:
+                rows = [np.zeros(0, dtype=np.uint8)] * (len(ids) * self.copies)
+            else:
+                rows = self._mutate(np.stack([seq_codes(strands[i]) for i in ids]))
+            for j, i in enumerate(ids):
+                out[i] = rows[j * self.copies : (j + 1) * self.copies]
+        for i, rows in enumerate(out):
+            if packed[i]:
+                yield from (PackedSequence.from_codes(r) for r in rows)
+            else:
+                raw = _BASE_ASCII[np.concatenate(rows)].tobytes().decode("ascii")
+                pos = 0
+                for r in rows:
+                    yield raw[pos : pos + len(r)]
+                    pos += len(r)
+
+    def transmit(self, strands: Iterable[str]) -> Iterable[str]:
+        batch: List = []
+        for s in strands:
+            batch.append(s)
+            if len(batch) >= self.batch_size:
+                yield from self._batch(batch)
+                batch = []
+        if batch:
+            yield from self._batch(batch)
+
+
+def fuse_layers(layers: Sequence) -> List:
+    """Replace each SoupDuplicator directly followed by an IDSChannel with a FusedDuplicateIDS."""
+    out: List = []
+    i = 0
+    while i < len(layers):
+        layer = layers[i]
+        nxt = layers[i + 1] if i + 1 < len(layers) else None
+        if type(layer) is SoupDuplicator and type(nxt) is IDSChannel:
+            out.append(FusedDuplicateIDS(layer.copies, nxt.sub_p, nxt.del_p, seed=nxt.seed))
+            i += 2
+        else:
+            out.append(layer)
+            i += 1
+    return out
+
+
+class ChainedChannel:
+    """Channel made of several layers applied in order (eg. duplicate, then mutate).
+
+    Layers are chained as generators, so reads stream through without
+    intermediate lists. With fuse=True adjacent stages that have a batched
+    implementation are merged (see `fuse_layers`).
+    """
+
+    def __init__(self, *layers, fuse: bool = False):
+        self.layers = list(layers)
+        self.fuse = fuse
+        self._stages = fuse_layers(self.layers) if fuse else self.layers
+
+    def transmit(self, strands: Iterable[str]) -> Iterable[str]:
+        out = strands
+        for layer in self._stages:
+            out = layer.transmit(out)
+        return out
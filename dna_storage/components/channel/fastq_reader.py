@@ -0,0 +1,187 @@
+import gzip
+from typing import IO, Iterable, Iterator, List, Tuple
+
+import numpy as np
+
+from dna_storage.utils.reads import QualityRead
+
+_GZIP_MAGIC = b"\x1f\x8b"
+
+Record = Tuple[str, str, np.ndarray | None]
+
+
+def _open(path: str) -> IO[bytes]:
+    """Open a (possibly gzip-compressed) file for binary reading."""
+    with open(path, "rb") as fh:
+        magic = fh.read(2)
+    if magic == _GZIP_MAGIC:
+        return gzip.open(path, "rb")
+    return open(path, "rb")
+
+
+class FastqReader:
+    """Stream reads from a FASTQ or FASTA file (optionally gzip-compressed).
+
+    Used in place of a simulated channel so the decoding half of a pipeline
+    can run on real sequencer output: `transmit` ignores the strands it is
+    given and yields the reads from the file.
+
+    Behavior:
+    - Format is detected from the first byte ('@' FASTQ, '>' FASTA) unless
+      `fmt` is given; gzip is detected from the file's magic bytes
+    - The file is read in blocks of `chunk_size` bytes and every block is
+      split into records with bytes-level operations; only complete records
+      are parsed, the remainder is carried over to the next block, so
+      memory stays bounded regardless of the file size
+    - FASTQ reads are yielded as `QualityRead` (a str with a `quality`
+      array of Phred scores) so quality-aware aligners can weight their
+      votes; FASTA reads (and FASTQ with `with_quality=False`) are plain str
+    - Sequences are upper-cased; multi-line FASTA records are joined
+
+    Parameters:
+    - path: FASTQ/FASTA file, plain or .gz
+    - fmt: "fastq", "fasta" or None (detect)
+    - chunk_size: bytes read per block
+    - phred_offset: ASCII offset of quality characters (33 for Sanger/Illumina 1.8+)
+    - max_reads: stop after this many reads (None = whole file)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        fmt: str | None = None,
+        chunk_size: int = 1 << 22,
+        phred_offset: int = 33,
+        with_quality: bool = True,
+        max_reads: int | None = None,
+    ):
+        assert fmt in (None, "fastq", "fasta"), "fmt must be 'fastq', 'fasta' or None"
+        assert chunk_size > 0
+        self.path = path
+        self.fmt = fmt
+        self.chunk_size = chunk_size
+        self.phred_offset = phred_offset
+        self.with_quality = with_quality
+        self.max_reads = max_reads
+
+    def _detect(self, first: bytes) -> str:
+        head = first.lstrip()[:1]
+        if head == b"@":
+            return "fastq"
+        if head == b">":
+            return "fasta"
+        raise ValueError(f"{self.path}: not a FASTQ/FASTA file (starts with {head!r})")
+
+    def _blocks(self, fh: IO[bytes]) -> Iterator[Tuple[bytes, bool]]:
+        """Yield (block, is_last); line endings normalized to '\\n'."""
+        block = fh.read(self.chunk_size)
+        while block:
+            nxt = fh.read(self.chunk_size)
+            if b"\r" in block:
+                block = block.replace(b"\r", b"")
+            yield block, not nxt
+            block = nxt
+
+    # --- FASTQ ---------------------------------------------------------
+    def _parse_fastq(self, buf: bytes, last: bool) -> Tuple[List[Record], bytes]:
+        if last and not buf.endswith(b"\n"):
+            buf += b"\n"
+        lines = buf.split(b"\n")
+        # lines[-1] is the (possibly empty) unterminated tail
+        n_rec = (len(lines) - 1) // 4
+        rest = b"\n".join(lines[4 * n_rec :])
+        if last and rest.strip():
+            raise ValueError(f"{self.path}: truncated FASTQ record at end of file")
+        if n_rec == 0:
+            return [], rest
+
+        headers = lines[0 : 4 * n_rec : 4]
+        seq_lines = lines[1 : 4 * n_rec : 4]
+        qual_lines = lines[3 : 4 * n_rec : 4]
+
+        # record structure, checked on joined buffers instead of per line
+        joined = b"\n".join(headers)
+        plus = b"\n".join(lines[2 : 4 * n_rec : 4])
+        if not (joined.startswith(b"@") and joined.count(b"\n@") == n_rec - 1):
+            raise ValueError(f"{self.path}: malformed FASTQ header")
+        if not (plus.startswith(b"+") and plus.count(b"\n+") == n_rec - 1):
+            raise ValueError(f"{self.path}: malformed FASTQ separator line")
+
+        names = joined.decode("ascii", "replace").split("\n")
+        seqs = b"\n".join(seq_lines).decode("ascii", "replace").upper().split("\n")
+
+        if not self.with_quality:
+            return [(name[1:], seq, None) for name, seq in zip(names, seqs)], rest
+
+        seq_lens = np.fromiter(map(len, seq_lines), dtype=np.int64, count=n_rec)
+        qual_lens = np.fromiter(map(len, qual_lines), dtype=np.int64, count=n_rec)
+        if not np.array_equal(seq_lens, qual_lens):
+            raise ValueError(f"{self.path}: FASTQ quality length differs from sequence length")
+        raw = np.frombuffer(b"".join(qual_lines), dtype=np.uint8)
+        # checked before subtracting: lower bytes would wrap around in uint8
+        if raw.size and raw.min() < self.phred_offset:
+            raise ValueError(
+                f"{self.path}: FASTQ quality character {chr(raw.min())!r} below phred_offset {self.phred_offset}"
+            )
+        quals = raw - np.uint8(self.phred_offset)
+        ends = np.cumsum(seq_lens)
+        starts = ends - seq_lens
+        records = [
+            (name[1:], seq, quals[s:e])
+            for name, seq, s, e in zip(names, seqs, starts.tolist(), ends.tolist())
+        ]
+        return records, rest
+
+    # --- FASTA ---------------------------------------------------------
+    def _parse_fasta(self, buf: bytes, last: bool) -> Tuple[List[Record], bytes]:
+        parts = buf.split(b"\n>")
+        if last:
+            rest = b""
+        elif len(parts) > 1:
+            # the last record may continue in the next block
+            rest = b">" + parts.pop()
+        else:
+            return [], buf
+        records: List[Record] = []
+        for i, part in enumerate(parts):
+            if i == 0:
+                part = part.lstrip()
+                if not part:
+                    continue
+                if not part.startswith(b">"):
+                    raise ValueError(f"{self.path}: malformed FASTA record")
+                part = part[1:]
+            header, _, seq = part.partition(b"\n")
+            seq = seq.replace(b"\n", b"").decode("ascii", "replace").upper()
+            records.append((header.decode("ascii", "replace"), seq, None))
+        return records, rest
+
+    def read_records(self) -> Iterator[Record]:
+        """Yield (name, sequence, quality) tuples; quality is None for FASTA."""
+        count = 0
+        with _open(self.path) as fh:
+            fmt = self.fmt
+            carry = b""
+            for block, last in self._blocks(fh):
+                buf = carry + block
+                if fmt is None:
+                    if not buf.strip():
+                        carry = buf
+                        continue
+                    fmt = self._detect(buf)
+                parse = self._parse_fastq if fmt == "fastq" else self._parse_fasta
+                records, carry = parse(buf, last)
+                for rec in records:
+                    if self.max_reads is not None and count >= self.max_reads:
+                        return
+                    count += 1
+                    yield rec
+
+    def reads(self) -> Iterator[str]:
+        """Yield reads; FASTQ reads carry their qualities (see class docstring)."""
+        for _, seq, qual in self.read_records():
+            yield seq if qual is None else QualityRead(seq, qual)
+
+    def transmit(self, strands: Iterable[str] | None = None) -> Iterable[str]:
+        # the reads were produced by a real sequencer; strands are not used
+        return self.reads()
@@ -1,16 +1,21 @@
 import random
-from typing import Iterable
+from typing import Iterable, List
+
+from dna_storage.utils.packed import PackedSequence
 
 
 class IDSChannel:
     """Basic substitution/insertion/deletion (IDS) channel for DNA reads.
 
     For now it supports substitutions and deletions (no insertions for simplicity).
+    PackedSequence strands are mutated on their base codes and come out as
+    PackedSequence reads (same random draws as for the string).
     """
 
     def __init__(self, sub_p: float = 0.02, del_p: float = 0.01, seed: int | None = None):
         self.sub_p = sub_p
         self.del_p = del_p
+        self.seed = seed
         if seed is not None:
             random.seed(seed)
 
@@ -27,6 +32,20 @@ class IDSChannel:
             out.append(ch)
         return "".join(out)
 
+    def _mutate_codes(self, codes) -> List[int]:
+        # _mutate on base codes 0..3: "ACGT" order, so the choices line up
+        out = []
+        for c in codes.tolist():
+            if random.random() < self.del_p:
+                continue
+            if random.random() < self.sub_p:
+                c = random.choice([b for b in range(4) if b != c])
+            out.append(c)
+        return out
+
     def transmit(self, strands: Iterable[str]) -> Iterable[str]:
         for s in strands:
-            yield self._mutate(s)
+            if isinstance(s, PackedSequence):
+                yield PackedSequence.from_codes(self._mutate_codes(s.codes()))
+            else:
+                yield self._mutate(s)
@@ -0,0 +1,210 @@
+import random
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+import numpy as np
+
+from dna_storage.utils.oligo_utils import reverse_complement
+from dna_storage.utils.packed import PackedSequence, as_str
+from dna_storage.utils.reads import QualityRead
+
+# ASCII -> base code; anything that is not A/C/G/T becomes 4 and never matches
+_CODE = np.full(256, 4, dtype=np.int8)
+for _i, _b in enumerate("ACGT"):
+    _CODE[ord(_b)] = _i
+
+
+def _codes(seq: str) -> np.ndarray:
+    return _CODE[np.frombuffer(seq.encode("ascii", "replace"), dtype=np.uint8)]
+
+
+def _rc(read):
+    """Reverse complement of a str or PackedSequence read."""
+    if isinstance(read, PackedSequence):
+        return read.reverse_complement()
+    return reverse_complement(read)
+
+
+def _windows(reads: List, width: int, from_end: bool = False) -> np.ndarray:
+    """(reads, width) codes of the first `width` bases, padded with 4.
+
+    With from_end, the last `width` bases in reverse order (read from the
+    end), so a tail site can be searched like a head site.
+    """
+    if from_end:
+        heads = [as_str(r[-width:])[::-1] for r in reads]
+    else:
+        heads = [as_str(r[:width]) for r in reads]
+    joined = "".join(h.ljust(width, "N") for h in heads)
+    return _codes(joined).reshape(len(reads), width)
+
+
+def _scan(windows: np.ndarray, primer: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """End of the best primer match and its edit distance in every window row.
+
+    Semi-global alignment: the whole primer is matched against any stretch
+    of the window, counting substitutions, insertions and deletions, so an
+    indel inside the primer does not shift the bases after it out of
+    register. The dynamic program runs one primer base at a time on all
+    rows at once; gaps in the primer (read insertions) are resolved along a
+    row with a running minimum. Ties go to the earliest end.
+    """
+    cols = np.arange(windows.shape[1] + 1, dtype=np.int32)
+    # row 0: the match may start anywhere in the window for free
+    dist = np.zeros((len(windows), len(cols)), dtype=np.int32)
+    for base in primer:
+        nxt = np.empty_like(dist)
+        nxt[:, 0] = dist[:, 0] + 1
+        np.minimum(dist[:, :-1] + (windows != base), dist[:, 1:] + 1, out=nxt[:, 1:])
+        # read insertions: nxt[j] = min over i <= j of nxt[i] + (j - i)
+        dist = np.minimum.accumulate(nxt - cols, axis=1) + cols
+    ends = dist.argmin(axis=1)
+    return ends, dist[np.arange(len(dist)), ends]
+
+
+def _slice_read(read: str, oriented: str, start: int, end: int, flipped: bool) -> str:
+    """oriented[start:end], keeping the qualities of quality-carrying reads."""
+    quality = getattr(read, "quality", None)
+    if quality is None:
+        return oriented[start:end]
+    if flipped:
+        quality = quality[::-1]
+    return QualityRead(oriented[start:end], quality[start:end])
+
+
+class PrimerAttacher:
+    """Add primer sites around every strand (synthesis side).
+
+    A strand s becomes forward + s + reverse_complement(reverse), the usual
+    layout for PCR primers. `overhead` (bases added per strand) is what to
+    reserve in `recommend_rs_parameters`.
+    """
+
+    def __init__(self, forward: str, reverse: str):
+        self.forward = forward
+        self.reverse = reverse
+        self._tail = reverse_complement(reverse)
+
+    @property
+    def overhead(self) -> int:
+        return len(self.forward) + len(self.reverse)
+
+    def transmit(self, strands: Iterable[str]) -> Iterable[str]:
+        for s in strands:
+            yield self.forward + s + self._tail
+
+
+class StrandFlipper:
+    """Reverse-complement each read with probability `p`.
+
+    Simulates sequencing of both strands of the DNA duplex.
+    """
+
+    def __init__(self, p: float = 0.5, seed: int | None = None):
+        self.p = p
+        self._rng = random.Random(seed)
+
+    def transmit(self, strands: Iterable[str]) -> Iterable[str]:
+        for s in strands:
+            yield reverse_complement(s) if self._rng.random() < self.p else s
+
+
+class PrimerTrimmer:
+    """Locate and strip primers, normalize read orientation, drop junk reads.
+
+    Place it after the channel (or after FastqReader) so the aligner and
+    decoder only see payload regions.
+
+    Behavior:
+    - Reads are processed in batches; for every read the forward primer is
+      searched in the first len(forward) + `max_shift` + `max_mismatches`
+      bases by a semi-global edit-distance alignment run on the whole batch
+      at once, so substitutions, insertions and deletions inside the primer
+      all count as `max_mismatches` errors
+    - Reads without a forward primer are tried reverse-complemented (reads
+      from the other strand); reads matching neither orientation are
+      discarded
+    - The reverse primer site is searched the same way in the read's tail;
+      if it is not found the read is kept and its last len(reverse) bases
+      are cut (or it is discarded when `require_reverse` is set)
+    - Quality-carrying reads (`QualityRead`) keep their trimmed qualities;
+      PackedSequence reads stay packed
+
+    Counts for the last `transmit` call are kept in `last_stats`.
+    """
+
+    def __init__(
+        self,
+        forward: str,
+        reverse: str,
+        max_mismatches: int = 2,
+        max_shift: int = 4,
+        require_reverse: bool = False,
+        batch_size: int = 4096,
+    ):
+        assert forward and reverse, "primers must not be empty"
+        assert max_mismatches >= 0 and max_shift >= 0 and batch_size >= 1
+        self.forward = forward
+        self.reverse = reverse
+        self.max_mismatches = max_mismatches
+        self.max_shift = max_shift
+        self.require_reverse = require_reverse
+        self.batch_size = batch_size
+        self._fwd = _codes(forward)
+        self._tail = _codes(reverse_complement(reverse))
+        self.last_stats: Dict[str, int] = {}
+
+    def _orient(self, reads: List[str]) -> Tuple[List[str], np.ndarray, np.ndarray]:
+        """Reads in strand orientation, forward primer end per read, flipped mask.
+
+        Unrecognized reads have an end of -1.
+        """
+        width = len(self._fwd) + self.max_shift + self.max_mismatches
+        end, dist = _scan(_windows(reads, width), self._fwd)
+        ok = dist <= self.max_mismatches
+        ends = np.where(ok, end, -1)
+        flipped = np.zeros(len(reads), dtype=bool)
+
+        retry = np.flatnonzero(~ok)
+        if retry.size:
+            rc = [_rc(reads[i]) for i in retry]
+            end_rc, dist_rc = _scan(_windows(rc, width), self._fwd)
+            hit = dist_rc <= self.max_mismatches
+            ends[retry[hit]] = end_rc[hit]
+            flipped[retry[hit]] = True
+            reads = list(reads)
+            for j in np.flatnonzero(hit):
+                reads[retry[j]] = rc[j]
+        return reads, ends, flipped
+
+    def _trim_batch(self, reads: List[str], stats: Dict[str, int]) -> Iterator[str]:
+        oriented, starts, flipped = self._orient(reads)
+        keep = starts >= 0
+
+        width = len(self._tail) + self.max_shift + self.max_mismatches
+        lens = np.fromiter(map(len, oriented), dtype=np.int64, count=len(oriented))
+        # the tail site is searched from the read's end, reversed
+        end, dist = _scan(_windows(oriented, width, from_end=True), self._tail[::-1])
+        tail_start = lens - end
+        found = (dist <= self.max_mismatches) & (tail_start >= starts)
+        ends = np.where(found, tail_start, lens - len(self._tail))
+        if self.require_reverse:
+            keep &= found
+        keep &= ends >= starts
+
+        stats["reads"] += len(reads)
+        stats["reverse_complemented"] += int((flipped & keep).sum())
+        stats["discarded"] += int((~keep).sum())
+        for i in np.flatnonzero(keep).tolist():
+            yield _slice_read(reads[i], oriented[i], int(starts[i]), int(ends[i]), bool(flipped[i]))
+
+    def transmit(self, reads: Iterable[str]) -> Iterable[str]:
+        stats = {"reads": 0, "reverse_complemented": 0, "discarded": 0}
+        self.last_stats = stats
+        batch: List[str] = []
+        for r in reads:
+            batch.append(r)
+            if len(batch) >= self.batch_size:
+                yield from self._trim_batch(batch, stats)
+                batch = []
+        if batch:
+            yield from self._trim_batch(batch, stats)
@@ -1,8 +1,14 @@
-from typing import Iterable, List
+from collections import Counter
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
 from dna_storage.components.mapper.rotating import RotatingMapper
 from dna_storage.components.encoder.reed_solomon import ReedSolomonEncoder
 from dna_storage.components.decoder.reed_solomon import ReedSolomonDecoder
-from dna_storage.utils.gf4 import from_gf4_symbols, to_gf4_symbols
+from dna_storage.utils.gf4 import from_gf4_symbols, to_gf4_symbols, pack_gf4, unpack_gf4
+
+_ACGT = set("ACGT")
 
 
 class RSInnerChannel:
@@ -46,15 +52,168 @@ class RSInnerChannel:
         # send encoded strands through inner channel
         reads = list(self.inner.transmit(encoded))
 
-        # decode reads (RS decoder returns bytes concatenated for successfully decoded reads)
-        # We'll run decode on the read set and then split the result into k-byte blocks
+        # decode reads (one k-byte block per read, zero-filled where decoding
+        # failed) and keep the blocks of the reads that decoded
         decoded_bytes = self.rs_dec.decode(reads)
+        ok = self.rs_dec.last_status.ok()
 
         # split into chunks of k bytes and map back to DNA strings
         chunks: List[bytes] = [decoded_bytes[i : i + self.k] for i in range(0, len(decoded_bytes), self.k)]
         out = []
-        for chunk in chunks:
+        for chunk, good in zip(chunks, ok):
+            if not good:
+                continue
             syms = to_gf4_symbols(chunk)
             out.append(self.mapper.map(syms))
 
         return out
+
+
+class BatchRSInnerChannel:
+    """Batch version of RSInnerChannel that keeps every read tied to its strand.
+
+    All strands are encoded as one matrix (DNA -> GF4 -> bytes -> RS -> DNA)
+    and, by default, sent through the inner channel strand by strand, so
+    each read carries the id of the strand it came from whatever the
+    channel drops or duplicates. per_strand=False sends them in one call
+    instead and attributes reads to strands in order; that is only correct
+    for an order-preserving channel returning the same number of reads for
+    every strand (eg. SoupDuplicator + IDSChannel), and a channel that
+    drops reads unevenly can misattribute them without any error. Every
+    read long enough to hold k codeword bytes is then decoded in a single
+    matrix product.
+
+    Like RSInnerChannel's ReedSolomonDecoder, the decode only interpolates
+    from the first k evaluations: it corrects no errors. A substitution in
+    those bytes gives a wrong message, which is why, per strand, the most
+    common decoded message wins and messages whose re-encoding matches a
+    full read are preferred. Results can therefore differ from
+    RSInnerChannel, which returns every read's message, including wrong
+    ones. Strands without any decodable read are reported as failures
+    instead of being dropped, so outputs stay aligned with inputs.
+    """
+
+    def __init__(
+        self,
+        inner_channel: object,
+        n: int,
+        k: int,
+        mapper: RotatingMapper | None = None,
+        per_strand: bool = True,
+    ):
+        assert 1 <= k < n <= 255
+        self.inner = inner_channel
+        self.per_strand = per_strand
+        self.n = n
+        self.k = k
+        self.mapper = mapper or RotatingMapper()
+
+        self.rs_enc = ReedSolomonEncoder(n=n, k=k)
+        self.rs_dec = ReedSolomonDecoder(n=n, k=k, mapper=self.mapper)
+
+    def _encode(self, strands: List[str]) -> List[str]:
+        # batch strands of equal length (usually all of them)
+        encoded: List[str] = [""] * len(strands)
+        by_len: Dict[int, List[int]] = {}
+        for i, s in enumerate(strands):
+            by_len.setdefault(len(s), []).append(i)
+
+        for ids in by_len.values():
+            syms = self.mapper.reverse_batch([strands[i] for i in ids])
+            msgs = pack_gf4(syms)[:, : self.k]
+            if msgs.shape[1] < self.k:
+                msgs = np.pad(msgs, ((0, 0), (0, self.k - msgs.shape[1])))
+            codewords = self.rs_enc.encode_batch(msgs)
+            for i, dna in zip(ids, self.mapper.map_batch(unpack_gf4(codewords))):
+                encoded[i] = dna
+        return encoded
+
+    def transmit_detailed(self, strands: Iterable[str]) -> Dict[str, object]:
+        """Run the inner code and return per-strand results plus per-read bookkeeping.
+
+        Returned keys:
+        - strands: recovered DNA per input strand, None where decoding failed
+        - failed: ids of strands that could not be recovered
+        - read_strand_ids: strand id for every read produced by the inner channel
+        - read_ok: whether each read was long enough (and clean ACGT) to decode
+        - reads_per_strand / decoded_per_strand: counts per strand
+        """
+        strands = list(strands)
+        encoded = self._encode(strands)
+
+        if self.per_strand:
+            reads: List[str] = []
+            read_ids: List[int] = []
+            for sid, dna in enumerate(encoded):
+                for r in self.inner.transmit([dna]):
+                    reads.append(r)
+                    read_ids.append(sid)
+        else:
+            reads = list(self.inner.transmit(encoded))
+            if encoded and len(reads) % len(encoded):
+                raise ValueError(
+                    f"inner channel returned {len(reads)} reads for {len(encoded)} strands; "
+                    "use per_strand=True for channels with a varying number of reads per strand"
+                )
+            copies = len(reads) // len(encoded) if encoded else 0
+            read_ids = np.repeat(np.arange(len(encoded)), copies).tolist()
+        read_ids_arr = np.array(read_ids, dtype=np.int64)
+
+        # every read with at least 4k bases is truncated to exactly the k
+        # message evaluations, giving one equal-length matrix to decode
+        need = 4 * self.k
+        read_ok = np.array([len(r) >= need for r in reads], dtype=bool)
+        for i in np.flatnonzero(read_ok):
+            if not set(reads[i][:need]) <= _ACGT:
+                read_ok[i] = False
+        ok_idx = np.flatnonzero(read_ok)
+
+        votes: List[Counter] = [Counter() for _ in strands]
+        verified: List[Counter] = [Counter() for _ in strands]
+        if ok_idx.size:
+            syms = self.mapper.reverse_batch([reads[i][:need] for i in ok_idx])
+            messages = self.rs_dec.decode_batch(pack_gf4(syms))
+
+            # reads that also carry all parity bytes can be checked: a message
+            # whose re-encoding matches the whole read is almost surely right
+            full = np.array([len(reads[i]) >= 4 * self.n for i in ok_idx], dtype=bool)
+            consistent = np.zeros(ok_idx.size, dtype=bool)
+            full_pos = np.flatnonzero(full)
+            if full_pos.size:
+                full_reads = [reads[ok_idx[j]][: 4 * self.n] for j in full_pos]
+                if all(set(r) <= _ACGT for r in full_reads):
+                    received = pack_gf4(self.mapper.reverse_batch(full_reads))
+                    expected = self.rs_enc.encode_batch(messages[full_pos])
+                    consistent[full_pos] = np.all(received == expected, axis=1)
+
+            for row, i, good in zip(messages, ok_idx, consistent):
+                key = row.tobytes()
+                votes[read_ids[i]][key] += 1
+                if good:
+                    verified[read_ids[i]][key] += 1
+
+        recovered: List[Optional[str]] = []
+        failed: List[int] = []
+        for sid, counter in enumerate(votes):
+            if not counter:
+                recovered.append(None)
+                failed.append(sid)
+                continue
+            # prefer verified messages, fall back to a plain majority
+            msg = (verified[sid] or counter).most_common(1)[0][0]
+            syms = unpack_gf4(msg)[: len(strands[sid])]
+            recovered.append(self.mapper.map_batch(syms[None, :])[0])
+
+        return {
+            "strands": recovered,
+            "failed": failed,
+            "read_strand_ids": read_ids_arr,
+            "read_ok": read_ok,
+            "reads_per_strand": np.bincount(read_ids_arr, minlength=len(strands)),
+            "decoded_per_strand": np.array([sum(c.values()) for c in votes], dtype=np.int64),
+        }
+
+    def transmit(self, strands: Iterable[str]) -> Iterable[str]:
+        # one output per input strand; failed strands become empty reads
+        result = self.transmit_detailed(strands)
+        return [s if s is not None else "" for s in result["strands"]]
@@ -0,0 +1,3 @@
+from .block_compressor import BlockCompressor
+
+__all__ = ["BlockCompressor"]
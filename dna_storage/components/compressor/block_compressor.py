@@ -0,0 +1,191 @@
+"""Block compression before encoding: fewer payload bytes, fewer strands.
+
+Stream format (all integers little endian):
+
+    header  "DNZ" | version u8 | block_size u32 | size u64 | crc32 u32 (of the previous 16 bytes)
+    frame   sync u32 | index u32 | codec u8 | raw_len u32 | comp_len u32 | crc32 u32 (of the raw block) | data
+    trailer a copy of the header
+
+The input is cut into blocks of block_size bytes, each compressed on its
+own and framed. A frame whose data does not decompress to raw_len bytes with
+the right CRC is skipped, and the reader resynchronizes on the next sync
+word, so one corrupt block costs only that block: it comes back as zeros
+(same offsets for everything after it, like a zero-filled strand), or
+raises with strict=True. The header is stored twice, at the start and at
+the end of the stream, so losing the first strand (or the last) does not
+lose every block; the trailer is found by searching backwards, as decoded
+streams can carry padding after it.
+"""
+
+import bz2
+import lzma
+import struct
+import zlib
+from typing import Callable, Dict, List, Tuple
+
+_MAGIC = b"DNZ"
+_VERSION = 1
+_HEADER = struct.Struct("<3sBIQ")
+_FRAME = struct.Struct("<IIBIII")
+_SYNC = 0x5A4B0CB1
+_SYNC_BYTES = struct.pack("<I", _SYNC)
+
+# codec id -> (name, compress(data, level), decompressor factory)
+_CODECS: Dict[int, Tuple[str, Callable[[bytes, int], bytes], Callable[[], object] | None]] = {
+    0: ("none", lambda data, level: data, None),
+    1: ("zlib", lambda data, level: zlib.compress(data, level), zlib.decompressobj),
+    2: ("lzma", lambda data, level: lzma.compress(data, preset=level), lzma.LZMADecompressor),
+    3: ("bz2", lambda data, level: bz2.compress(data, level), bz2.BZ2Decompressor),
+}
+_IDS = {name: cid for cid, (name, _, _) in _CODECS.items()}
+# compression level used when none is given
+_DEFAULT_LEVEL = {"none": 0, "zlib": 9, "lzma": 6, "bz2": 9}
+
+
+class BlockCompressor:
+    """Compress payloads in independently decodable blocks.
+
+    Parameters:
+    - codec: "zlib", "lzma", "bz2", "none" or "auto" (per payload, the
+      codec with the best ratio on a few sampled blocks; "none" when
+      nothing shrinks the sample by `min_gain`)
+    - block_size: raw bytes per block (smaller blocks lose less to a
+      corrupt strand but compress worse)
+    - level: codec level (None: each codec's strongest practical default)
+    - samples: blocks sampled by "auto"
+
+    Blocks that do not shrink are stored raw. `last_stats` holds codec,
+    size, stored and blocks after `compress`, and blocks and corrupt (block
+    indices) after `decompress`.
+    """
+
+    def __init__(
+        self,
+        codec: str = "auto",
+        block_size: int = 64 * 1024,
+        level: int | None = None,
+        samples: int = 4,
+        min_gain: float = 0.03,
+    ):
+        if codec != "auto" and codec not in _IDS:
+            raise ValueError(f"unknown codec {codec!r}; expected auto or one of {', '.join(_IDS)}")
+        assert block_size >= 1 and samples >= 1
+        self.codec = codec
+        self.block_size = block_size
+        self.level = level
+        self.samples = samples
+        self.min_gain = min_gain
+        self.last_stats: Dict[str, object] = {}
+
+    def _compress_block(self, name: str, block: bytes) -> bytes:
+        level = self.level if self.level is not None else _DEFAULT_LEVEL[name]
+        return _CODECS[_IDS[name]][1](block, level)
+
+    def choose_codec(self, data: bytes) -> str:
+        """Codec "auto" picks for `data`: best total size over evenly spaced sample blocks."""
+        if self.codec != "auto":
+            return self.codec
+        count = -(-len(data) // self.block_size)
+        if count == 0:
+            return "none"
+        step = max(1, count // self.samples)
+        picks = range(0, count, step)[: self.samples]
+        sample = [data[i * self.block_size : (i + 1) * self.block_size] for i in picks]
+        raw = sum(len(b) for b in sample)
+        sizes = {name: sum(len(self._compress_block(name, b)) for b in sample) for name in ("zlib", "bz2", "lzma")}
+        best = min(sizes, key=sizes.get)
+        return best if sizes[best] <= raw * (1 - self.min_gain) else "none"
+
+    def compress(self, data: bytes) -> bytes:
+        data = bytes(data)
+        name = self.choose_codec(data)
+        header = _HEADER.pack(_MAGIC, _VERSION, self.block_size, len(data))
+        header += struct.pack("<I", zlib.crc32(header))
+        parts: List[bytes] = [header]
+        blocks = 0
+        for index, lo in enumerate(range(0, len(data), self.block_size)):
+            block = data[lo : lo + self.block_size]
+            packed = self._compress_block(name, block)
+            cid = _IDS[name]
+            if len(packed) >= len(block):
+                packed, cid = block, 0
+            parts.append(_FRAME.pack(_SYNC, index, cid, len(block), len(packed), zlib.crc32(block)))
+            parts.append(packed)
+            blocks += 1
+        parts.append(header)
+        out = b"".join(parts)
+        self.last_stats = {"codec": name, "size": len(data), "stored": len(out), "blocks": blocks}
+        return out
+
+    def decompress(self, data: bytes, strict: bool = False) -> bytes:
+        """Inverse of `compress`; corrupt blocks are zero-filled (ValueError with strict=True)."""
+        data = bytes(data)
+        end = _HEADER.size + 4
+        if len(data) < end:
+            raise ValueError("compressed stream too short")
+        header = _read_header(data, 0)
+        pos = data.rfind(_MAGIC, end)
+        while header is None and pos >= 0:
+            # fall back to the trailer copy
+            header = _read_header(data, pos)
+            pos = data.rfind(_MAGIC, end, pos)
+        if header is None:
+            raise ValueError("corrupt or unknown compressed stream header")
+        block_size, size = header
+        count = -(-size // block_size)
+        blocks: Dict[int, bytes] = {}
+        pos = end
+        while pos + _FRAME.size <= len(data):
+            block, next_pos = _read_frame(data, pos, block_size, count)
+            if block is None:
+                # resynchronize on the next sync word
+                found = data.find(_SYNC_BYTES, pos + 1)
+                if found < 0:
+                    break
+                pos = found
+                continue
+            index, raw = block
+            blocks.setdefault(index, raw)
+            pos = next_pos
+        corrupt = [i for i in range(count) if i not in blocks]
+        self.last_stats = {"blocks": count, "corrupt": corrupt}
+        if corrupt and strict:
+            raise ValueError(f"compressed blocks {corrupt} are corrupt")
+        out = []
+        for i in range(count):
+            want = min(block_size, size - i * block_size)
+            out.append(blocks.get(i, bytes(want)))
+        return b"".join(out)
+
+
+def _read_header(data: bytes, pos: int) -> Tuple[int, int] | None:
+    """(block_size, size) of a valid header copy at pos, else None."""
+    if pos + _HEADER.size + 4 > len(data):
+        return None
+    magic, version, block_size, size = _HEADER.unpack_from(data, pos)
+    (crc,) = struct.unpack_from("<I", data, pos + _HEADER.size)
+    if magic != _MAGIC or version != _VERSION or block_size == 0 or crc != zlib.crc32(data[pos : pos + _HEADER.size]):
+        return None
+    return block_size, size
+
+
+def _read_frame(data: bytes, pos: int, block_size: int, count: int) -> Tuple[Tuple[int, bytes] | None, int]:
+    """((index, raw block), position after the frame), or (None, pos) if the frame at pos is not valid."""
+    sync, index, cid, raw_len, comp_len, crc = _FRAME.unpack_from(data, pos)
+    start = pos + _FRAME.size
+    stop = start + comp_len
+    if sync != _SYNC or index >= count or cid not in _CODECS or raw_len > block_size or stop > len(data):
+        return None, pos
+    payload = data[start:stop]
+    factory = _CODECS[cid][2]
+    if factory is None:
+        raw = payload
+    else:
+        try:
+            # max_length bounds the output of a corrupt block
+            raw = factory().decompress(payload, raw_len)
+        except (zlib.error, lzma.LZMAError, OSError, EOFError, ValueError):
+            return None, pos
+    if len(raw) != raw_len or zlib.crc32(raw) != crc:
+        return None, pos
+    return (index, raw), stop
@@ -1,4 +1,13 @@
-from .dna_rs_gf4_decoder import SimpleGf4ParityDecoder
-from .reed_solomon import ReedSolomonDecoder
+from dna_storage.utils.lazy import lazy_exports
 
-__all__ = ["SimpleGf4ParityDecoder", "ReedSolomonDecoder"]
+__all__ = ["SimpleGf4ParityDecoder", "ReedSolomonDecoder", "SystematicReedSolomonDecoder", "ReedSolomon16Decoder"]
+
+# submodules are imported on first access (PEP 562)
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".dna_rs_gf4_decoder": ["SimpleGf4ParityDecoder"],
+        ".reed_solomon": ["ReedSolomonDecoder", "SystematicReedSolomonDecoder"],
+        ".reed_solomon16": ["ReedSolomon16Decoder"],
+    },
+)
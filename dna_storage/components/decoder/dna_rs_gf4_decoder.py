@@ -1,61 +1,83 @@
-from typing import Iterable, List
+from typing import Iterable, List, Tuple
 from collections import Counter
 
+import numpy as np
+
 from dna_storage.components.mapper.rotating import RotatingMapper
 from dna_storage.utils.gf4 import from_gf4_symbols
 
+_ACGT = set("ACGT")
+
+
+def majority_vote(symbols: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Column-wise majority vote over a (reads, L) array of GF4 symbols.
+
+    Returns (consensus, confidence): the winning symbol per column and the
+    fraction of reads that voted for it. Counts for all columns come from a
+    single bincount over column-offset symbols.
+    """
+    symbols = np.asarray(symbols, dtype=np.int64)
+    n_reads, length = symbols.shape
+    if n_reads == 0:
+        return np.zeros(length, dtype=np.uint8), np.zeros(length)
+    counts = np.bincount((symbols + 4 * np.arange(length)).ravel(), minlength=4 * length)
+    counts = counts.reshape(length, 4)
+    consensus = counts.argmax(axis=1).astype(np.uint8)
+    confidence = counts.max(axis=1) / n_reads
+    return consensus, confidence
+
 
 class SimpleGf4ParityDecoder:
     """Decoder paired with SimpleGf4ParityEncoder and RotatingMapper.
 
-    Uses majority-vote assembly of multiple reads and checks parity.
+    Uses majority-vote assembly of multiple reads and checks parity. When the
+    consensus fails the parity check, the least confident column is treated
+    as an erasure and re-derived from the parity symbol. The outcome of the
+    last decode is kept in `last_parity_ok` and `last_confidence`.
     """
 
     def __init__(self, mapper: RotatingMapper):
         self.mapper = mapper
+        self.last_parity_ok: bool | None = None
+        self.last_confidence = np.zeros(0)
 
-    def decode(self, reads: Iterable[str]) -> bytes:
+    def _symbols(self, reads: List[str]) -> np.ndarray:
+        reads = [r for r in reads if set(r) <= _ACGT]
+        if hasattr(self.mapper, "reverse_batch"):
+            return self.mapper.reverse_batch(reads)
+        return np.array([self.mapper.reverse(r) for r in reads], dtype=np.uint8)
+
+    def consensus(self, reads: Iterable[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Vote over the reads of the modal length; returns (symbols, confidence).
+
+        Usable on its own as a fast pre-consensus for high-coverage read sets.
+        """
         reads = list(reads)
         if not reads:
-            return b""
+            return np.zeros(0, dtype=np.uint8), np.zeros(0)
 
         # pick the modal read length (most common)
         lengths = Counter(len(r) for r in reads)
         target_len = lengths.most_common(1)[0][0]
+        symbols = self._symbols([r for r in reads if len(r) == target_len])
+        if symbols.size == 0:
+            return np.zeros(0, dtype=np.uint8), np.zeros(0)
+        return majority_vote(symbols)
 
-        # convert reads of target length
-        symbol_lists: List[List[int]] = []
-        for r in reads:
-            if len(r) != target_len:
-                continue
-            try:
-                sym = self.mapper.reverse(r)
-            except ValueError:
-                continue
-            symbol_lists.append(sym)
-
-        if not symbol_lists:
+    def decode(self, reads: Iterable[str]) -> bytes:
+        assembled, confidence = self.consensus(reads)
+        self.last_confidence = confidence
+        if assembled.size == 0:
+            self.last_parity_ok = None
             return b""
 
-        # majority vote per position
-        assembled: List[int] = []
-        for idx in range(target_len):
-            votes = [s[idx] for s in symbol_lists if len(s) > idx]
-            if not votes:
-                assembled.append(0)
-            else:
-                most = Counter(votes).most_common(1)[0][0]
-                assembled.append(most)
-
-        # last symbol is parity — verify
-        if len(assembled) >= 1:
-            data_syms = assembled[:-1]
-            parity = assembled[-1]
-        else:
-            data_syms = []
-            parity = 0
+        # last symbol is parity: the XOR of all symbols must be zero
+        syndrome = int(np.bitwise_xor.reduce(assembled))
+        self.last_parity_ok = syndrome == 0
+        if syndrome:
+            # single parity corrects one erasure: fix the weakest column
+            weakest = int(confidence.argmin())
+            assembled[weakest] ^= syndrome
 
         # pack back to bytes
-        out = from_gf4_symbols(data_syms)
-        # Note: parity check isn't strictly enforced here; this is a demo
-        return out
+        return from_gf4_symbols(assembled[:-1].tolist())
@@ -1,6 +1,11 @@
-from typing import Iterable, List
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
 from dna_storage.utils import gf256
 from dna_storage.utils.gf4 import from_gf4_symbols
+from dna_storage.utils.diagnostics import CORRECTED, DECODED, ERASED, FAILED, DecodeStatus
+from dna_storage.utils.reads import base_weights
 
 
 def _lagrange_interpolate(xs: List[int], ys: List[int], degree: int) -> List[int]:
@@ -39,9 +44,19 @@ def _lagrange_interpolate(xs: List[int], ys: List[int], degree: int) -> List[int
     if len(poly) < degree:
         poly += [0] * (degree - len(poly))
     return poly[:degree]
-    if len(poly) < degree:
-        poly += [0] * (degree - len(poly))
-    return poly[:degree]
+
+
+def _interpolation_matrix(xs: List[int]) -> np.ndarray:
+    """Inverse Vandermonde matrix: coefficients = evaluations @ result.
+
+    Row j holds the coefficients of the Lagrange basis polynomial for xs[j].
+    """
+    k = len(xs)
+    rows = []
+    for j in range(k):
+        unit = [1 if i == j else 0 for i in range(k)]
+        rows.append(_lagrange_interpolate(xs, unit, k))
+    return np.array(rows, dtype=np.int64)
 
 
 class ReedSolomonDecoder:
@@ -50,6 +65,9 @@ class ReedSolomonDecoder:
     This decoder expects that each read corresponds to a full codeword (or that
     reads are already consensus-cleaned) and decodes the original message by
     interpolating the message polynomial from any k correct evaluations.
+    It cannot detect errors: a read is "decoded", "erased" when it is
+    shorter than n bytes, or "failed" (k zero bytes in the output) when it
+    has fewer than k; `last_status` holds one entry per read.
     """
 
     def __init__(self, n: int = 32, k: int = 24, mapper=None):
@@ -58,9 +76,24 @@ class ReedSolomonDecoder:
         self.k = k
         self.points = [i + 1 for i in range(n)]
         self.mapper = mapper
+        self._inverse = None
+        self.last_status = DecodeStatus()
+
+    def decode_batch(self, codewords: np.ndarray) -> np.ndarray:
+        """Decode a (B, >=k) uint8 array of codeword bytes into a (B, k) message array.
+
+        Like `decode`, this interpolates from the first k evaluations of each row;
+        since those positions are shared by every row it reduces to a single
+        matrix product with a cached inverse Vandermonde matrix.
+        """
+        if self._inverse is None:
+            self._inverse = _interpolation_matrix(self.points[: self.k])
+        codewords = np.asarray(codewords)
+        return gf256.matmul(codewords[:, : self.k], self._inverse).astype(np.uint8)
 
     def decode(self, reads: Iterable[str]) -> bytes:
         reads = list(reads)
+        self.last_status = DecodeStatus()
         if not reads:
             return b""
 
@@ -87,13 +120,271 @@ class ReedSolomonDecoder:
                     break
 
             if len(xs) < self.k:
-                # cannot reconstruct this read -> skip
+                # cannot reconstruct this read: placeholder keeps later offsets
+                self.last_status.record(FAILED)
+                results.append(bytes(self.k))
                 continue
 
             # interpolate polynomial of degree < k
             coeffs = _lagrange_interpolate(xs, ys, self.k)
             # pack coefficients into bytes
             out = bytes([c & 0xFF for c in coeffs])
+            missing = max(0, self.n - len(codeword_bytes))
+            self.last_status.record(ERASED if missing else DECODED, erased=missing)
+            results.append(out)
+
+        return b"".join(results)
+
+
+# --- systematic (generator-polynomial) RS helpers ------------------------
+# Polynomials below are lists with the highest-degree coefficient first,
+# matching the codeword byte order of SystematicReedSolomonEncoder.
+
+
+def _poly_eval_be(poly: List[int], x: int) -> int:
+    y = poly[0]
+    for coeff in poly[1:]:
+        y = gf256.add(gf256.mul(y, x), coeff)
+    return y
+
+
+def _poly_add_be(p1: List[int], p2: List[int]) -> List[int]:
+    out = [0] * max(len(p1), len(p2))
+    for i, c in enumerate(p1):
+        out[i + len(out) - len(p1)] = c
+    for i, c in enumerate(p2):
+        out[i + len(out) - len(p2)] ^= c
+    return out
+
+
+def _poly_mul_be(p1: List[int], p2: List[int]) -> List[int]:
+    out = [0] * (len(p1) + len(p2) - 1)
+    for j, b in enumerate(p2):
+        if b == 0:
+            continue
+        for i, a in enumerate(p1):
+            out[i + j] ^= gf256.mul(a, b)
+    return out
+
+
+def _syndromes(codeword: List[int], nsym: int) -> List[int]:
+    """Evaluate the received codeword at the generator roots a^0 .. a^(nsym-1)."""
+    return [_poly_eval_be(codeword, gf256.EXP[i]) for i in range(nsym)]
+
+
+def _forney_syndromes(synd: List[int], erase_pos: List[int], n: int) -> List[int]:
+    # remove the erasure contribution so Berlekamp-Massey only sees errors
+    fsynd = list(synd)
+    for p in erase_pos:
+        x = gf256.EXP[n - 1 - p]
+        for j in range(len(fsynd) - 1):
+            fsynd[j] = gf256.mul(fsynd[j], x) ^ fsynd[j + 1]
+    return fsynd
+
+
+def _error_locator(fsynd: List[int], nsym: int, erase_count: int) -> List[int]:
+    """Berlekamp-Massey on Forney syndromes; raises ValueError when uncorrectable."""
+    err_loc = [1]
+    old_loc = [1]
+    for i in range(nsym - erase_count):
+        delta = fsynd[i]
+        for j in range(1, len(err_loc)):
+            delta ^= gf256.mul(err_loc[-(j + 1)], fsynd[i - j])
+        old_loc = old_loc + [0]
+        if delta != 0:
+            if len(old_loc) > len(err_loc):
+                new_loc = gf256.poly_scale(old_loc, delta)
+                old_loc = gf256.poly_scale(err_loc, gf256.inverse(delta))
+                err_loc = new_loc
+            err_loc = _poly_add_be(err_loc, gf256.poly_scale(old_loc, delta))
+
+    while len(err_loc) > 1 and err_loc[0] == 0:
+        err_loc = err_loc[1:]
+    errs = len(err_loc) - 1
+    if errs * 2 + erase_count > nsym:
+        raise ValueError("too many errors to correct")
+    return err_loc
+
+
+def _find_errors(err_loc: List[int], n: int) -> List[int]:
+    """Chien search: positions (codeword indices) where the locator has a root."""
+    errs = len(err_loc) - 1
+    rev = err_loc[::-1]
+    pos = [n - 1 - i for i in range(n) if _poly_eval_be(rev, gf256.EXP[i]) == 0]
+    if len(pos) != errs:
+        raise ValueError("error locator roots do not match the number of errors")
+    return pos
+
+
+def _correct_errata(codeword: List[int], synd: List[int], err_pos: List[int]) -> List[int]:
+    """Forney algorithm: compute and apply the magnitudes at the errata positions."""
+    n = len(codeword)
+    coef_pos = [n - 1 - p for p in err_pos]
+
+    # errata locator prod(1 - x * a^pos)
+    loc = [1]
+    for p in coef_pos:
+        loc = _poly_mul_be(loc, [gf256.EXP[p], 1])
+
+    # error evaluator omega(x) = x * S(x) * loc(x) mod x^(len(loc))
+    nloc = len(loc) - 1
+    omega = _poly_mul_be(synd[::-1] + [0], loc)[-(nloc + 1) :]
+
+    xs = [gf256.EXP[p] for p in coef_pos]
+    out = list(codeword)
+    for i, xi in enumerate(xs):
+        xi_inv = gf256.inverse(xi)
+        denom = 1
+        for j, xj in enumerate(xs):
+            if j != i:
+                denom = gf256.mul(denom, 1 ^ gf256.mul(xi_inv, xj))
+        if denom == 0:
+            raise ValueError("could not compute error magnitude")
+        y = gf256.mul(xi, _poly_eval_be(omega, xi_inv))
+        out[err_pos[i]] ^= gf256.div(y, denom)
+    return out
+
+
+def _rs_correct(codeword: List[int], nsym: int, erase_pos: List[int]) -> List[int]:
+    """Errors-and-erasures decoding of a full-length codeword (highest degree first)."""
+    if len(erase_pos) > nsym:
+        raise ValueError("too many erasures to correct")
+    out = list(codeword)
+    for p in erase_pos:
+        out[p] = 0
+    synd = _syndromes(out, nsym)
+    if not any(synd):
+        return out
+
+    fsynd = _forney_syndromes(synd, erase_pos, len(out))
+    err_loc = _error_locator(fsynd, nsym, len(erase_pos))
+    err_pos = _find_errors(err_loc, len(out))
+    out = _correct_errata(out, synd, list(erase_pos) + err_pos)
+    if any(_syndromes(out, nsym)):
+        raise ValueError("could not correct codeword")
+    return out
+
+
+class SystematicReedSolomonDecoder:
+    """Errors-and-erasures decoder for SystematicReedSolomonEncoder.
+
+    Reads whose syndromes are all zero take the fast path: the first k bytes
+    are the message and are returned directly. Otherwise the decoder runs
+    Berlekamp-Massey + Forney and can correct e errors and f erasures as long
+    as 2e + f <= n - k. Bytes missing from the end of a short read (eg. after
+    deletions) are treated as erasures.
+
+    With soft=True, reads carrying per-base qualities (`QualityRead`, eg. a
+    consensus from SimpleAligner(posteriors=True)) get a second chance when
+    hard decoding fails: generalized minimum distance decoding erases the
+    1, 2, ... least reliable bytes (reliability = probability that all 4
+    bases of the byte are right) and retries until a codeword is found. An
+    error at an erased position costs one parity byte instead of two, so
+    more errors are correctable when the qualities single them out. Every
+    retry is a new chance to fit some codeword, so `soft_margin` parity
+    bytes are kept for detection: retries erase at most n - k - soft_margin
+    bytes and a result is accepted only if 2e + f <= n - k - soft_margin
+    (e errors corrected outside the f erasures). With soft_margin=0 any
+    received word fits a codeword and soft decoding never fails; 1 rescues
+    more reads but accepts ~0.4% of random words (n - k = 6, 8); the
+    default 2 accepts about as few as hard decoding. `last_stats` counts
+    reads, failed and soft (decoded only thanks to the qualities) for the
+    latest `decode`.
+
+    An undecodable read yields k zero bytes, so later reads keep their
+    offsets; `last_status` (utils.diagnostics.DecodeStatus) records per read
+    whether it was decoded clean, corrected (with the number of symbol
+    errors), erased (with the number of erasures) or failed.
+    """
+
+    def __init__(self, n: int = 32, k: int = 24, mapper=None, soft: bool = False, soft_margin: int = 2):
+        assert 1 <= k < n <= 255
+        assert soft_margin >= 0
+        self.n = n
+        self.k = k
+        self.mapper = mapper
+        self.soft = soft
+        self.soft_margin = soft_margin
+        self.last_stats: Dict[str, int] = {}
+        self.last_status = DecodeStatus()
+
+    def _codeword_bytes(self, r) -> List[int]:
+        if self.mapper is not None:
+            syms = self.mapper.reverse(r)
+            # only complete bytes; a trailing partial byte is an erasure
+            syms = syms[: len(syms) - len(syms) % 4]
+            return list(from_gf4_symbols(syms))
+        return list(r)
+
+    def _reliability(self, r) -> np.ndarray | None:
+        """Log-probability that each codeword byte of `r` is right, or None without qualities."""
+        probs = base_weights(r)
+        if probs is None or self.mapper is None:
+            return None
+        # skip bases the mapper puts before the codeword (eg. a scrambling seed)
+        probs = probs[getattr(self.mapper, "prefix_bases", 0) :]
+        nbytes = len(probs) // 4
+        logp = np.log(np.clip(probs[: 4 * nbytes], 1e-12, 1.0))
+        return logp.reshape(nbytes, 4).sum(axis=1)
+
+    def decode_codeword(self, codeword: List[int], reliability: np.ndarray | None = None) -> bytes | None:
+        """Decode one codeword (list of bytes); returns the k message bytes or None.
+
+        `reliability` (one score per byte, higher is more reliable) enables
+        the soft retries described in the class docstring.
+        """
+        return self._decode_codeword(codeword, reliability)[0]
+
+    def _decode_codeword(self, codeword: List[int], reliability: np.ndarray | None) -> Tuple[bytes | None, int, int, int]:
+        """(message or None, status, corrected errors, erasures); status codes from utils.diagnostics."""
+        nsym = self.n - self.k
+        cw = list(codeword[: self.n])
+        erase_pos = list(range(len(cw), self.n))
+        cw += [0] * len(erase_pos)
+
+        if not erase_pos and not any(_syndromes(cw, nsym)):
+            # clean codeword: message is stored verbatim
+            return bytes(cw[: self.k]), DECODED, 0, 0
+
+        attempts = [erase_pos]
+        budget = nsym - self.soft_margin
+        if reliability is not None:
+            # then erase the least reliable received bytes, one more at a time,
+            # keeping soft_margin parity bytes to detect wrong fits
+            present = len(cw) - len(erase_pos)
+            order = np.argsort(np.asarray(reliability[:present]), kind="stable").tolist()
+            attempts += [erase_pos + sorted(order[:extra]) for extra in range(1, budget - len(erase_pos) + 1)]
+        for i, erased in enumerate(attempts):
+            try:
+                fixed = _rs_correct(cw, nsym, erased)
+            except (ValueError, ZeroDivisionError):
+                continue
+            skip = set(erased)
+            corrected = sum(1 for j, (a, b) in enumerate(zip(cw, fixed)) if a != b and j not in skip)
+            if i > 0:
+                if 2 * corrected + len(erased) > budget:
+                    continue
+                self.last_stats["soft"] = self.last_stats.get("soft", 0) + 1
+            return bytes(fixed[: self.k]), ERASED if erased else CORRECTED, corrected, len(erased)
+        return None, FAILED, 0, 0
+
+    def decode(self, reads: Iterable[str]) -> bytes:
+        """Decode every read to k bytes; undecodable reads become k zero bytes (see `last_status`)."""
+        reads = list(reads)
+        self.last_stats = {"reads": len(reads), "failed": 0, "soft": 0}
+        self.last_status = DecodeStatus()
+        if not reads:
+            return b""
+
+        results: List[bytes] = []
+        for r in reads:
+            reliability = self._reliability(r) if self.soft else None
+            out, status, corrected, erased = self._decode_codeword(self._codeword_bytes(r), reliability)
+            self.last_status.record(status, corrected, erased)
+            if out is None:
+                # placeholder keeps the offsets of later strands
+                self.last_stats["failed"] += 1
+                out = bytes(self.k)
             results.append(out)
 
         return b"".join(results)
@@ -0,0 +1,44 @@
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from dna_storage.utils import gf65536
+
+
+class ReedSolomon16Decoder:
+    """Erasure decoder for ReedSolomon16Encoder.
+
+    Takes the n rows of a block in their original order, with None for rows
+    (strands) that were lost or failed their inner decode, and recovers the k
+    data rows from any k surviving rows.
+    """
+
+    def __init__(self, n: int = 1200, k: int = 1000):
+        assert 1 <= k < n <= gf65536.ORDER
+        self.n = n
+        self.k = k
+        self.points = np.arange(1, n + 1, dtype=np.int64)
+
+    def decode_rows(self, rows: Sequence[Optional[bytes]]) -> List[bytes]:
+        if len(rows) != self.n:
+            raise ValueError(f"expected {self.n} rows, got {len(rows)}")
+        present = [i for i, r in enumerate(rows) if r is not None]
+        if len(present) < self.k:
+            raise ValueError(f"only {len(present)} of {self.n} rows available, need {self.k}")
+
+        missing = [i for i in range(self.k) if rows[i] is None]
+        if not missing:
+            # all data rows survived: nothing to compute
+            return [bytes(rows[i]) for i in range(self.k)]
+
+        # prefer surviving data rows, then parity rows
+        use = present[: self.k]
+        row_len = max(len(rows[i]) for i in use)
+        row_len += row_len % 2
+        ys = gf65536.bytes_to_symbols([rows[i] for i in use], row_len)
+        recovered = gf65536.lagrange_eval(self.points[use], ys, self.points[missing])
+
+        out = [rows[i] for i in range(self.k)]
+        for i, row in zip(missing, gf65536.symbols_to_bytes(recovered)):
+            out[i] = row
+        return [bytes(r) for r in out]
@@ -1,4 +1,13 @@
-from .dna_rs_gf4 import SimpleGf4ParityEncoder
-from .reed_solomon import ReedSolomonEncoder
+from dna_storage.utils.lazy import lazy_exports
 
-__all__ = ["SimpleGf4ParityEncoder", "ReedSolomonEncoder"]
+__all__ = ["SimpleGf4ParityEncoder", "ReedSolomonEncoder", "SystematicReedSolomonEncoder", "ReedSolomon16Encoder"]
+
+# submodules are imported on first access (PEP 562)
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".dna_rs_gf4": ["SimpleGf4ParityEncoder"],
+        ".reed_solomon": ["ReedSolomonEncoder", "SystematicReedSolomonEncoder"],
+        ".reed_solomon16": ["ReedSolomon16Encoder"],
+    },
+)
@@ -1,4 +1,7 @@
 from typing import List
+
+import numpy as np
+
 from dna_storage.utils import gf256
 from dna_storage.utils.gf4 import to_gf4_symbols
 
@@ -23,6 +26,10 @@ class ReedSolomonEncoder:
 
         # choose evaluation points 1..n (must be nonzero and distinct)
         self.points = [i + 1 for i in range(n)]
+        # generator matrix: codeword = message @ G with G[i, j] = points[j]^i
+        self.generator_matrix = np.array(
+            [[gf256.pow_(x, i) for x in self.points] for i in range(k)], dtype=np.int64
+        )
 
     def encode(self, message: bytes) -> List[int]:
         # pad or trim message to length k
@@ -35,11 +42,62 @@ class ReedSolomonEncoder:
 
         # convert bytes to GF4 symbols (2 bits per symbol) for mapping
         # Return a flat list of symbols
-        syms = []
-        for b in codeword:
-            # pack 1 byte into 4 GF4 symbols
-            syms.append((b >> 6) & 0x3)
-            syms.append((b >> 4) & 0x3)
-            syms.append((b >> 2) & 0x3)
-            syms.append(b & 0x3)
-        return syms
+        return to_gf4_symbols(bytes(codeword))
+
+    def encode_batch(self, messages: np.ndarray) -> np.ndarray:
+        """Encode a (B, k) uint8 array of messages into a (B, n) uint8 array of codeword bytes."""
+        return gf256.matmul(messages, self.generator_matrix).astype(np.uint8)
+
+
+def _generator_poly(nsym: int) -> List[int]:
+    """Return g(x) = (x - a^0)(x - a^1)...(x - a^(nsym-1)), highest degree first."""
+    g = [1]
+    for i in range(nsym):
+        root = gf256.EXP[i]
+        out = [0] * (len(g) + 1)
+        for j, c in enumerate(g):
+            # multiply by (x + root): shift for x, scale for root
+            out[j] = gf256.add(out[j], c)
+            out[j + 1] = gf256.add(out[j + 1], gf256.mul(c, root))
+        g = out
+    return g
+
+
+class SystematicReedSolomonEncoder:
+    """Systematic RS encoder over GF(256) using generator-polynomial division.
+
+    The k message bytes appear verbatim in the first k codeword positions and
+    the n-k parity bytes are the remainder of m(x) * x^(n-k) divided by the
+    generator polynomial g(x) with roots a^0 .. a^(n-k-1). Codewords are
+    returned as GF(4) symbols, like `ReedSolomonEncoder`.
+
+    Parameters:
+    - n: codeword length in bytes
+    - k: message length in bytes
+    """
+
+    def __init__(self, n: int = 32, k: int = 24):
+        assert 1 <= k < n <= 255
+        self.n = n
+        self.k = k
+        self.generator = _generator_poly(n - k)
+
+    def parity(self, msg: List[int]) -> List[int]:
+        """Return the n-k parity bytes for a k-byte message (synthetic division)."""
+        out = list(msg) + [0] * (self.n - self.k)
+        for i in range(self.k):
+            coef = out[i]
+            if coef == 0:
+                continue
+            for j in range(1, len(self.generator)):
+                out[i + j] = gf256.add(out[i + j], gf256.mul(self.generator[j], coef))
+        return out[self.k :]
+
+    def encode(self, message: bytes) -> List[int]:
+        # pad or trim message to length k
+        msg = list(message[: self.k])
+        if len(msg) < self.k:
+            msg += [0] * (self.k - len(msg))
+
+        codeword = msg + self.parity(msg)
+        return to_gf4_symbols(bytes(codeword))
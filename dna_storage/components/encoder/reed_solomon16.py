@@ -0,0 +1,43 @@
+from typing import List, Sequence
+
+import numpy as np
+
+from dna_storage.utils import gf65536
+
+
+class ReedSolomon16Encoder:
+    """Systematic outer RS erasure code over GF(2^16), applied across strands.
+
+    The k data rows (one per strand payload) are kept verbatim; n - k parity
+    rows are added so that any k of the n rows recover the data. Each 2-byte
+    column position is an independent codeword: row i holds the evaluation at
+    point i + 1 of the polynomial interpolating the data rows. With 16-bit
+    symbols a single code may span up to 65535 strands (vs 255 for GF(256)).
+
+    Parameters:
+    - n: number of rows (strands) per block
+    - k: number of data rows per block
+    """
+
+    def __init__(self, n: int = 1200, k: int = 1000):
+        assert 1 <= k < n <= gf65536.ORDER
+        self.n = n
+        self.k = k
+        self.points = np.arange(1, n + 1, dtype=np.int64)
+        self._logw = None
+
+    def encode_rows(self, rows: Sequence[bytes]) -> List[bytes]:
+        """Return n rows: the k data rows (zero padded to an even common length) plus parity."""
+        if len(rows) != self.k:
+            raise ValueError(f"expected {self.k} data rows, got {len(rows)}")
+        row_len = max(len(r) for r in rows)
+        row_len += row_len % 2
+
+        ys = gf65536.bytes_to_symbols(rows, row_len)
+        if self._logw is None:
+            # weights depend only on the data points; reuse across blocks
+            self._logw = gf65536.barycentric_weights(self.points[: self.k])
+        parity = gf65536.lagrange_eval(self.points[: self.k], ys, self.points[self.k :], logw=self._logw)
+
+        data = [bytes(r) + b"\x00" * (row_len - len(r)) for r in rows]
+        return data + gf65536.symbols_to_bytes(parity)
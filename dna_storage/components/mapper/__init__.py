@@ -1,3 +1,4 @@
 from .rotating import RotatingMapper
+from .scrambling import ScramblingMapper
 
-__all__ = ["RotatingMapper"]
+__all__ = ["RotatingMapper", "ScramblingMapper"]
@@ -1,12 +1,24 @@
-from typing import List
+from typing import List, Sequence
+
+import numpy as np
+
+from dna_storage.utils.packed import PackedSequence, seq_codes
 
 # This mapper deterministically maps GF4 symbols (0..3) to bases A/C/G/T
 # The mapping rotates depending on the previous base to avoid homopolymers often.
 
 BASES = ["A", "C", "G", "T"]
 
+# ASCII code -> base index lookup for the batch paths (255 marks invalid bytes)
+_BASE_ASCII = np.frombuffer("".join(BASES).encode("ascii"), dtype=np.uint8)
+_BASE_INDEX = np.full(256, 255, dtype=np.uint8)
+_BASE_INDEX[_BASE_ASCII] = np.arange(4, dtype=np.uint8)
+
 
 class RotatingMapper:
+    # bases in front of the mapped symbols that carry no codeword data
+    prefix_bases = 0
+
     def __init__(self):
         pass
 
@@ -20,13 +32,38 @@ class RotatingMapper:
             prev_idx = (prev_idx + 1) % 4
         return "".join(out)
 
-    def reverse(self, dna: str) -> List[int]:
-        symbols = []
-        prev_idx = 0
-        for b in dna:
-            # find base index
-            idx = BASES.index(b)
-            s = (idx - prev_idx) % 4
-            symbols.append(s)
-            prev_idx = (prev_idx + 1) % 4
-        return symbols
+    def map_packed(self, symbols: List[int]) -> PackedSequence:
+        """Like `map`, but returns a 2-bit PackedSequence without building a string."""
+        symbols = np.asarray(symbols, dtype=np.int64)
+        return PackedSequence.from_codes((symbols + np.arange(len(symbols))) % 4)
+
+    def reverse(self, dna: str | PackedSequence) -> List[int]:
+        # base index minus the rotation; packed input skips character parsing
+        idx = seq_codes(dna).astype(np.int64)
+        return ((idx - np.arange(len(idx))) % 4).tolist()
+
+    def map_batch(self, symbols: np.ndarray) -> List[str]:
+        """Map a (B, L) array of GF4 symbols to B DNA strings in one pass."""
+        symbols = np.asarray(symbols, dtype=np.int64)
+        length = symbols.shape[1]
+        idx = (symbols + np.arange(length)) % 4
+        raw = _BASE_ASCII[idx].tobytes().decode("ascii")
+        return [raw[i * length : (i + 1) * length] for i in range(symbols.shape[0])]
+
+    def reverse_batch(self, reads: Sequence[str]) -> np.ndarray:
+        """Reverse B equal-length DNA strings into a (B, L) uint8 symbol array."""
+        if not reads:
+            return np.zeros((0, 0), dtype=np.uint8)
+        length = len(reads[0])
+        if any(isinstance(r, PackedSequence) for r in reads):
+            if any(len(r) != length for r in reads):
+                raise ValueError("reverse_batch expects reads of equal length")
+            idx = np.stack([seq_codes(r) for r in reads])
+        else:
+            raw = np.frombuffer("".join(reads).encode("ascii"), dtype=np.uint8)
+            if raw.size != length * len(reads):
+                raise ValueError("reverse_batch expects reads of equal length")
+            idx = _BASE_INDEX[raw].reshape(len(reads), length)
+            if np.any(idx == 255):
+                raise ValueError("read contains a non-ACGT character")
+        return ((idx.astype(np.int64) - np.arange(length)) % 4).astype(np.uint8)
@@ -0,0 +1,3 @@
+from .strand_screener import DEFAULT_MOTIFS, FLAG_NAMES, GC, HAIRPIN, HOMOPOLYMER, MOTIF, StrandScreener
+
+__all__ = ["StrandScreener", "DEFAULT_MOTIFS", "FLAG_NAMES", "GC", "HOMOPOLYMER", "MOTIF", "HAIRPIN"]
@@ -0,0 +1,269 @@
+"""Synthesis constraint screening of encoded strands.
+
+All checks run on a (B, L) matrix of base codes (A=0, C=1, G=2, T=3), one
+row per strand, with whole-matrix NumPy operations instead of per-strand
+loops:
+
+- GC content of every `gc_window`-base window: differences of a cumulative
+  sum along the rows
+- longest homopolymer run: position minus the start of its run, where run
+  starts are carried forward with a running maximum
+- forbidden motifs (restriction sites, primer-like sequences) and their
+  reverse complements: every k-mer as a 2k-bit integer from k shifted adds,
+  looked up with np.isin
+- hairpins, a secondary-structure proxy: a `hairpin_stem`-mer followed,
+  after a loop of `hairpin_loop` bases, by its own reverse complement
+  (k-mer values compared against reverse-complement k-mer values shifted by
+  stem + loop)
+
+Strands of different lengths are checked per length group, and at most
+`chunk_size` strands at a time to bound memory.
+"""
+
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+from dna_storage.utils.packed import PackedSequence, seq_codes
+
+# violation flags, combined bitwise per strand
+GC, HOMOPOLYMER, MOTIF, HAIRPIN = 1, 2, 4, 8
+FLAG_NAMES = {GC: "gc", HOMOPOLYMER: "homopolymer", MOTIF: "motif", HAIRPIN: "hairpin"}
+
+# BsaI, BsmBI (Golden Gate), EcoRI, BamHI
+DEFAULT_MOTIFS = ("GGTCTC", "CGTCTC", "GAATTC", "GGATCC")
+
+_ASCII = np.full(256, 255, dtype=np.uint8)
+_ASCII[np.frombuffer(b"ACGT", dtype=np.uint8)] = np.arange(4, dtype=np.uint8)
+
+
+def _code_matrix(strands: Sequence) -> np.ndarray:
+    """(B, L) base codes of B equal-length strands (str or PackedSequence)."""
+    if not strands:
+        return np.zeros((0, 0), dtype=np.uint8)
+    if any(isinstance(s, PackedSequence) for s in strands):
+        return np.stack([seq_codes(s) for s in strands])
+    raw = _ASCII[np.frombuffer("".join(strands).encode("ascii"), dtype=np.uint8)]
+    if np.any(raw == 255):
+        raise ValueError("strand contains a non-ACGT character")
+    return raw.reshape(len(strands), -1)
+
+
+def _kmer_dtype(k: int):
+    # smallest unsigned type holding 2k bits: narrower arrays compare faster
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if 2 * k <= 8 * np.dtype(dtype).itemsize:
+            return dtype
+    return np.uint64
+
+
+def _kmers(codes: np.ndarray, k: int, reverse_complement: bool = False) -> np.ndarray:
+    """(B, L - k + 1) k-mer values (2 bits per base, first base most significant).
+
+    With reverse_complement=True, the value of each window's reverse complement.
+    """
+    dtype = _kmer_dtype(k)
+    width = codes.shape[1] - k + 1
+    if width <= 0:
+        return np.zeros((codes.shape[0], 0), dtype=dtype)
+    # Horner's rule over the window's bases; the reverse complement reads
+    # the complemented bases (3 - code) from the window's end
+    codes = (3 - codes if reverse_complement else codes).astype(dtype)
+    order = range(k - 1, -1, -1) if reverse_complement else range(k)
+    out = None
+    for j in order:
+        if out is None:
+            out = codes[:, j : j + width].copy()
+        else:
+            out <<= dtype(2)
+            out += codes[:, j : j + width]
+    return out
+
+
+def _motif_value(motif: str) -> int:
+    value = 0
+    for base in motif:
+        value = 4 * value + "ACGT".index(base)
+    return value
+
+
+def _reverse_complement(seq: str) -> str:
+    return seq[::-1].translate(str.maketrans("ACGT", "TGCA"))
+
+
+class StrandScreener:
+    """Check strands against synthesis constraints and re-map failing ones.
+
+    Parameters:
+    - gc_window, gc_min, gc_max: every window of gc_window bases (the whole
+      strand if shorter) must have a GC fraction in [gc_min, gc_max]
+    - max_homopolymer: longest allowed run of one base
+    - motifs: forbidden sequences, matched on both strands
+    - hairpin_stem, hairpin_loop: a stem of this many bases whose reverse
+      complement follows after a loop of hairpin_loop = (min, max) bases
+      counts as a hairpin; hairpin_stem=0 disables the check
+    - max_seeds: seeds tried by `screen` (default: all the mapper offers)
+
+    `check` returns a violation bitmask per strand (GC | HOMOPOLYMER |
+    MOTIF | HAIRPIN), `metrics` the underlying numbers. `screen` maps
+    codewords with seed 0 and re-maps violating ones with the next seeds of
+    a seeded mapper (ScramblingMapper) until they pass; strands no seed
+    fixes keep the seed with the fewest violated checks. `last_stats` holds
+    strands, flagged (before re-mapping), per-check counts, remapped,
+    unresolved and tries.
+    """
+
+    def __init__(
+        self,
+        gc_window: int = 50,
+        gc_min: float = 0.3,
+        gc_max: float = 0.7,
+        max_homopolymer: int = 4,
+        motifs: Iterable[str] = DEFAULT_MOTIFS,
+        hairpin_stem: int = 8,
+        hairpin_loop: Tuple[int, int] = (3, 20),
+        max_seeds: int | None = None,
+        chunk_size: int = 65536,
+    ):
+        assert gc_window >= 1 and 0.0 <= gc_min <= gc_max <= 1.0
+        assert max_homopolymer >= 1 and chunk_size >= 1
+        self.gc_window = gc_window
+        self.gc_min = gc_min
+        self.gc_max = gc_max
+        self.max_homopolymer = max_homopolymer
+        self.motifs = [m.upper() for m in motifs]
+        for m in self.motifs:
+            if not m or set(m) - set("ACGT") or len(m) > 32:
+                raise ValueError(f"motif {m!r} must be 1..32 ACGT bases")
+        self.hairpin_stem = hairpin_stem
+        self.hairpin_loop = tuple(hairpin_loop)
+        self.max_seeds = max_seeds
+        self.chunk_size = chunk_size
+        # motif length -> k-mer values of the motifs and their reverse complements
+        self._motif_values: Dict[int, np.ndarray] = {}
+        for m in self.motifs:
+            dtype = _kmer_dtype(len(m))
+            values = np.array([_motif_value(m), _motif_value(_reverse_complement(m))], dtype=dtype)
+            self._motif_values[len(m)] = np.union1d(self._motif_values.get(len(m), values), values)
+        self.last_stats: Dict[str, int] = {}
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        self.last_stats = {"strands": 0, "flagged": 0, **{n: 0 for n in FLAG_NAMES.values()}}
+        self.last_stats.update(remapped=0, unresolved=0, tries=0)
+
+    def _metrics(self, codes: np.ndarray) -> Dict[str, np.ndarray]:
+        rows, length = codes.shape
+        out: Dict[str, np.ndarray] = {}
+
+        # GC fraction of every window
+        window = max(1, min(self.gc_window, length))
+        gc = np.zeros((rows, length + 1), dtype=np.int32)
+        np.cumsum((codes == 1) | (codes == 2), axis=1, out=gc[:, 1:])
+        if length:
+            count = gc[:, window:] - gc[:, :-window]
+            out["gc_min"], out["gc_max"] = count.min(axis=1) / window, count.max(axis=1) / window
+        else:
+            out["gc_min"] = out["gc_max"] = np.full(rows, 0.5)
+
+        # longest run: position - start of the run it belongs to + 1
+        pos = np.arange(length, dtype=np.int32)
+        starts = np.ones((rows, length), dtype=bool)
+        starts[:, 1:] = codes[:, 1:] != codes[:, :-1]
+        run_start = np.maximum.accumulate(np.where(starts, pos, np.int32(0)), axis=1)
+        out["max_run"] = (pos - run_start + 1).max(axis=1) if length else np.zeros(rows, dtype=np.int64)
+
+        motifs = np.zeros(rows, dtype=np.int64)
+        for k, values in self._motif_values.items():
+            motifs += np.isin(_kmers(codes, k), values).sum(axis=1)
+        out["motifs"] = motifs
+
+        hairpins = np.zeros(rows, dtype=np.int64)
+        k = self.hairpin_stem
+        if k > 0:
+            fwd, rc = _kmers(codes, k), _kmers(codes, k, reverse_complement=True)
+            lo, hi = self.hairpin_loop
+            for shift in range(k + lo, min(k + hi, fwd.shape[1] - 1) + 1):
+                hairpins += np.count_nonzero(fwd[:, :-shift] == rc[:, shift:], axis=1)
+        out["hairpins"] = hairpins
+        return out
+
+    def _flags(self, m: Dict[str, np.ndarray]) -> np.ndarray:
+        flags = np.zeros(len(m["max_run"]), dtype=np.uint8)
+        # small tolerance: window fractions are computed in floating point
+        flags[(m["gc_min"] < self.gc_min - 1e-9) | (m["gc_max"] > self.gc_max + 1e-9)] |= GC
+        flags[m["max_run"] > self.max_homopolymer] |= HOMOPOLYMER
+        flags[m["motifs"] > 0] |= MOTIF
+        flags[m["hairpins"] > 0] |= HAIRPIN
+        return flags
+
+    def metrics(self, strands: Sequence) -> Dict[str, np.ndarray]:
+        """Per-strand gc_min, gc_max (window GC fractions), max_run, motifs and hairpins (hit counts)."""
+        strands = list(strands)
+        out = {key: np.zeros(len(strands)) for key in ("gc_min", "gc_max")}
+        out.update({key: np.zeros(len(strands), dtype=np.int64) for key in ("max_run", "motifs", "hairpins")})
+        by_len: Dict[int, List[int]] = {}
+        for i, s in enumerate(strands):
+            by_len.setdefault(len(s), []).append(i)
+        for ids in by_len.values():
+            for lo in range(0, len(ids), self.chunk_size):
+                part = ids[lo : lo + self.chunk_size]
+                for key, values in self._metrics(_code_matrix([strands[i] for i in part])).items():
+                    out[key][part] = values
+        return out
+
+    def check(self, strands: Sequence) -> np.ndarray:
+        """Violation bitmask per strand (0: passes every check)."""
+        return self._flags(self.metrics(strands))
+
+    def screen(self, codewords, mapper, accumulate: bool = False) -> List[str]:
+        """Map codewords (GF4 symbol rows) to strands that pass the checks where possible.
+
+        Needs a mapper whose map_batch takes per-row seeds (ScramblingMapper)
+        to re-map; with any other mapper strands are only checked and counted.
+        With accumulate=True, `last_stats` adds to the previous call's counts.
+        """
+        if not accumulate:
+            self.reset_stats()
+        rows = [np.asarray(cw, dtype=np.int64) for cw in codewords]
+        seeded = hasattr(mapper, "seeds")
+        strands: List[str] = [""] * len(rows)
+        by_len: Dict[int, List[int]] = {}
+        for i, row in enumerate(rows):
+            by_len.setdefault(len(row), []).append(i)
+        for ids in by_len.values():
+            symbols = np.stack([rows[i] for i in ids]) if ids else np.zeros((0, 0), dtype=np.int64)
+            mapped = mapper.map_batch(symbols, 0) if seeded else mapper.map_batch(symbols)
+            flags = self.check(mapped)
+            for i, s in zip(ids, mapped):
+                strands[i] = s
+            self.last_stats["strands"] += len(ids)
+            self.last_stats["flagged"] += int(np.count_nonzero(flags))
+            for bit, name in FLAG_NAMES.items():
+                self.last_stats[name] += int(np.count_nonzero(flags & bit))
+            if not seeded:
+                self.last_stats["unresolved"] += int(np.count_nonzero(flags))
+                continue
+
+            # re-map what still fails with the next seed, keeping the best try
+            seeds = min(mapper.seeds, self.max_seeds or mapper.seeds)
+            pending = np.flatnonzero(flags)
+            best = _popcount(flags[pending])
+            for seed in range(1, seeds):
+                if not pending.size:
+                    break
+                self.last_stats["tries"] += len(pending)
+                retry = mapper.map_batch(symbols[pending], seed)
+                bad = _popcount(self.check(retry))
+                for j in np.flatnonzero(bad < best).tolist():
+                    strands[ids[pending[j]]] = retry[j]
+                best = np.minimum(best, bad)
+                keep = best > 0
+                self.last_stats["remapped"] += int(np.count_nonzero(~keep))
+                pending, best = pending[keep], best[keep]
+            self.last_stats["unresolved"] += len(pending)
+        return strands
+
+
+def _popcount(flags: np.ndarray) -> np.ndarray:
+    return np.unpackbits(flags.astype(np.uint8)[:, None], axis=1).sum(axis=1)
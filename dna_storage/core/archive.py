@@ -0,0 +1,322 @@
+"""Multi-file archives: many files in one oligo pool, plus a redundant manifest.
+
+Strand ids of an archive pool:
+
+    0 .. copies-1                 superblock, one copy per strand
+    copies .. first_id-1          `copies` copies of the manifest, m strands each
+    first_id ..                   file data (see layout.StrandLayout)
+
+The superblock holds a magic, the format version, the number of manifest
+copies and the length and CRC-32 of the manifest (zlib-compressed Manifest
+JSON: names, sizes, strand ranges and BLAKE2b checksums). A reader finds the
+first superblock that decodes, rebuilds the manifest strand by strand from
+whichever copy decodes, then decodes only the strands of the files it is
+asked for (RandomAccessReader), so verifying or extracting one file costs
+its own strands, not the pool's.
+
+Files start on strand boundaries, so no strand is shared by two files; an
+outer code (outer_k/outer_n) protects the data strands as in encode_files.
+With a compressor, files are stored as BlockCompressor streams (flagged in
+the manifest) and decompressed on extraction. With dedup_chunk_size, only
+distinct content-defined chunks are stored and the manifest lists each
+file's chunks.
+"""
+
+import multiprocessing
+import os
+import struct
+import zlib
+from math import ceil
+from typing import Dict, List, Mapping, Sequence, Tuple
+
+from dna_storage.core.layout import Manifest, RandomAccessReader, file_checksum, layout_files
+from dna_storage.utils.dedup import Deduplicator
+
+MAGIC = b"DNAA"
+ARCHIVE_VERSION = 1
+# magic, version, manifest copies, reserved, manifest bytes, manifest crc32
+_SUPERBLOCK = struct.Struct("<4sBBHII")
+
+# per-process inner encoder/mapper, installed once by the pool initializer
+_worker_encoder = None
+_worker_mapper = None
+
+
+def _init_worker(encoder, mapper) -> None:
+    global _worker_encoder, _worker_mapper
+    _worker_encoder = encoder
+    _worker_mapper = mapper
+
+
+def _encode_rows(encoder, mapper, rows: Sequence[bytes]) -> List[str]:
+    return [mapper.map(encoder.encode(row)) for row in rows]
+
+
+def _worker_encode_rows(rows: Sequence[bytes]) -> List[str]:
+    return _encode_rows(_worker_encoder, _worker_mapper, rows)
+
+
+def _pack_superblock(copies: int, blob: bytes, k: int) -> bytes:
+    return _SUPERBLOCK.pack(MAGIC, ARCHIVE_VERSION, copies, 0, len(blob), zlib.crc32(blob)).ljust(k, b"\0")
+
+
+def _unpack_superblock(row: bytes | None) -> Tuple[int, int, int] | None:
+    """(copies, manifest bytes, crc32) of a decoded superblock row, None if it is not one."""
+    if row is None or len(row) < _SUPERBLOCK.size:
+        return None
+    magic, version, copies, _, size, crc = _SUPERBLOCK.unpack_from(row)
+    if magic != MAGIC or version != ARCHIVE_VERSION or copies == 0:
+        return None
+    return copies, size, crc
+
+
+class ArchiveWriter:
+    """Packs files into the strands of one archive pool.
+
+    Parameters:
+    - encoder, mapper: inner code and base mapping of every strand
+      (encoder.k >= 16, room for the superblock)
+    - outer_k, outer_n: outer code over the data strands (None: none)
+    - manifest_copies: stored copies of the superblock and of the manifest
+    - workers: processes for the inner encoding (0: encode inline); the
+      encoder and mapper must be picklable
+    - compressor: eg. BlockCompressor; every file is compressed on its own
+      (codec "auto" picks a codec per file) and stored compressed when
+      that saves bytes; checksums stay those of the original files
+    - dedup_chunk_size: average chunk size for deduplication (None: off);
+      files are cut into content-defined chunks (utils.dedup), every
+      distinct chunk is stored once (compressed on its own with a
+      compressor) and files become lists of chunk ids in the manifest
+
+    Add files with `add` / `add_path`, then `write()` returns the strands
+    (strand i has id i) and the manifest. With dedup, `last_stats` holds
+    the Deduplicator counts plus strands_saved and bases_saved (duplicate
+    bytes that did not become strands).
+    """
+
+    def __init__(
+        self,
+        encoder,
+        mapper,
+        outer_k: int | None = None,
+        outer_n: int | None = None,
+        manifest_copies: int = 3,
+        workers: int = 0,
+        compressor=None,
+        dedup_chunk_size: int | None = None,
+    ):
+        assert encoder.k >= _SUPERBLOCK.size, f"archives need encoder.k >= {_SUPERBLOCK.size}"
+        assert 1 <= manifest_copies <= 255
+        self.encoder = encoder
+        self.mapper = mapper
+        self.outer_k = outer_k
+        self.outer_n = outer_n
+        self.manifest_copies = manifest_copies
+        self.workers = workers
+        self.compressor = compressor
+        self.dedup_chunk_size = dedup_chunk_size
+        self.last_stats: Dict[str, int] = {}
+        self.files: Dict[str, bytes] = {}
+
+    def add(self, name: str, data: bytes) -> None:
+        if name in self.files:
+            raise ValueError(f"duplicate archive member {name!r}")
+        self.files[name] = bytes(data)
+
+    def add_path(self, path: str, arcname: str | None = None) -> None:
+        """Add a file, or every file under a directory (names relative to it, '/'-separated)."""
+        arcname = arcname if arcname is not None else os.path.basename(os.path.normpath(path))
+        if not os.path.isdir(path):
+            with open(path, "rb") as fh:
+                self.add(arcname, fh.read())
+            return
+        for root, dirs, names in os.walk(path):
+            dirs.sort()
+            for name in sorted(names):
+                full = os.path.join(root, name)
+                rel = os.path.relpath(full, path).replace(os.sep, "/")
+                with open(full, "rb") as fh:
+                    self.add(f"{arcname}/{rel}" if arcname else rel, fh.read())
+
+    def _blobs(self) -> Tuple[Dict[str, bytes], Dict[str, List[int]]]:
+        """(stored blobs by name, recipes): the files, or with dedup the unique chunks named by chunk id."""
+        if not self.dedup_chunk_size:
+            self.last_stats = {}
+            return dict(self.files), {}
+        total = sum(len(data) for data in self.files.values())
+        dedup = Deduplicator(self.dedup_chunk_size, capacity=max(1024, total // self.dedup_chunk_size))
+        recipes = {name: dedup.add(data) for name, data in self.files.items()}
+        self.last_stats = dict(dedup.stats)
+        return {str(cid): chunk for cid, chunk in enumerate(dedup.chunks)}, recipes
+
+    def _compress(self, blobs: Dict[str, bytes]) -> List[str]:
+        """Compress blobs in place where that saves bytes; returns their names."""
+        if self.compressor is None:
+            return []
+        compressed: List[str] = []
+        for name, data in blobs.items():
+            packed = self.compressor.compress(data)
+            if len(packed) < len(data):
+                blobs[name] = packed
+                compressed.append(name)
+        return compressed
+
+    def _layout(self, blobs, compressed, recipes, first_id: int) -> Tuple[List[bytes], bytes, Manifest]:
+        """(data rows, compressed manifest, manifest) for data starting at first_id."""
+        # whole files start on strand boundaries; chunks are packed back to back
+        rows, manifest = layout_files(blobs, self.encoder.k, self.outer_k, self.outer_n, not recipes, first_id)
+        checksums = {name: file_checksum(data) for name, data in self.files.items()}
+        if not recipes:
+            manifest.checksums = checksums
+            manifest.compressed = set(compressed)
+        else:
+            manifest = Manifest(
+                manifest.layout,
+                {name: (None, len(data)) for name, data in self.files.items()},
+                checksums,
+                chunks=[manifest.files[str(c)] for c in range(len(blobs))],
+                recipes=recipes,
+                compressed_chunks=[int(c) for c in compressed],
+            )
+        return rows, zlib.compress(manifest.to_json().encode("utf-8"), 9), manifest
+
+    def write(self) -> Tuple[List[str], Manifest]:
+        k, copies = self.encoder.k, self.manifest_copies
+        blobs, recipes = self._blobs()
+        compressed = self._compress(blobs)
+        # the manifest records first_id, which depends on the manifest's own size
+        first_id = copies
+        while True:
+            rows, blob, manifest = self._layout(blobs, compressed, recipes, first_id)
+            m = ceil(len(blob) / k)
+            if first_id == copies * (1 + m):
+                break
+            first_id = copies * (1 + m)
+
+        manifest_rows = [blob[i : i + k].ljust(k, b"\0") for i in range(0, len(blob), k)]
+        pool_rows = [_pack_superblock(copies, blob, k)] * copies + manifest_rows * copies + rows
+        strands = self._encode(pool_rows)
+        if recipes:
+            # duplicate bytes that were not turned into strands (outer parity included)
+            layout = manifest.layout
+            rows_saved = (self.last_stats["bytes"] - self.last_stats["unique_bytes"]) / k
+            if layout.outer_k:
+                rows_saved *= layout.outer_n / layout.outer_k
+            self.last_stats["strands_saved"] = int(rows_saved)
+            self.last_stats["bases_saved"] = int(rows_saved * len(strands[-1]))
+        return strands, manifest
+
+    def _encode(self, rows: List[bytes]) -> List[str]:
+        if not self.workers or len(rows) < 2:
+            return _encode_rows(self.encoder, self.mapper, rows)
+        from concurrent.futures import ProcessPoolExecutor
+
+        size = max(1, ceil(len(rows) / (4 * self.workers)))
+        chunks = [rows[i : i + size] for i in range(0, len(rows), size)]
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.encoder, self.mapper),
+        ) as pool:
+            return [s for part in pool.map(_worker_encode_rows, chunks) for s in part]
+
+
+class ArchiveReader(RandomAccessReader):
+    """Lists, verifies and extracts the files of an archive pool.
+
+    `reads`, `decoder`, `aligner` and `stage` are as for RandomAccessReader
+    (clusters indexed by strand id). The manifest is decoded on construction;
+    ValueError if no superblock within the first `max_copies` strands
+    decodes or no consistent manifest can be rebuilt.
+    """
+
+    def __init__(self, reads, decoder, aligner=None, stage: str = "reads", max_copies: int = 8):
+        super().__init__(reads, None, decoder, aligner, stage)
+        self.set_manifest(self._read_manifest(max_copies))
+
+    def _read_manifest(self, max_copies: int) -> Manifest:
+        k = self.decoder.k
+        header = None
+        for sid in range(max_copies):
+            header = _unpack_superblock(self.decode_strands([sid])[sid])
+            if header is not None:
+                break
+        if header is None:
+            raise ValueError("no archive superblock found")
+        copies, size, crc = header
+        m = ceil(size / k)
+        ids = [[copies + c * m + j for j in range(m)] for c in range(copies)]
+
+        # first decodable copy of every manifest strand
+        rows: List[bytes | None] = [None] * m
+        decoded: Dict[int, bytes | None] = {}
+        for c in range(copies):
+            todo = [ids[c][j] for j in range(m) if rows[j] is None]
+            if not todo:
+                break
+            decoded.update(self.decode_strands(todo))
+            rows = [rows[j] if rows[j] is not None else decoded.get(ids[c][j]) for j in range(m)]
+        blob = b"".join(r or bytes(k) for r in rows)[:size]
+        if None in rows or zlib.crc32(blob) != crc:
+            # a miscorrected strand: take the majority of all copies of each strand
+            decoded.update(self.decode_strands([sid for copy in ids for sid in copy if sid not in decoded]))
+            rows = [_majority([decoded[ids[c][j]] for c in range(copies)]) for j in range(m)]
+            blob = b"".join(r or bytes(k) for r in rows)[:size]
+            if None in rows or zlib.crc32(blob) != crc:
+                raise ValueError("archive manifest could not be recovered")
+        return Manifest.from_json(zlib.decompress(blob).decode("utf-8"))
+
+    def names(self) -> List[str]:
+        return list(self.manifest.files)
+
+    def extract(self, name: str, verify: bool = True) -> bytes:
+        """Contents of member `name`; ValueError if it cannot be decoded or fails its checksum."""
+        if name not in self.manifest.files:
+            raise ValueError(f"no archive member {name!r}")
+        data = self.read_file(name)
+        expected = self.manifest.checksums.get(name)
+        if verify and expected is not None and file_checksum(data) != expected:
+            raise ValueError(f"checksum mismatch for {name!r}")
+        return data
+
+    def verify(self, names: Sequence[str] | None = None) -> Dict[str, bool]:
+        """name -> whether the member decodes and matches its checksum (all members by default)."""
+        out: Dict[str, bool] = {}
+        for name in names if names is not None else self.names():
+            try:
+                self.extract(name)
+                out[name] = True
+            except ValueError:
+                out[name] = False
+        return out
+
+    def extract_all(self, directory: str, names: Sequence[str] | None = None) -> List[str]:
+        """Write members under `directory`; returns the written paths."""
+        root = os.path.abspath(directory)
+        paths = []
+        for name in names if names is not None else self.names():
+            path = os.path.abspath(os.path.join(root, *name.split("/")))
+            if os.path.commonpath([root, path]) != root:
+                raise ValueError(f"archive member {name!r} escapes {directory!r}")
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as fh:
+                fh.write(self.extract(name))
+            paths.append(path)
+        return paths
+
+
+def _majority(rows: Sequence[bytes | None]) -> bytes | None:
+    counts: Dict[bytes, int] = {}
+    for r in rows:
+        if r is not None:
+            counts[r] = counts.get(r, 0) + 1
+    return max(counts, key=counts.get) if counts else None
+
+
+def write_archive(files: Mapping[str, bytes], encoder, mapper, **kwargs) -> Tuple[List[str], Manifest]:
+    """Strands and manifest of an archive holding `files` (kwargs as for ArchiveWriter)."""
+    writer = ArchiveWriter(encoder, mapper, **kwargs)
+    for name, data in files.items():
+        writer.add(name, data)
+    return writer.write()
@@ -0,0 +1,203 @@
+import os
+import struct
+from typing import IO, Iterable, List, Sequence
+
+import numpy as np
+
+from dna_storage.utils.packed import PackedSequence
+from dna_storage.utils.reads import QualityRead
+
+# checkpointed pipeline stages, in pipeline order
+STAGES = ("messages", "strands", "reads", "consensus")
+
+# item kinds; _QUALITY is or-ed in when per-base qualities follow the payload
+_RAW = 0
+_PACKED = 1
+_TEXT = 2
+_QUALITY = 0x80
+
+_ITEM = struct.Struct("<BI")  # kind, length (bytes or bases)
+_COUNT = struct.Struct("<I")  # items per record
+_ACGT = frozenset("ACGT")
+
+
+def _encode_item(item) -> bytes:
+    if isinstance(item, (bytes, bytearray)):
+        return _ITEM.pack(_RAW, len(item)) + bytes(item)
+    if isinstance(item, PackedSequence):
+        return _ITEM.pack(_PACKED, len(item)) + item.data
+    quality = getattr(item, "quality", None)
+    flag = _QUALITY if quality is not None else 0
+    if set(item) <= _ACGT:
+        out = _ITEM.pack(_PACKED | flag, len(item)) + PackedSequence.from_str(item).data
+    else:
+        # reads with N or other symbols are kept verbatim
+        out = _ITEM.pack(_TEXT | flag, len(item)) + item.encode("ascii", "replace")
+    if quality is not None:
+        out += np.asarray(quality, dtype=np.uint8).tobytes()
+    return out
+
+
+def _decode_record(buf: bytes, packed: bool) -> list:
+    (count,) = _COUNT.unpack_from(buf, 0)
+    pos = _COUNT.size
+    items = []
+    for _ in range(count):
+        kind, length = _ITEM.unpack_from(buf, pos)
+        pos += _ITEM.size
+        base = kind & ~_QUALITY
+        if base == _RAW:
+            item = buf[pos : pos + length]
+            pos += length
+        elif base == _PACKED:
+            nbytes = (length + 3) // 4
+            item = PackedSequence(buf[pos : pos + nbytes], length)
+            pos += nbytes
+            if not packed or kind & _QUALITY:
+                item = str(item)
+        else:
+            item = buf[pos : pos + length].decode("ascii")
+            pos += length
+        if kind & _QUALITY:
+            item = QualityRead(item, np.frombuffer(buf, dtype=np.uint8, count=length, offset=pos).copy())
+            pos += length
+        items.append(item)
+    return items
+
+
+class StageWriter:
+    """Appends records to one stage of a CheckpointStore.
+
+    A record is a list of items (bytes, DNA strings or PackedSequence); the
+    pipeline writes one record per strand. Each record is flushed and its
+    end offset appended to the index before `append` returns, so after a
+    crash every indexed record is complete.
+    """
+
+    def __init__(self, data: IO[bytes], index: IO[bytes], done_path: str, offset: int):
+        self._data = data
+        self._index = index
+        self._done_path = done_path
+        self._offset = offset
+
+    def append(self, items: Sequence) -> None:
+        payload = _COUNT.pack(len(items)) + b"".join(_encode_item(it) for it in items)
+        self._data.write(payload)
+        self._data.flush()
+        self._offset += len(payload)
+        self._index.write(struct.pack("<Q", self._offset))
+        self._index.flush()
+
+    def close(self, complete: bool = True) -> None:
+        for fh in (self._data, self._index):
+            os.fsync(fh.fileno())
+            fh.close()
+        if complete:
+            with open(self._done_path, "w", encoding="utf-8") as fh:
+                fh.write("done\n")
+
+    def __enter__(self) -> "StageWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        # a stage interrupted by an exception stays incomplete (resumable)
+        self.close(complete=exc_type is None)
+
+
+class CheckpointStore:
+    """On-disk store for intermediate pipeline stage outputs.
+
+    Layout per stage in `directory`:
+    - <stage>.bin: records back to back; a record is an item count followed
+      by items (kind, length, payload). DNA is stored 2 bits per base
+      (reads with other symbols as text), qualities as one byte per base
+    - <stage>.idx: little-endian uint64 end offset of every record, so any
+      record range is loaded with a single seek and read
+    - <stage>.done: present once the stage was written completely
+
+    Starting a stage from scratch invalidates all later stages (their
+    outputs were derived from the old data).
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, stage: str, ext: str) -> str:
+        assert stage in STAGES, f"unknown stage {stage!r}"
+        return os.path.join(self.directory, f"{stage}.{ext}")
+
+    def _ends(self, stage: str) -> np.ndarray:
+        path = self._path(stage, "idx")
+        if not os.path.exists(path):
+            return np.zeros(0, dtype=np.uint64)
+        with open(path, "rb") as fh:
+            raw = fh.read()
+        # ignore a torn trailing entry
+        return np.frombuffer(raw[: len(raw) - len(raw) % 8], dtype="<u8")
+
+    def is_complete(self, stage: str) -> bool:
+        return os.path.exists(self._path(stage, "done"))
+
+    def count(self, stage: str) -> int:
+        """Number of complete records stored for `stage`."""
+        return len(self._ends(stage))
+
+    def latest(self) -> str | None:
+        """First stage that is not complete (None when all are)."""
+        for stage in STAGES:
+            if not self.is_complete(stage):
+                return stage
+        return None
+
+    def invalidate(self, stage: str) -> None:
+        """Delete `stage` and every later stage."""
+        for s in STAGES[STAGES.index(stage) :]:
+            for ext in ("done", "idx", "bin"):
+                path = self._path(s, ext)
+                if os.path.exists(path):
+                    os.remove(path)
+
+    def writer(self, stage: str, resume: bool = False) -> StageWriter:
+        """Open `stage` for appending records.
+
+        resume=False starts the stage (and invalidates later ones); resume=True
+        keeps the complete records written so far and appends after them.
+        """
+        if not resume:
+            self.invalidate(stage)
+        else:
+            later = STAGES[STAGES.index(stage) + 1 :]
+            if later:
+                self.invalidate(later[0])
+        done = self._path(stage, "done")
+        if os.path.exists(done):
+            os.remove(done)
+        ends = self._ends(stage)
+        offset = int(ends[-1]) if len(ends) else 0
+        data = open(self._path(stage, "bin"), "ab")
+        # drop a partially written record and torn index entry
+        data.truncate(offset)
+        index = open(self._path(stage, "idx"), "ab")
+        index.truncate(8 * len(ends))
+        return StageWriter(data, index, done, offset)
+
+    def save(self, stage: str, records: Iterable[Sequence]) -> None:
+        """Write a whole stage and mark it complete."""
+        with self.writer(stage) as w:
+            for rec in records:
+                w.append(rec)
+
+    def load(self, stage: str, start: int = 0, stop: int | None = None, packed: bool = False) -> List[list]:
+        """Records [start, stop) of `stage`; DNA as str (or PackedSequence if packed)."""
+        ends = self._ends(stage)
+        stop = len(ends) if stop is None else min(stop, len(ends))
+        if start >= stop:
+            return []
+        lo = int(ends[start - 1]) if start > 0 else 0
+        hi = int(ends[stop - 1])
+        with open(self._path(stage, "bin"), "rb") as fh:
+            fh.seek(lo)
+            buf = fh.read(hi - lo)
+        bounds = [0] + [int(e) - lo for e in ends[start:stop]]
+        return [_decode_record(buf[a:b], packed) for a, b in zip(bounds[:-1], bounds[1:])]
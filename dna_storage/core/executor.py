@@ -0,0 +1,179 @@
+import multiprocessing
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+from dna_storage.core.pipeline import Pipeline
+from dna_storage.utils.diagnostics import DECODED, FAILED, DecodeStatus
+
+# marker closing a stage queue
+_DONE = object()
+
+# per-process aligner/decoder, installed once by the pool initializer
+_worker_aligner = None
+_worker_decoder = None
+
+
+class _StageError:
+    def __init__(self, exc: BaseException):
+        self.exc = exc
+
+
+def _init_worker(aligner, decoder) -> None:
+    global _worker_aligner, _worker_decoder
+    _worker_aligner = aligner
+    _worker_decoder = decoder
+
+
+def _align_decode(aligner, decoder, reads: List[str]) -> Tuple[bytes, List[tuple]]:
+    """Decoded bytes plus the decoder's (status, corrected, erased) per read."""
+    if aligner is not None:
+        reads = list(aligner.align(reads))[:1]
+    data = decoder.decode(reads)
+    status = getattr(decoder, "last_status", None)
+    if status is None:
+        return data, [(DECODED if data else FAILED, 0, 0)]
+    return data, [rec[1:] for rec in status]
+
+
+def _worker_align_decode(reads: List[str]) -> Tuple[bytes, List[tuple]]:
+    return _align_decode(_worker_aligner, _worker_decoder, reads)
+
+
+class ConcurrentPipeline(Pipeline):
+    """Pipeline that overlaps its stages instead of running them one after another.
+
+    Stages and how they run:
+    - reader thread: `inputter.read()` feeds a bounded queue of messages
+    - simulation thread: encode -> map -> channel, one strand at a time, so
+      every strand's reads are known without guessing copy counts (the
+      channel stays in a single thread, keeping RNG-driven simulators on
+      one random stream)
+    - align + decode per strand: inline, or in a pool of `workers` processes
+      with at most `max_pending` strands in flight
+    - the decoded payload is written by a background thread while the
+      comparison report is computed
+
+    Queues between stages hold at most `queue_size` items, so memory stays
+    bounded for large inputs. With workers > 0 the aligner and decoder are
+    copied into each worker process (they must be picklable) and state they
+    record, eg. `AdaptiveConsensusAligner.reads_used`, stays in the workers;
+    per-strand decode statuses are sent back and collected in `last_status`.
+    """
+
+    def __init__(
+        self,
+        *args,
+        workers: int = 0,
+        queue_size: int = 64,
+        max_pending: Optional[int] = None,
+        **kwargs,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        assert self.checkpoint is None, "ConcurrentPipeline does not write checkpoints"
+        self.workers = workers
+        self.queue_size = queue_size
+        self.max_pending = max_pending if max_pending is not None else max(1, 4 * workers)
+
+    def _read_stage(self, out_q: queue.Queue) -> None:
+        try:
+            # a compressor needs the whole input before the first message
+            messages = self._compress(list(self.inputter.read())) if self.compressor else self.inputter.read()
+            for m in messages:
+                out_q.put(m)
+        except BaseException as exc:
+            out_q.put(_StageError(exc))
+        out_q.put(_DONE)
+
+    def _simulate_stage(self, in_q: queue.Queue, out_q: queue.Queue, messages: List[bytes]) -> None:
+        try:
+            if self.screener is not None:
+                self.screener.reset_stats()
+            while True:
+                m = in_q.get()
+                if m is _DONE:
+                    out_q.put(m)
+                    return
+                if isinstance(m, _StageError):
+                    # pass it on; the reader still closes its queue with _DONE
+                    out_q.put(m)
+                    continue
+                messages.append(m)
+                # screened strand by strand here; screener stats add up over the run
+                strand = self._map_all([self.encoder.encode(m)], accumulate=True)[0]
+                out_q.put(list(self.channel.transmit([strand])))
+        except BaseException as exc:
+            out_q.put(_StageError(exc))
+            # drain the reader so it is not left blocked on a full queue
+            while in_q.get() is not _DONE:
+                pass
+            out_q.put(_DONE)
+
+    def run(self) -> object:
+        msg_q: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        read_q: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        messages: List[bytes] = []
+
+        threads = [
+            threading.Thread(target=self._read_stage, args=(msg_q,), daemon=True),
+            threading.Thread(target=self._simulate_stage, args=(msg_q, read_q, messages), daemon=True),
+        ]
+        for t in threads:
+            t.start()
+
+        pool = None
+        if self.workers > 0:
+            # spawn: forking while the stage threads run is unsafe
+            pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.aligner, self.decoder),
+            )
+
+        results: List[Tuple[bytes, List[tuple]]] = []
+        pending: deque = deque()
+        error: Optional[BaseException] = None
+        try:
+            while True:
+                item = read_q.get()
+                if item is _DONE:
+                    break
+                if isinstance(item, _StageError):
+                    error = item.exc
+                    continue
+                if pool is None:
+                    results.append(_align_decode(self.aligner, self.decoder, item))
+                    continue
+                pending.append(pool.submit(_worker_align_decode, item))
+                while len(pending) >= self.max_pending:
+                    results.append(pending.popleft().result())
+            while pending:
+                results.append(pending.popleft().result())
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+        for t in threads:
+            t.join()
+        if error is not None:
+            raise error
+
+        self.last_status = DecodeStatus()
+        for sid, (_, records) in enumerate(results):
+            for code, corrected, erased in records:
+                self.last_status.record(code, corrected, erased, strand=sid)
+
+        original_all = b"".join(messages)
+        decoded = self._trim(original_all, b"".join(data for data, _ in results))
+        original_all, decoded = self._decompress(original_all, decoded)
+
+        # write in the background while the (quadratic) comparison runs
+        writer = threading.Thread(target=self.outputter.write, args=(decoded,))
+        writer.start()
+        cmp, report = self._compare(original_all, decoded)
+        writer.join()
+
+        self._print_report(report)
+        return cmp
@@ -0,0 +1,418 @@
+"""Addressable strand layout, manifest and random-access decoding.
+
+The payload (one file or several concatenated) is cut into data strands of
+k bytes, so byte offset o lives in data strand o // k. With an outer code
+(ReedSolomon16Encoder across strands) data strands are grouped into blocks
+of outer_k; block b is stored as outer_n consecutive strand ids: its data
+strands followed by outer_n - outer_k parity strands. The last block is
+shortened (fewer data strands, same parity; the missing data rows are
+virtual zero rows that are never stored).
+
+A Manifest records the layout and where every file sits, as JSON.
+RandomAccessReader uses it to decode a byte range from just the strands
+that hold it, loading only their read clusters (one record per strand id,
+eg. the "reads" stage of a CheckpointStore). Strands that fail their inner
+decode are repaired from the rest of their outer block, so a request costs
+O(its strands), plus one block per failure.
+"""
+
+import hashlib
+import json
+from math import ceil
+from typing import Dict, Iterable, List, Mapping, Sequence, Tuple
+
+from dna_storage.components.compressor.block_compressor import BlockCompressor
+from dna_storage.components.decoder.reed_solomon16 import ReedSolomon16Decoder
+from dna_storage.components.encoder.reed_solomon16 import ReedSolomon16Encoder
+from dna_storage.core.checkpoint import CheckpointStore
+from dna_storage.utils.diagnostics import DECODED, FAILED, MISSING, DecodeStatus
+from dna_storage.utils.packed import as_str
+
+MANIFEST_VERSION = 1
+
+
+class StrandLayout:
+    """Maps byte offsets of a payload of `size` bytes to strand ids.
+
+    Parameters:
+    - k: payload bytes per strand (the inner encoder's message length)
+    - size: payload bytes
+    - outer_k, outer_n: outer-code block shape (None: no outer code)
+    - first_id: strand id of the first payload strand (eg. after an archive header)
+    """
+
+    def __init__(
+        self,
+        k: int,
+        size: int,
+        outer_k: int | None = None,
+        outer_n: int | None = None,
+        first_id: int = 0,
+    ):
+        assert k >= 1 and size >= 0 and first_id >= 0
+        if (outer_k is None) != (outer_n is None):
+            raise ValueError("outer_k and outer_n must be given together")
+        if outer_k is not None:
+            assert 1 <= outer_k < outer_n, "need 1 <= outer_k < outer_n"
+            # outer code symbols are 16 bit: every row must have an even length
+            assert k % 2 == 0, "k must be even with an outer code"
+        self.k = k
+        self.size = size
+        self.outer_k = outer_k
+        self.outer_n = outer_n
+        self.first_id = first_id
+        self.data_strands = ceil(size / k)
+
+    @property
+    def blocks(self) -> int:
+        return ceil(self.data_strands / self.outer_k) if self.outer_k else 0
+
+    @property
+    def total_strands(self) -> int:
+        return self.data_strands + self.blocks * (self.outer_n - self.outer_k if self.outer_k else 0)
+
+    def strand_id(self, data_index: int) -> int:
+        """Strand id of data strand `data_index` (the one holding bytes data_index * k ...)."""
+        if not self.outer_k:
+            return self.first_id + data_index
+        block, row = divmod(data_index, self.outer_k)
+        return self.first_id + block * self.outer_n + row
+
+    def data_indices(self, offset: int, length: int) -> range:
+        """Data strands that hold bytes [offset, offset + length)."""
+        if offset < 0 or length < 0 or offset + length > self.size:
+            raise ValueError(f"range [{offset}, {offset + length}) outside the payload of {self.size} bytes")
+        if length == 0:
+            return range(0)
+        return range(offset // self.k, (offset + length - 1) // self.k + 1)
+
+    def strands_for(self, offset: int, length: int) -> List[int]:
+        return [self.strand_id(i) for i in self.data_indices(offset, length)]
+
+    def block_rows(self, block: int) -> Tuple[range, List[int]]:
+        """(data indices, stored strand ids of data + parity rows) of an outer block."""
+        lo = block * self.outer_k
+        hi = min(lo + self.outer_k, self.data_strands)
+        first = self.first_id + block * self.outer_n
+        parity = self.outer_n - self.outer_k
+        return range(lo, hi), list(range(first, first + (hi - lo) + parity))
+
+    def to_dict(self) -> Dict[str, object]:
+        return {"k": self.k, "size": self.size, "outer_k": self.outer_k, "outer_n": self.outer_n, "first_id": self.first_id}
+
+    @classmethod
+    def from_dict(cls, d: Mapping[str, object]) -> "StrandLayout":
+        return cls(d["k"], d["size"], d.get("outer_k"), d.get("outer_n"), d.get("first_id", 0))
+
+
+class Manifest:
+    """Layout plus the files of a payload: name -> offset, size, strand-id range, checksum and compression.
+
+    A deduplicated file has no offset of its own: `recipes` lists the ids of
+    its chunks in `chunks`, a table of (offset, stored size) ranges shared
+    by all files (see utils.dedup).
+    """
+
+    def __init__(
+        self,
+        layout: StrandLayout,
+        files: Mapping[str, Tuple[int | None, int]] | None = None,
+        checksums: Mapping[str, str] | None = None,
+        compressed: Iterable[str] = (),
+        chunks: Sequence[Tuple[int, int]] = (),
+        recipes: Mapping[str, List[int]] | None = None,
+        compressed_chunks: Iterable[int] = (),
+    ):
+        self.layout = layout
+        # name -> (offset, size) in payload order; offset None for chunked files
+        self.files: Dict[str, Tuple[int | None, int]] = dict(files or {})
+        # name -> hex digest (see file_checksum) of the original file, optional
+        self.checksums: Dict[str, str] = dict(checksums or {})
+        # files stored as BlockCompressor streams
+        self.compressed = set(compressed)
+        # chunk id -> (offset, size); name -> chunk ids of a deduplicated file
+        self.chunks: List[Tuple[int, int]] = [tuple(c) for c in chunks]
+        self.recipes: Dict[str, List[int]] = {name: list(ids) for name, ids in (recipes or {}).items()}
+        # chunks stored as BlockCompressor streams
+        self.compressed_chunks = set(compressed_chunks)
+
+    def file_strands(self, name: str) -> List[int]:
+        if name in self.recipes:
+            ids = {sid for c in set(self.recipes[name]) for sid in self.layout.strands_for(*self.chunks[c])}
+            return sorted(ids)
+        offset, size = self.files[name]
+        return self.layout.strands_for(offset, size)
+
+    def to_json(self) -> str:
+        files = []
+        for name, (offset, size) in self.files.items():
+            if name in self.recipes:
+                entry = {"name": name, "size": size, "chunks": self.recipes[name]}
+            else:
+                ids = self.layout.strands_for(offset, size)
+                entry = {"name": name, "offset": offset, "size": size, "strands": [ids[0], ids[-1]] if ids else []}
+            if name in self.checksums:
+                entry["checksum"] = self.checksums[name]
+            if name in self.compressed:
+                entry["compressed"] = True
+            files.append(entry)
+        d = {"version": MANIFEST_VERSION, "layout": self.layout.to_dict(), "files": files}
+        if self.chunks:
+            d["chunks"] = [list(c) for c in self.chunks]
+            d["compressed_chunks"] = sorted(self.compressed_chunks)
+        return json.dumps(d, indent=1)
+
+    @classmethod
+    def from_json(cls, text: str) -> "Manifest":
+        d = json.loads(text)
+        if d.get("version") != MANIFEST_VERSION:
+            raise ValueError(f"unsupported manifest version {d.get('version')!r}")
+        files = {f["name"]: (f.get("offset"), f["size"]) for f in d["files"]}
+        checksums = {f["name"]: f["checksum"] for f in d["files"] if "checksum" in f}
+        compressed = [f["name"] for f in d["files"] if f.get("compressed")]
+        recipes = {f["name"]: f["chunks"] for f in d["files"] if "chunks" in f}
+        return cls(
+            StrandLayout.from_dict(d["layout"]),
+            files,
+            checksums,
+            compressed,
+            d.get("chunks", ()),
+            recipes,
+            d.get("compressed_chunks", ()),
+        )
+
+    def save(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as fh:
+            fh.write(self.to_json())
+
+    @classmethod
+    def load(cls, path: str) -> "Manifest":
+        with open(path, "r", encoding="utf-8") as fh:
+            return cls.from_json(fh.read())
+
+
+def file_checksum(data: bytes) -> str:
+    """Hex digest stored in manifests (128-bit BLAKE2b)."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def add_outer_parity(rows: List[bytes], layout: StrandLayout) -> List[bytes]:
+    """Data rows (k bytes each, in data-index order) -> stored rows in strand-id order."""
+    if not layout.outer_k:
+        return list(rows)
+    outer = ReedSolomon16Encoder(n=layout.outer_n, k=layout.outer_k)
+    stored: List[bytes] = []
+    for b in range(layout.blocks):
+        data_idx, _ = layout.block_rows(b)
+        block = rows[data_idx.start : data_idx.stop]
+        # a shortened last block is padded with virtual zero rows
+        coded = outer.encode_rows(block + [bytes(layout.k)] * (layout.outer_k - len(block)))
+        stored.extend(block + coded[layout.outer_k :])
+    return stored
+
+
+def layout_files(
+    files: Mapping[str, bytes],
+    k: int,
+    outer_k: int | None = None,
+    outer_n: int | None = None,
+    align: bool = False,
+    first_id: int = 0,
+) -> Tuple[List[bytes], Manifest]:
+    """Lay out `files` back to back in rows of k bytes.
+
+    Returns the stored rows in strand-id order (data rows plus outer parity
+    rows with outer_k/outer_n) and the manifest. With align=True every file
+    starts on a strand boundary (zero padding in between), so no strand
+    mixes files.
+    """
+    entries: Dict[str, Tuple[int, int]] = {}
+    parts: List[bytes] = []
+    pos = 0
+    for name, data in files.items():
+        entries[name] = (pos, len(data))
+        pad = (-len(data)) % k if align else 0
+        parts.append(bytes(data) + bytes(pad))
+        pos += len(data) + pad
+    payload = b"".join(parts)
+    layout = StrandLayout(k, len(payload), outer_k, outer_n, first_id)
+
+    rows = [payload[i : i + k].ljust(k, b"\0") for i in range(0, len(payload), k)]
+    checksums = {name: file_checksum(data) for name, data in files.items()}
+    return add_outer_parity(rows, layout), Manifest(layout, entries, checksums)
+
+
+def encode_files(
+    files: Mapping[str, bytes],
+    encoder,
+    mapper,
+    outer_k: int | None = None,
+    outer_n: int | None = None,
+    align: bool = False,
+    first_id: int = 0,
+) -> Tuple[List[str], Manifest]:
+    """Lay out `files` (see `layout_files`) and encode them into strands.
+
+    `encoder` is the inner code (encode(message) -> GF4 symbols, message
+    length encoder.k); with outer_k/outer_n every block also gets parity
+    strands from ReedSolomon16Encoder. Strand i of the result has id
+    first_id + i.
+    """
+    rows, manifest = layout_files(files, encoder.k, outer_k, outer_n, align, first_id)
+    return [mapper.map(encoder.encode(row)) for row in rows], manifest
+
+
+class RandomAccessReader:
+    """Decode byte ranges or single files from per-strand read clusters.
+
+    Parameters:
+    - reads: CheckpointStore (records of `stage`, one per strand id), or a
+      sequence / mapping strand id -> list of reads
+    - manifest: Manifest of the stored payload (None: only `decode_strands`
+      works until one is set with `set_manifest`)
+    - decoder: inner decoder (decode([read]) -> k bytes; shorter output
+      means the strand failed), eg. SystematicReedSolomonDecoder, which
+      detects uncorrectable strands
+    - aligner: consensus per cluster (None: decode the first read)
+    - stage: checkpoint stage holding the clusters ("reads" or "consensus")
+
+    `last_stats` holds counts for the latest request: strands (decoded),
+    reads (loaded) and repaired_blocks; `last_status` (a DecodeStatus keyed
+    by strand id) the inner-decode outcome of every strand it touched.
+    """
+
+    def __init__(self, reads, manifest: Manifest | None, decoder, aligner=None, stage: str = "reads"):
+        self.reads = reads
+        self.decoder = decoder
+        self.aligner = aligner
+        self.stage = stage
+        self.last_stats: Dict[str, int] = {}
+        self.last_status = DecodeStatus()
+        self.manifest = self.layout = self._outer = None
+        if manifest is not None:
+            self.set_manifest(manifest)
+
+    def set_manifest(self, manifest: Manifest) -> None:
+        self.manifest = manifest
+        self.layout = manifest.layout
+        self._outer = (
+            ReedSolomon16Decoder(n=self.layout.outer_n, k=self.layout.outer_k) if self.layout.outer_k else None
+        )
+
+    def _reset(self) -> None:
+        self.last_stats = {"strands": 0, "reads": 0, "repaired_blocks": 0}
+        self.last_status = DecodeStatus()
+
+    def _clusters(self, ids: Sequence[int]) -> Dict[int, list]:
+        if isinstance(self.reads, CheckpointStore):
+            out: Dict[int, list] = {}
+            # one seek + read per run of consecutive strand ids
+            for lo, hi in _runs(sorted(set(ids))):
+                for sid, rec in zip(range(lo, hi), self.reads.load(self.stage, lo, hi)):
+                    out[sid] = rec
+            return out
+        if isinstance(self.reads, Mapping):
+            return {sid: list(self.reads.get(sid, ())) for sid in ids}
+        return {sid: list(self.reads[sid]) if sid < len(self.reads) else [] for sid in ids}
+
+    def decode_strands(self, ids: Sequence[int]) -> Dict[int, bytes | None]:
+        """Inner-decode the strands `ids`: strand id -> k bytes, or None when it failed or has no reads."""
+        self._reset()
+        return self._decode_strands(ids)
+
+    def _decode_strands(self, ids: Sequence[int]) -> Dict[int, bytes | None]:
+        k = self.decoder.k
+        clusters = self._clusters(ids)
+        out: Dict[int, bytes | None] = {}
+        for sid in ids:
+            reads = clusters.get(sid) or []
+            self.last_stats["reads"] += len(reads)
+            self.last_stats["strands"] += 1
+            if not reads:
+                self.last_status.record(MISSING, strand=sid)
+                out[sid] = None
+                continue
+            read = as_str(list(self.aligner.align(reads))[0]) if self.aligner is not None else as_str(reads[0])
+            try:
+                msg = self.decoder.decode([read])
+            except ValueError:
+                msg = b""
+            # decoders with a status zero-fill failed strands; others return short output
+            status = getattr(self.decoder, "last_status", None)
+            _, code, corrected, erased = status[0] if status else (sid, DECODED, 0, 0)
+            if len(msg) < k or code == FAILED:
+                self.last_status.record(FAILED, strand=sid)
+                out[sid] = None
+            else:
+                self.last_status.record(code, corrected, erased, strand=sid)
+                out[sid] = msg[:k]
+        return out
+
+    def _repair(self, block: int, known: Dict[int, bytes | None]) -> Dict[int, bytes]:
+        """Recover the data rows of `block` with the outer code; returns data index -> row."""
+        data_idx, ids = self.layout.block_rows(block)
+        todo = [sid for sid in ids if sid not in known]
+        known.update(self._decode_strands(todo))
+        ok = self.layout.outer_k
+        rows = [known[sid] for sid in ids[: len(data_idx)]]
+        # virtual zero rows of a shortened block are always known
+        rows += [bytes(self.layout.k)] * (ok - len(data_idx))
+        rows += [known[sid] for sid in ids[len(data_idx) :]]
+        data = self._outer.decode_rows(rows)
+        self.last_stats["repaired_blocks"] += 1
+        return {i: data[j][: self.layout.k] for j, i in enumerate(data_idx)}
+
+    def _rows(self, indices: Sequence[int]) -> Dict[int, bytes]:
+        """Data rows `indices`, repairing failed ones from their outer block."""
+        ids = [self.layout.strand_id(i) for i in indices]
+        decoded = self._decode_strands(ids)
+        rows = {i: decoded[sid] for i, sid in zip(indices, ids)}
+        failed = [i for i in indices if rows[i] is None]
+        if failed and self._outer is None:
+            raise ValueError(f"strands {[self.layout.strand_id(i) for i in failed]} could not be decoded")
+        for block in sorted({i // self.layout.outer_k for i in failed}):
+            rows.update(self._repair(block, decoded))
+        return rows
+
+    def _slice(self, rows: Dict[int, bytes], offset: int, length: int) -> bytes:
+        indices = self.layout.data_indices(offset, length)
+        payload = b"".join(rows[i] for i in indices)
+        start = offset - indices.start * self.layout.k if indices else 0
+        return payload[start : start + length]
+
+    def decode_range(self, offset: int, length: int) -> bytes:
+        """Bytes [offset, offset + length) of the payload; raises ValueError when they cannot be recovered."""
+        self._reset()
+        return self._slice(self._rows(self.layout.data_indices(offset, length)), offset, length)
+
+    def read_file(self, name: str) -> bytes:
+        """Original contents of `name`: its range or its chunks, decompressed where the manifest says so."""
+        manifest = self.manifest
+        if name not in manifest.recipes:
+            data = self.decode_range(*manifest.files[name])
+            return BlockCompressor().decompress(data) if name in manifest.compressed else data
+        self._reset()
+        recipe = manifest.recipes[name]
+        # adjacent chunks share strands: decode every strand once
+        needed = sorted({i for c in set(recipe) for i in self.layout.data_indices(*manifest.chunks[c])})
+        rows = self._rows(needed)
+        chunks = {}
+        for c in set(recipe):
+            blob = self._slice(rows, *manifest.chunks[c])
+            chunks[c] = BlockCompressor().decompress(blob) if c in manifest.compressed_chunks else blob
+        return b"".join(chunks[c] for c in recipe)
+
+
+def _runs(ids: Iterable[int]) -> Iterable[Tuple[int, int]]:
+    """Half-open ranges of consecutive ids."""
+    lo = prev = None
+    for sid in ids:
+        if lo is None:
+            lo = prev = sid
+        elif sid == prev + 1:
+            prev = sid
+        else:
+            yield lo, prev + 1
+            lo = prev = sid
+    if lo is not None:
+        yield lo, prev + 1
@@ -9,12 +9,30 @@ from dna_storage.core.components import (
     Outputter,
     Aligner,
 )
+from dna_storage.core.checkpoint import STAGES, CheckpointStore
+from dna_storage.components.channel.chained import ChainedChannel
+from dna_storage.utils.compare import compare_bytes, pretty_report
+from dna_storage.utils.oligo_utils import recommend_rs_parameters
+from dna_storage.utils.packed import PackedReadSet, PackedSequence
+
+# stages `run(resume_from=...)` can start at; "decode" reuses saved consensus reads
+RESUME_POINTS = STAGES + ("decode",)
 
 
 class Pipeline:
     """Orchestrate the flow from input -> encode -> map -> channel -> decode -> output.
 
     This class keeps things simple so users can swap implementations for each stage.
+    `channel` may be a list of layers, applied in order (see ChainedChannel);
+    fuse_channels=True lets adjacent layers run as one batched pass.
+    With a `compressor` (eg. BlockCompressor) the input is compressed before
+    encoding, in messages of the inputter's size, and the decoded stream is
+    decompressed before it is compared and written.
+    With a `screener` (eg. StrandScreener) the mapped strands are checked
+    for synthesis constraints and failing ones re-mapped with another seed
+    of a seeded mapper (ScramblingMapper); see `screener.last_stats`.
+    After `run`, `last_status` is the decoder's per-strand DecodeStatus
+    (None when the decoder keeps none).
     """
 
     def __init__(
@@ -22,16 +40,23 @@ class Pipeline:
         inputter: Inputter,
         encoder: Encoder,
         mapper: Mapper,
-        channel: Channel,
+        channel: Channel | List[Channel],
         decoder: Decoder,
         outputter: Outputter,
         aligner: Aligner | None = None,
         oligo_len: int = 150,
         overhead: int = 40,
+        packed: bool = False,
+        checkpoint: CheckpointStore | None = None,
+        fuse_channels: bool = False,
+        compressor=None,
+        screener=None,
     ) -> None:
         self.inputter = inputter
         self.encoder = encoder
         self.mapper = mapper
+        if isinstance(channel, (list, tuple)):
+            channel = ChainedChannel(*channel, fuse=fuse_channels)
         self.channel = channel
         self.decoder = decoder
         self.outputter = outputter
@@ -39,12 +64,21 @@ class Pipeline:
         # optional oligo sizing check (defaults chosen to practical values)
         self.oligo_len = oligo_len
         self.overhead = overhead
+        # carry strands as 2-bit PackedSequence (mapper needs map_packed) and
+        # keep the reads of each strand in one PackedReadSet buffer
+        self.packed = packed
+        # optional on-disk store of stage outputs (see run(resume_from=...))
+        self.checkpoint = checkpoint
+        # optional compress(bytes) / decompress(bytes) stage around the code
+        self.compressor = compressor
+        # optional synthesis-constraint check of the mapped strands
+        self.screener = screener
+        # per-strand decode outcome of the last run (utils.diagnostics)
+        self.last_status = None
 
         # If an encoder exposes 'n' (codeword length in bytes), check whether
         # it fits typical oligo parameters and print a warning if not.
         try:
-            from dna_storage.utils.oligo_utils import recommend_rs_parameters
-
             if hasattr(encoder, "n"):
                 rec = recommend_rs_parameters(self.oligo_len, self.overhead)
                 n_max = rec.get("n_max", 0)
@@ -54,26 +88,53 @@ class Pipeline:
                         f"[pipeline warning] encoder.n={enc_n} may be too large for oligo_len={self.oligo_len} (n_max={n_max}); consider lowering n or increasing oligo_len/ reducing overhead"
                     )
         except Exception:
-            # non-fatal: utilities may not be available or encoder is custom
+            # non-fatal: encoder is custom
             pass
 
-    def run(self) -> object:
+    def run(self, resume_from: str | None = None) -> object:
+        """Run the pipeline and return the comparison dict.
+
+        With a checkpoint store, every stage output (messages, strands, reads
+        per strand, consensus per strand) is saved as it is produced.
+        `resume_from` names the first stage to recompute; earlier stages are
+        loaded from the store. Use "consensus" to re-align saved reads (eg.
+        with a different aligner), "decode" to only decode saved consensus
+        reads, or "latest" to continue after the last completed stage
+        (an interrupted consensus stage continues at the next strand).
+        """
+        start = self._resume_index(resume_from)
+        ckpt = self.checkpoint
+
         # Read messages
-        messages = list(self.inputter.read())
+        if start > 0:
+            messages = [rec[0] for rec in ckpt.load("messages")]
+        else:
+            messages = self._compress(list(self.inputter.read()))
+            self._save("messages", [[m] for m in messages])
 
         # keep a copy of the original concatenated payload so we can trim
         # any decoder-side padding (decoders often reconstruct fixed k-byte
         # chunks and may produce a slightly longer stream).
         original_all = b"".join(messages)
 
-        # Encode each message into codewords
-        codewords = [self.encoder.encode(m) for m in messages]
+        if start > 1:
+            strands = [rec[0] for rec in ckpt.load("strands", packed=self.packed)]
+        else:
+            # Encode each message into codewords
+            codewords = [self.encoder.encode(m) for m in messages]
 
-        # Map codewords to DNA strings
-        strands = [self.mapper.map(cw) for cw in codewords]
+            # Map codewords to DNA strings
+            strands = self._map_all(codewords)
+            self._save("strands", [[st] for st in strands])
 
-        # Transmit through channel
-        reads = list(self.channel.transmit(strands))
+        if start > 2:
+            groups = [self._pack_reads(g) for g in ckpt.load("reads", packed=self.packed)]
+            reads = None
+        else:
+            # Transmit through channel
+            reads = self._collect_reads(self.channel.transmit(strands))
+            groups = self._group_reads(strands, reads)
+            self._save("reads", groups)
 
         # optionally run an aligner if the pipeline provides one
         try:
@@ -82,28 +143,150 @@ class Pipeline:
         except Exception:
             aligner = None
 
-        if aligner is not None:
-            # If there are multiple original strands we try grouping reads by
-            # strand assuming the channel preserved order and produced roughly
-            # equal copies per strand (eg SoupDuplicator). Otherwise fall back
-            # to aligning all reads together.
-            if len(strands) > 0 and len(reads) >= len(strands) and len(reads) % len(strands) == 0:
-                copies = len(reads) // len(strands)
-                grouped = []
-                for i in range(len(strands)):
-                    seg = reads[i * copies : (i + 1) * copies]
-                    # aligner.align returns an iterable of consensus reads for the group
-                    out = list(aligner.align(seg))
-                    if out:
-                        grouped.append(out[0])
-                reads = grouped
-            else:
-                # align all reads together (legacy behaviour)
-                reads = list(aligner.align(reads))
+        if start > 3 and ckpt.is_complete("consensus"):
+            reads = [r for rec in ckpt.load("consensus") for r in rec]
+        elif aligner is not None:
+            # continue a partially written consensus only when resuming "latest"
+            resume = resume_from == "latest" and start == 3
+            reads = self._consensus(aligner, groups, resume)
+        elif reads is None:
+            reads = self._flatten(groups)
 
         # Decode back to bytes
         decoded = self.decoder.decode(reads)
+        self.last_status = getattr(self.decoder, "last_status", None)
+
+        decoded = self._trim(original_all, decoded)
+        original_all, decoded = self._decompress(original_all, decoded)
+        cmp, report = self._compare(original_all, decoded)
+
+        # Output decoded payload
+        self.outputter.write(decoded)
+
+        self._print_report(report)
+        return cmp
+
+    def _resume_index(self, resume_from: str | None) -> int:
+        if resume_from is None:
+            return 0
+        if self.checkpoint is None:
+            raise ValueError("resume_from needs a checkpoint store")
+        if resume_from == "latest":
+            resume_from = self.checkpoint.latest() or "decode"
+        if resume_from not in RESUME_POINTS:
+            raise ValueError(f"resume_from must be one of {RESUME_POINTS + ('latest',)}")
+        start = RESUME_POINTS.index(resume_from)
+        for stage in STAGES[:start]:
+            if stage != "consensus" and not self.checkpoint.is_complete(stage):
+                raise ValueError(f"cannot resume from {resume_from!r}: stage {stage!r} is not checkpointed")
+        return start
+
+    def _save(self, stage: str, records) -> None:
+        if self.checkpoint is not None:
+            self.checkpoint.save(stage, records)
+
+    @staticmethod
+    def _group_reads(strands: List, reads: List) -> List[List]:
+        # If there are multiple original strands we try grouping reads by
+        # strand assuming the channel preserved order and produced roughly
+        # equal copies per strand (eg SoupDuplicator). Otherwise keep all
+        # reads in a single group (aligned together, legacy behaviour).
+        if len(strands) > 0 and len(reads) >= len(strands) and len(reads) % len(strands) == 0:
+            copies = len(reads) // len(strands)
+            return [reads[i * copies : (i + 1) * copies] for i in range(len(strands))]
+        return [reads]
+
+    def _consensus(self, aligner: Aligner, groups: List[List], resume: bool = False) -> List:
+        # one consensus record per group; with several groups only the
+        # first consensus of each is kept
+        keep_first = len(groups) > 1
+        done: List[List] = []
+        writer = None
+        if self.checkpoint is not None:
+            if resume:
+                done = self.checkpoint.load("consensus")
+            writer = self.checkpoint.writer("consensus", resume=resume)
+        try:
+            for grp in groups[len(done) :]:
+                # aligner.align returns an iterable of consensus reads for the group
+                out = list(aligner.align(grp))
+                rec = out[:1] if keep_first else out
+                done.append(rec)
+                if writer is not None:
+                    writer.append(rec)
+        except BaseException:
+            if writer is not None:
+                writer.close(complete=False)
+            raise
+        if writer is not None:
+            writer.close()
+        return [r for rec in done for r in rec]
 
+    def _compress(self, messages: List[bytes]) -> List[bytes]:
+        # compress the whole input and re-cut it into messages of the same size
+        if self.compressor is None or not messages:
+            return messages
+        size = max(len(m) for m in messages)
+        stored = self.compressor.compress(b"".join(messages))
+        return [stored[i : i + size] for i in range(0, len(stored), size)]
+
+    def _decompress(self, original_all: bytes, decoded: bytes):
+        if self.compressor is None:
+            return original_all, decoded
+        original_all = self.compressor.decompress(original_all)
+        try:
+            decoded = self.compressor.decompress(decoded)
+        except ValueError:
+            # neither copy of the stream header survived: nothing is recoverable
+            decoded = b""
+        return original_all, decoded
+
+    def _collect_reads(self, reads: Iterable):
+        # with packed=True, stream the channel output straight into one
+        # PackedReadSet; from the first read that is not a PackedSequence
+        # (eg. a QualityRead) on, fall back to a list
+        if not self.packed:
+            return list(reads)
+        it = iter(reads)
+        other: List = []
+
+        def leading():
+            for r in it:
+                if not isinstance(r, PackedSequence):
+                    other.append(r)
+                    return
+                yield r
+
+        packed = PackedReadSet(leading())
+        if not other:
+            return packed
+        return list(packed) + other + list(it)
+
+    def _flatten(self, groups: List):
+        if groups and all(isinstance(g, PackedReadSet) for g in groups):
+            return PackedReadSet.concat(groups)
+        return [r for grp in groups for r in grp]
+
+    def _pack_reads(self, reads: List):
+        # reads stay a list when not packed, or when they carry qualities
+        # (QualityRead) a PackedReadSet would drop
+        if self.packed and all(isinstance(r, PackedSequence) for r in reads):
+            return PackedReadSet(reads)
+        return reads
+
+    def _map_all(self, codewords: List, accumulate: bool = False) -> List:
+        if self.screener is None:
+            return [self._map(cw) for cw in codewords]
+        # all strands at once: the checks are vectorized over the pool
+        strands = self.screener.screen(codewords, self.mapper, accumulate)
+        return [PackedSequence.from_str(s) for s in strands] if self.packed else strands
+
+    def _map(self, codeword):
+        if self.packed:
+            return self.mapper.map_packed(codeword)
+        return self.mapper.map(codeword)
+
+    def _trim(self, original_all: bytes, decoded: bytes) -> bytes:
         # Trim decoder output to the original payload length; some decoders
         # (eg. RS) always reconstruct fixed k-byte blocks and will produce
         # extra padding for the last block. Trim to match the original input
@@ -113,21 +296,19 @@ class Pipeline:
         except Exception:
             # if slicing fails for some reason, keep original decoded
             pass
+        return decoded
 
+    def _compare(self, original_all: bytes, decoded: bytes):
         # Try comparing with original (concatenate original messages)
         try:
-            from dna_storage.utils.compare import compare_bytes, pretty_report
-
-            # original_all already computed earlier
             cmp = compare_bytes(original_all, decoded)
             report = pretty_report(original_all, decoded)
         except Exception:
             cmp = None
             report = "(compare failed)"
+        return cmp, report
 
-        # Output decoded payload
-        self.outputter.write(decoded)
-
+    def _print_report(self, report: str) -> None:
         # Print comparison summary to stdout (only when outputter isn't silenced)
         try:
             outpath = getattr(self.outputter, "outpath", None)
@@ -135,4 +316,3 @@ class Pipeline:
             outpath = None
         if outpath is None:
             print("--- compare report:\n" + report)
-        return cmp
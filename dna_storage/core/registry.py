@@ -0,0 +1,201 @@
+"""Component registry and declarative pipeline specs.
+
+Components are looked up by category and name. Built-in names are the
+classes exported by each component package (resolved lazily, so naming a
+component imports only its module); `register` adds project-specific ones,
+and any "module.path:Class" string works without registering.
+
+A pipeline spec is a dict (or a JSON / TOML / YAML file) with one entry per
+stage, each a class name or {"type": name, **constructor kwargs}:
+
+    inputter: {type: FileInputter, path: in.txt}
+    compressor: {type: BlockCompressor, codec: auto}     (optional)
+    encoder: {type: ReedSolomonEncoder, n: 39, k: 30}
+    mapper: {type: ScramblingMapper, seed_bases: 2}      (optional)
+    screener: {type: StrandScreener, max_homopolymer: 4} (optional)
+    channel: [{type: SoupDuplicator, copies: 20}, {type: IDSChannel, sub_p: 0.01}]
+    aligner: SimpleAligner
+    decoder: ReedSolomonDecoder
+    pipeline: {oligo_len: 156, overhead: 0, fuse_channels: true}
+
+Unset parameters are filled from earlier stages where the constructor takes
+them: the inputter's chunk_size and the decoder's n/k come from the encoder,
+the decoder gets the mapper. A parameter value that is itself a spec
+({"type": ...}) is built in the same category (eg. RSInnerChannel's inner
+channel).
+"""
+
+import importlib
+import inspect
+import json
+from typing import Dict, List
+
+from dna_storage.core.pipeline import Pipeline
+
+# package whose exports are the built-in components of each category
+CATEGORIES = {
+    "inputter": "dna_storage.components.inputter",
+    "compressor": "dna_storage.components.compressor",
+    "encoder": "dna_storage.components.encoder",
+    "mapper": "dna_storage.components.mapper",
+    "screener": "dna_storage.components.screener",
+    "channel": "dna_storage.components.channel",
+    "aligner": "dna_storage.components.aligner",
+    "decoder": "dna_storage.components.decoder",
+    "outputter": "dna_storage.components.outputter",
+}
+
+# user registrations: category -> name -> class or "module:Class"
+_REGISTERED: Dict[str, Dict[str, object]] = {c: {} for c in CATEGORIES}
+
+
+def _check_category(category: str) -> None:
+    if category not in CATEGORIES:
+        raise ValueError(f"unknown component category {category!r}; expected one of {', '.join(CATEGORIES)}")
+
+
+def register(category: str, name: str | None = None, target=None):
+    """Register `target` (a class or "module:Class") as `name` in `category`.
+
+    Without a target it returns a class decorator:
+
+        @register("aligner")
+        class MyAligner: ...
+    """
+    _check_category(category)
+    if target is None:
+
+        def decorator(cls):
+            _REGISTERED[category][name or cls.__name__] = cls
+            return cls
+
+        return decorator
+    _REGISTERED[category][name or target.__name__] = target
+    return target
+
+
+def _import_path(path: str):
+    module, _, attr = path.rpartition(":") if ":" in path else path.rpartition(".")
+    if not module:
+        raise ValueError(f"not a dotted path: {path!r}")
+    return getattr(importlib.import_module(module), attr)
+
+
+def resolve(category: str, name: str):
+    """Class for `name`: a registered name, a built-in export or a dotted path."""
+    _check_category(category)
+    target = _REGISTERED[category].get(name)
+    if target is not None:
+        return _import_path(target) if isinstance(target, str) else target
+    if ":" in name or "." in name:
+        return _import_path(name)
+    pkg = importlib.import_module(CATEGORIES[category])
+    if name in getattr(pkg, "__all__", ()):
+        return getattr(pkg, name)
+    raise ValueError(f"unknown {category} {name!r}; known: {', '.join(available(category))}")
+
+
+def available(category: str) -> List[str]:
+    """Names usable for `category` (built-ins and registered)."""
+    _check_category(category)
+    pkg = importlib.import_module(CATEGORIES[category])
+    return sorted(set(getattr(pkg, "__all__", ())) | set(_REGISTERED[category]))
+
+
+def build(category: str, spec, **defaults):
+    """Instantiate a component spec; `defaults` fill parameters the constructor takes and the spec leaves unset."""
+    if spec is None:
+        return None
+    if not isinstance(spec, (str, dict)):
+        # already a component instance
+        return spec
+    spec = {"type": spec} if isinstance(spec, str) else dict(spec)
+    if "type" not in spec:
+        raise ValueError(f"{category} spec needs a 'type': {spec!r}")
+    cls = resolve(category, spec.pop("type"))
+    for key, value in spec.items():
+        if isinstance(value, dict) and "type" in value:
+            spec[key] = build(category, value)
+    params = inspect.signature(cls).parameters
+    for key, value in defaults.items():
+        if key in params and key not in spec:
+            spec[key] = value
+    return cls(**spec)
+
+
+def build_channel(spec) -> List[object]:
+    """Channel layers for a spec that is one channel or a list of them."""
+    if spec is None:
+        return []
+    specs = spec if isinstance(spec, list) else [spec]
+    return [build("channel", s) for s in specs]
+
+
+def load_spec(path: str) -> Dict[str, object]:
+    """Read a pipeline spec from .json, .toml (Python 3.11+) or .yaml/.yml (needs PyYAML)."""
+    if path.endswith(".toml"):
+        try:
+            import tomllib
+        except ImportError:
+            raise ValueError("TOML specs need Python 3.11+; use JSON instead") from None
+        with open(path, "rb") as fh:
+            return tomllib.load(fh)
+    if path.endswith((".yaml", ".yml")):
+        try:
+            import yaml
+        except ImportError:
+            raise ValueError("YAML specs need PyYAML (pip install pyyaml); use JSON or TOML instead") from None
+        with open(path, "r", encoding="utf-8") as fh:
+            return yaml.safe_load(fh)
+    with open(path, "r", encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def build_pipeline(spec, input_path: str | None = None, output_path: str | None = None):
+    """Build a Pipeline (ConcurrentPipeline when pipeline.workers is set) from a spec dict or file.
+
+    input_path / output_path override the inputter path and outputter outpath.
+    mapper defaults to RotatingMapper and outputter to YamlOutputter.
+    """
+    if isinstance(spec, str):
+        spec = load_spec(spec)
+    for section in ("inputter", "encoder", "decoder"):
+        if section not in spec:
+            raise ValueError(f"pipeline spec needs an {section!r} section")
+    encoder = build("encoder", spec["encoder"])
+    mapper = build("mapper", spec.get("mapper", "RotatingMapper"))
+    sizes = {key: getattr(encoder, key) for key in ("n", "k") if hasattr(encoder, key)}
+
+    chunk = {"chunk_size": sizes["k"]} if "k" in sizes else {}
+    inputter = build("inputter", _override(spec["inputter"], "path", input_path), **chunk)
+    outputter = build("outputter", _override(spec.get("outputter", "YamlOutputter"), "outpath", output_path))
+
+    options = dict(spec.get("pipeline") or {})
+    workers = options.pop("workers", None)
+    kwargs = dict(
+        aligner=build("aligner", spec.get("aligner")),
+        compressor=build("compressor", spec.get("compressor")),
+        screener=build("screener", spec.get("screener")),
+        **options,
+    )
+    args = (
+        inputter,
+        encoder,
+        mapper,
+        build_channel(spec.get("channel")),
+        build("decoder", spec["decoder"], mapper=mapper, **sizes),
+        outputter,
+    )
+    if workers is not None:
+        from dna_storage.core.executor import ConcurrentPipeline
+
+        return ConcurrentPipeline(*args, workers=workers, **kwargs)
+    return Pipeline(*args, **kwargs)
+
+
+def _override(spec, key: str, value):
+    if value is None or not isinstance(spec, (str, dict)):
+        return spec
+    spec = {"type": spec} if isinstance(spec, str) else dict(spec)
+    spec[key] = value
+    return spec
@@ -6,7 +6,7 @@ from dna_storage.components.encoder.reed_solomon import ReedSolomonEncoder
 from dna_storage.components.mapper.rotating import RotatingMapper
 from dna_storage.components.channel.soup_duplicator import SoupDuplicator
 from dna_storage.components.channel.ids_channel import IDSChannel
-from dna_storage.components.aligner.simple_aligner import SimpleAligner
+from dna_storage.components.aligner.adaptive_aligner import AdaptiveConsensusAligner
 from dna_storage.components.decoder.reed_solomon import ReedSolomonDecoder
 from dna_storage.utils.oligo_utils import recommend_rs_parameters, pretty_recommendation
 from dna_storage.components.outputter.yaml_outputter import YamlOutputter
@@ -21,17 +21,6 @@ def make_example_file():
             fh.write("Simple")
 
 
-class ChainedChannel:
-    def __init__(self, *layers):
-        self.layers = layers
-
-    def transmit(self, strands):
-        out = strands
-        for layer in self.layers:
-            out = layer.transmit(out)
-        return out
-
-
 def main():
     #make_example_file()
 
@@ -48,17 +37,21 @@ def main():
     encoder = ReedSolomonEncoder(n=n, k=k)
     mapper = RotatingMapper()
 
-    # compose channel: duplicate copies per strand then apply IDS mutations
+    # channel layers: duplicate copies per strand then apply IDS mutations
     dup = SoupDuplicator(copies=1000)
     ids = IDSChannel(sub_p=0.1, del_p=0.08, seed=2020)
-    channel = ChainedChannel(dup, ids)
+    channel = [dup, ids]
 
-    aligner = SimpleAligner()
+    # consensus stops consuming reads once every column is confidently decided
+    aligner = AdaptiveConsensusAligner(margin=5)
     decoder = ReedSolomonDecoder(n=n, k=k, mapper=mapper)
     outputter = YamlOutputter("output.yaml")
 
     pipeline = Pipeline(inputter, encoder, mapper, channel, decoder, outputter, aligner=aligner)
     pipeline.run()
+    used = aligner.reads_used
+    if used:
+        print(f"reads used per strand: mean {sum(used) / len(used):.1f} of {dup.copies} (max {max(used)})")
     print("Original message written to YAML output.")
 
 
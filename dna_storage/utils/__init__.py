@@ -1,10 +1,10 @@
-from .gf4 import *
-from .gf256 import *
-from .oligo_utils import recommend_rs_parameters, pretty_recommendation
+from .lazy import lazy_exports
 
 __all__ = [
 	"to_gf4_symbols",
 	"from_gf4_symbols",
+	"pack_gf4",
+	"unpack_gf4",
 	"add",
 	"mul",
 	"inverse",
@@ -14,3 +14,18 @@ __all__ = [
 	"poly_add",
 	"poly_scale",
 ]
+
+# The package used to star-import gf4 and gf256 (gf256 last, so add/mul/
+# inverse are the GF(256) ones); the same names now resolve on first access
+# (PEP 562) and importing eg. dna_storage.utils.packed stays cheap.
+__getattr__, __dir__ = lazy_exports(
+	__name__,
+	{
+		".gf4": ["MUL", "INV", "vec_add", "to_gf4_symbols", "from_gf4_symbols", "pack_gf4", "unpack_gf4"],
+		".gf256": [
+			"PRIM", "EXP", "LOG", "EXP_ARR", "LOG_ARR", "add", "mul", "div", "pow_", "inverse",
+			"poly_eval", "poly_scale", "poly_add", "poly_mul", "mul_array", "matmul",
+		],
+		".oligo_utils": ["recommend_rs_parameters", "pretty_recommendation", "reverse_complement"],
+	},
+)
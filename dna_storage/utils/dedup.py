@@ -0,0 +1,170 @@
+"""Content-defined chunking and a compact chunk index for deduplication.
+
+Chunk boundaries come from a gear rolling hash (as in FastCDC): with a table
+G of 256 random 32-bit words, h_i = (h_{i-1} << 1) + G[b_i] mod 2^32, so h_i
+only depends on the last 32 bytes, and a boundary follows every byte where
+the top `bits` bits of h are zero. Boundaries move with the content: an
+insertion shifts only the chunks around it, and the same bytes in another
+file are cut the same way, so repeated content maps to identical chunks.
+Because h_i = sum_j G[b_{i-j}] << j, the hash of a whole buffer is computed
+with 32 shifted NumPy additions instead of a per-byte Python loop.
+
+Chunks are keyed by a 64-bit truncated BLAKE2b digest in DedupIndex, an
+open-addressing table in flat NumPy arrays (12 bytes per slot, at most half
+full), so millions of chunks cost tens of megabytes rather than a dict's
+~100 bytes per entry. Two different chunks share a 64-bit key with
+probability about n^2 / 2^65 (~3e-8 for a million chunks).
+"""
+
+import hashlib
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+# fixed table: chunk boundaries must not change between runs
+_GEAR = np.random.default_rng(0x6765_6172).integers(0, 2**32, 256, dtype=np.uint64).astype(np.uint32)
+
+
+def gear_hash(data: bytes) -> np.ndarray:
+    """Rolling gear hash after every byte of `data` (uint32 array)."""
+    g = _GEAR[np.frombuffer(data, dtype=np.uint8)]
+    h = g.copy()
+    for j in range(1, min(32, len(g))):
+        # uint32 arithmetic wraps mod 2^32
+        h[j:] += g[: len(g) - j] << np.uint32(j)
+    return h
+
+
+def chunk_boundaries(data: bytes, avg_size: int = 4096, min_size: int | None = None, max_size: int | None = None) -> List[int]:
+    """End offsets of the content-defined chunks of `data` (the last is len(data)).
+
+    Chunks are at least min_size (default avg_size // 4) and at most
+    max_size (default 4 * avg_size) bytes, except a shorter last chunk.
+    """
+    min_size = avg_size // 4 if min_size is None else min_size
+    max_size = 4 * avg_size if max_size is None else max_size
+    assert 1 <= min_size <= avg_size <= max_size
+    n = len(data)
+    if n == 0:
+        return []
+    # a cut is expected every 2^bits bytes past the minimum
+    bits = max(1, int(round(np.log2(max(2, avg_size - min_size)))))
+    mask = np.uint32(((1 << bits) - 1) << (32 - bits))
+    cuts = np.flatnonzero((gear_hash(data) & mask) == 0) + 1
+    ends: List[int] = []
+    start = 0
+    while start < n:
+        if n - start <= min_size:
+            end = n
+        else:
+            i = np.searchsorted(cuts, start + min_size)
+            end = min(int(cuts[i]) if i < len(cuts) else n, start + max_size)
+        ends.append(end)
+        start = end
+    return ends
+
+
+def chunk_digest(chunk: bytes) -> int:
+    """Nonzero 64-bit key of a chunk (truncated BLAKE2b)."""
+    return int.from_bytes(hashlib.blake2b(chunk, digest_size=8).digest(), "little") or 1
+
+
+class DedupIndex:
+    """Chunk key -> chunk id, an open-addressing hash table in NumPy arrays.
+
+    Keys are nonzero 64-bit ints (chunk_digest); ids are assigned in order
+    of first insertion. The table doubles when it is half full.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        size = 16
+        while size < 2 * capacity:
+            size *= 2
+        self._keys = np.zeros(size, dtype=np.uint64)
+        self._ids = np.zeros(size, dtype=np.uint32)
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def nbytes(self) -> int:
+        return self._keys.nbytes + self._ids.nbytes
+
+    def _slot(self, key: int) -> int:
+        mask = len(self._keys) - 1
+        i = key & mask
+        keys = self._keys
+        while keys[i] and keys[i] != key:
+            i = (i + 1) & mask
+        return i
+
+    def get(self, key: int) -> int | None:
+        i = self._slot(key)
+        return int(self._ids[i]) if self._keys[i] else None
+
+    def add(self, key: int) -> Tuple[int, bool]:
+        """(chunk id, whether the key is new)."""
+        assert key != 0
+        i = self._slot(key)
+        if self._keys[i]:
+            return int(self._ids[i]), False
+        cid = self._count
+        self._keys[i] = key
+        self._ids[i] = cid
+        self._count += 1
+        if 2 * self._count > len(self._keys):
+            self._grow()
+        return cid, True
+
+    def _grow(self) -> None:
+        keys, ids = self._keys, self._ids
+        used = keys != 0
+        self._keys = np.zeros(2 * len(keys), dtype=np.uint64)
+        self._ids = np.zeros(2 * len(keys), dtype=np.uint32)
+        for key, cid in zip(keys[used].tolist(), ids[used].tolist()):
+            i = self._slot(key)
+            self._keys[i] = key
+            self._ids[i] = cid
+
+
+class Deduplicator:
+    """Splits files into content-defined chunks and keeps one copy of each.
+
+    `add(data)` returns the file's recipe (chunk ids in order); `chunks`
+    holds the unique chunks by id. `stats` accumulates files, chunks,
+    unique_chunks, bytes and unique_bytes. `capacity` presizes the index
+    (expected unique chunks) to avoid rehashing.
+    """
+
+    def __init__(
+        self,
+        avg_size: int = 4096,
+        min_size: int | None = None,
+        max_size: int | None = None,
+        capacity: int = 1024,
+    ):
+        self.avg_size = avg_size
+        self.min_size = min_size
+        self.max_size = max_size
+        self.index = DedupIndex(capacity)
+        self.chunks: List[bytes] = []
+        self.stats: Dict[str, int] = {"files": 0, "chunks": 0, "unique_chunks": 0, "bytes": 0, "unique_bytes": 0}
+
+    def add(self, data: bytes) -> List[int]:
+        data = bytes(data)
+        recipe: List[int] = []
+        start = 0
+        for end in chunk_boundaries(data, self.avg_size, self.min_size, self.max_size):
+            chunk = data[start:end]
+            cid, new = self.index.add(chunk_digest(chunk))
+            if new:
+                self.chunks.append(chunk)
+                self.stats["unique_chunks"] += 1
+                self.stats["unique_bytes"] += len(chunk)
+            recipe.append(cid)
+            start = end
+        self.stats["files"] += 1
+        self.stats["chunks"] += len(recipe)
+        self.stats["bytes"] += len(data)
+        return recipe
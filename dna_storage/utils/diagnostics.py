@@ -0,0 +1,111 @@
+"""Per-strand decode status and failure maps.
+
+Decoders that support it (ReedSolomonDecoder, SystematicReedSolomonDecoder)
+keep a `last_status` after every `decode`: one entry per read/strand with
+its outcome and how much the code had to do:
+
+- decoded: clean codeword
+- corrected: `corrected` symbol errors fixed
+- erased: recovered with `erased` erasures (missing bytes, or bytes the
+  soft decoder chose to erase), possibly plus corrected errors
+- failed: not recoverable; the decoder emitted k zero bytes in its place
+- missing: no reads at all (set by callers that know the strand ids)
+
+A DecodeStatus is a compact failure map: statuses and counts live in NumPy
+arrays and export as CSV (one line per strand) or .npy (a structured
+array) for quick analysis of where in the pool losses occur.
+"""
+
+import csv
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+STATUSES = ("decoded", "corrected", "erased", "failed", "missing")
+DECODED, CORRECTED, ERASED, FAILED, MISSING = range(len(STATUSES))
+
+# one .npy record per strand
+STATUS_DTYPE = np.dtype([("strand", np.int64), ("status", np.uint8), ("corrected", np.uint16), ("erased", np.uint16)])
+
+
+class DecodeStatus:
+    """Outcome of every strand of a decode, in strand order.
+
+    `record` appends one strand (strand id defaults to its position);
+    `codes`, `corrected`, `erased` and `strands` are NumPy views of the
+    records.
+    """
+
+    def __init__(self, records: Iterable[Tuple[int, int, int, int]] = ()):
+        # (strand, status, corrected, erased)
+        self._records: List[Tuple[int, int, int, int]] = list(records)
+
+    def record(self, status: int, corrected: int = 0, erased: int = 0, strand: int | None = None) -> None:
+        self._records.append((len(self._records) if strand is None else strand, status, corrected, erased))
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __getitem__(self, i: int) -> Tuple[int, int, int, int]:
+        return self._records[i]
+
+    def to_array(self) -> np.ndarray:
+        return np.array(self._records, dtype=STATUS_DTYPE)
+
+    @property
+    def strands(self) -> np.ndarray:
+        return self.to_array()["strand"]
+
+    @property
+    def codes(self) -> np.ndarray:
+        return self.to_array()["status"]
+
+    @property
+    def corrected(self) -> np.ndarray:
+        return self.to_array()["corrected"]
+
+    @property
+    def erased(self) -> np.ndarray:
+        return self.to_array()["erased"]
+
+    def ok(self) -> np.ndarray:
+        """Boolean mask of strands whose output is real data."""
+        return self.codes < FAILED
+
+    def lost(self) -> List[int]:
+        """Strand ids that failed or had no reads."""
+        arr = self.to_array()
+        return arr["strand"][arr["status"] >= FAILED].tolist()
+
+    def counts(self) -> Dict[str, int]:
+        found = np.bincount(self.codes, minlength=len(STATUSES)) if self._records else np.zeros(len(STATUSES), int)
+        return {name: int(n) for name, n in zip(STATUSES, found)}
+
+    def save_csv(self, path: str) -> None:
+        with open(path, "w", newline="", encoding="utf-8") as fh:
+            writer = csv.writer(fh)
+            writer.writerow(["strand", "status", "corrected", "erased"])
+            for strand, status, corrected, erased in self._records:
+                writer.writerow([strand, STATUSES[status], corrected, erased])
+
+    def save_npy(self, path: str) -> None:
+        np.save(path, self.to_array())
+
+    def save(self, path: str) -> None:
+        """Write as .npy when `path` ends with .npy, CSV otherwise."""
+        if path.endswith(".npy"):
+            self.save_npy(path)
+        else:
+            self.save_csv(path)
+
+    @classmethod
+    def load(cls, path: str) -> "DecodeStatus":
+        """Read a map written by `save` (.npy or CSV)."""
+        if path.endswith(".npy"):
+            arr = np.load(path)
+            return cls(zip(*(arr[f].tolist() for f in STATUS_DTYPE.names)))
+        with open(path, "r", newline="", encoding="utf-8") as fh:
+            rows = list(csv.DictReader(fh))
+        return cls(
+            (int(r["strand"]), STATUSES.index(r["status"]), int(r["corrected"]), int(r["erased"])) for r in rows
+        )
@@ -4,27 +4,35 @@ Provides add (xor), mul, div, pow, inverse, and helpers for polynomials.
 """
 from typing import List
 
+import numpy as np
+
 # primitive polynomial for GF(2^8)
 PRIM = 0x11d
 
-# build log/antilog tables for GF(256)
-EXP = [0] * 512
+# antilog table: EXP[i] = alpha^i for i in 0..254 (generated from PRIM by
+# shifting and reducing, see tests/test_startup.py); kept as a constant so
+# importing the module does no table building
+_EXP_BYTES = bytes.fromhex(
+    "01020408102040801d3a74e8cd8713264c982d5ab475eac98f03060c183060c0"
+    "9d274e9c254a94356ad4b577eec19f23468c050a142850a05dba69d2b96fdea1"
+    "5fbe61c2992f5ebc65ca890f1e3c78f0fde7d3bb6bd6b17ffee1dfa35bb671e2"
+    "d9af4386112244880d1a3468d0bd67ce811f3e7cf8edc7933b76ecc5973366cc"
+    "85172e5cb86ddaa94f9e214284152a54a84d9a2952a455aa49923972e4d5b773"
+    "e6d1bf63c6913f7efce5d7b37bf6f1ffe3dbab4b963162c495376edca557ae41"
+    "82193264c88d070e1c3870e0dda753a651a259b279f2f9efc39b2b56ac458a09"
+    "122448903d7af4f5f7f3fbebcb8b0b162c58b07dfae9cf831b366cd8ad478e"
+)
+
+# log/antilog tables; EXP is duplicated up to 512 entries for overflow handling
+EXP = list(_EXP_BYTES) * 2 + list(_EXP_BYTES[:2])
 LOG = [0] * 256
+for _i, _x in enumerate(_EXP_BYTES):
+    LOG[_x] = _i
+del _i, _x
 
-def _build_tables():
-    x = 1
-    for i in range(0, 255):
-        EXP[i] = x
-        LOG[x] = i
-        x <<= 1
-        if x & 0x100:
-            x ^= PRIM
-    # duplicate for overflow handling
-    for i in range(255, 512):
-        EXP[i] = EXP[i - 255]
-
-
-_build_tables()
+# NumPy copies of the tables for the vectorized helpers below
+EXP_ARR = np.array(EXP, dtype=np.int64)
+LOG_ARR = np.array(LOG, dtype=np.int64)
 
 
 def add(a: int, b: int) -> int:
@@ -100,3 +108,22 @@ def poly_mul(p1: List[int], p2: List[int]) -> List[int]:
     while len(out) > 1 and out[-1] == 0:
         out.pop()
     return out
+
+
+def mul_array(a, b) -> np.ndarray:
+    """Element-wise GF256 multiply of two broadcastable arrays."""
+    a = np.asarray(a, dtype=np.int64)
+    b = np.asarray(b, dtype=np.int64)
+    out = EXP_ARR[LOG_ARR[a] + LOG_ARR[b]]
+    return np.where((a == 0) | (b == 0), 0, out)
+
+
+def matmul(rows, matrix) -> np.ndarray:
+    """Multiply a batch of row vectors (B, k) by a (k, m) matrix over GF256 -> (B, m)."""
+    rows = np.asarray(rows, dtype=np.int64)
+    matrix = np.asarray(matrix, dtype=np.int64)
+    out = np.zeros((rows.shape[0], matrix.shape[1]), dtype=np.int64)
+    for i in range(rows.shape[1]):
+        # XOR-accumulate rows[:, i] * matrix[i, :] as an outer product
+        out ^= mul_array(rows[:, i, None], matrix[i][None, :])
+    return out
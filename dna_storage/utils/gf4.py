@@ -10,6 +10,8 @@ Multiplication = precomputed table
 
 from typing import List
 
+import numpy as np
+
 # addition in GF4 is XOR
 def add(a: int, b: int) -> int:
     return a ^ b
@@ -35,25 +37,44 @@ def inverse(a: int) -> int:
 def vec_add(v1: List[int], v2: List[int]) -> List[int]:
     return [add(a, b) for a, b in zip(v1, v2)]
 
+# bit offsets of the four 2-bit symbols in a byte (high bits first)
+_SHIFTS = np.array([6, 4, 2, 0], dtype=np.uint8)
+_WEIGHTS = np.left_shift(1, _SHIFTS).astype(np.uint8)
+
+
+def unpack_gf4(data) -> np.ndarray:
+    """Split bytes into GF4 symbols (2 bits each, high bits first).
+
+    `data` is a bytes-like object or a uint8 array of shape (..., nbytes), eg.
+    a whole batch of codewords. Returns a uint8 array of shape (..., 4 * nbytes).
+    """
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        arr = np.frombuffer(data, dtype=np.uint8)
+    else:
+        arr = np.asarray(data, dtype=np.uint8)
+    syms = (arr[..., None] >> _SHIFTS) & 0x3
+    return syms.reshape(arr.shape[:-1] + (arr.shape[-1] * 4,))
+
+
+def pack_gf4(symbols) -> np.ndarray:
+    """Pack GF4 symbols of shape (..., L) into a uint8 array of shape (..., ceil(L / 4)).
+
+    If L is not a multiple of 4 the last byte is padded with zero symbols.
+    """
+    s = np.asarray(symbols, dtype=np.uint8)
+    pad = (-s.shape[-1]) % 4
+    if pad:
+        s = np.concatenate([s, np.zeros(s.shape[:-1] + (pad,), dtype=np.uint8)], axis=-1)
+    # sum of symbol * 2^shift never exceeds 255, so uint8 arithmetic is exact
+    return s.reshape(s.shape[:-1] + (-1, 4)) @ _WEIGHTS
+
+
 def to_gf4_symbols(data: bytes) -> List[int]:
     """Convert bytes into list of GF4 symbols (2 bits per symbol)."""
-    symbols: List[int] = []
-    for b in data:
-        # high 2 bits then low 2 bits repeatedly
-        symbols.append((b >> 6) & 0x3)
-        symbols.append((b >> 4) & 0x3)
-        symbols.append((b >> 2) & 0x3)
-        symbols.append(b & 0x3)
-    return symbols
+    return unpack_gf4(data).tolist()
+
 
 def from_gf4_symbols(symbols: List[int]) -> bytes:
     """Pack 4 GF4 symbols into a byte (2 bits each). If len(symbols) not multiple of 4, pad with zeros."""
-    out = bytearray()
-    s = symbols[:]
-    # pad
-    while len(s) % 4 != 0:
-        s.append(0)
-    for i in range(0, len(s), 4):
-        b = (s[i] << 6) | (s[i+1] << 4) | (s[i+2] << 2) | s[i+3]
-        out.append(b)
-    return bytes(out)
+    # asarray, not bytes(): bytes() of a NumPy array is its raw memory
+    return pack_gf4(np.asarray(symbols, dtype=np.uint8)).tobytes()
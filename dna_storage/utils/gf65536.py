@@ -0,0 +1,136 @@
+"""GF(2^16) arithmetic utilities backed by NumPy log/antilog tables.
+
+Elements are integers 0..65535 (uint16). All helpers accept scalars or NumPy
+arrays and operate element-wise, so whole columns of codeword symbols can be
+processed in one call. The field is large enough for Reed–Solomon codes with
+up to 65535 symbols, ie. an outer code spanning tens of thousands of strands.
+"""
+from typing import Sequence
+
+import numpy as np
+
+# primitive polynomial x^16 + x^12 + x^3 + x + 1
+PRIM = 0x1100B
+ORDER = 65535
+
+
+def _times_x(v: int) -> int:
+    v <<= 1
+    return v ^ PRIM if v & 0x10000 else v
+
+
+def _build_tables():
+    exp = np.zeros(2 * ORDER, dtype=np.int64)
+    x = 1
+    for i in range(16):
+        exp[i] = x
+        x = _times_x(x)
+    # extend the known prefix x^0..x^(m-1) to x^m..x^(2m-1) in one vector
+    # pass: multiplying by x^m is linear over GF(2), so x^(m+i) is the XOR of
+    # x^(m+b) over the set bits b of x^i (16 array ops instead of a Python
+    # loop over all 65535 powers)
+    m = 16
+    while m < ORDER:
+        c = int(exp[m - 1])
+        step = min(m, ORDER - m)
+        out = np.zeros(step, dtype=np.int64)
+        for b in range(16):
+            c = _times_x(c)
+            out ^= ((exp[:step] >> b) & 1) * c
+        exp[m : m + step] = out
+        m += step
+    # duplicate for overflow handling (LOG[a] + LOG[b] < 2 * ORDER)
+    exp[ORDER:] = exp[:ORDER]
+    # LOG[0] is undefined; keep it at 0 and mask zeros explicitly
+    log = np.zeros(ORDER + 1, dtype=np.int64)
+    log[exp[:ORDER]] = np.arange(ORDER)
+    return exp, log
+
+
+EXP, LOG = _build_tables()
+
+
+def add(a, b):
+    return np.bitwise_xor(a, b)
+
+
+def mul(a, b):
+    a = np.asarray(a, dtype=np.int64)
+    b = np.asarray(b, dtype=np.int64)
+    out = EXP[LOG[a] + LOG[b]]
+    return np.where((a == 0) | (b == 0), 0, out)
+
+
+def div(a, b):
+    a = np.asarray(a, dtype=np.int64)
+    b = np.asarray(b, dtype=np.int64)
+    if np.any(b == 0):
+        raise ZeroDivisionError()
+    out = EXP[(LOG[a] - LOG[b]) % ORDER]
+    return np.where(a == 0, 0, out)
+
+
+def inverse(a):
+    a = np.asarray(a, dtype=np.int64)
+    if np.any(a == 0):
+        raise ZeroDivisionError()
+    return EXP[ORDER - LOG[a]]
+
+
+def pow_(a, power: int):
+    a = np.asarray(a, dtype=np.int64)
+    out = EXP[(LOG[a] * power) % ORDER]
+    return np.where(a == 0, 0, out)
+
+
+def bytes_to_symbols(rows: Sequence[bytes], row_len: int) -> np.ndarray:
+    """Stack byte rows (zero padded to `row_len`, which must be even) as uint16 symbols."""
+    if row_len % 2:
+        raise ValueError("row_len must be even for 16-bit symbols")
+    buf = np.zeros((len(rows), row_len), dtype=np.uint8)
+    for i, r in enumerate(rows):
+        buf[i, : len(r)] = np.frombuffer(r, dtype=np.uint8)
+    return buf.view(">u2").astype(np.int64)
+
+
+def symbols_to_bytes(symbols: np.ndarray) -> list:
+    """Inverse of bytes_to_symbols: one bytes object per row."""
+    raw = np.ascontiguousarray(symbols, dtype=">u2")
+    return [row.tobytes() for row in raw]
+
+
+def barycentric_weights(xs: np.ndarray, block: int = 256) -> np.ndarray:
+    """Return log w_i where w_i = 1 / prod_{m != i} (x_i - x_m)."""
+    xs = np.asarray(xs, dtype=np.int64)
+    logw = np.empty(len(xs), dtype=np.int64)
+    for start in range(0, len(xs), block):
+        blk = xs[start : start + block]
+        # LOG[0] == 0, so the m == i term drops out of the sum
+        logw[start : start + block] = LOG[blk[:, None] ^ xs[None, :]].sum(axis=1)
+    return (-logw) % ORDER
+
+
+def lagrange_eval(xs, ys: np.ndarray, targets, logw: np.ndarray | None = None) -> np.ndarray:
+    """Evaluate the polynomial through points (xs, ys) at `targets`.
+
+    ys has shape (len(xs), columns): every column is an independent codeword
+    sharing the same evaluation points. Targets must not coincide with xs.
+    Returns an array of shape (len(targets), columns).
+    """
+    xs = np.asarray(xs, dtype=np.int64)
+    ys = np.asarray(ys, dtype=np.int64)
+    targets = np.asarray(targets, dtype=np.int64)
+    if logw is None:
+        logw = barycentric_weights(xs)
+
+    log_y = LOG[ys]
+    zero_y = ys == 0
+    out = np.zeros((len(targets), ys.shape[1]), dtype=np.int64)
+    for t, x in enumerate(targets):
+        # c_i = l(x) * w_i / (x - x_i) in the log domain
+        log_diff = LOG[x ^ xs]
+        log_c = (log_diff.sum() - log_diff + logw) % ORDER
+        terms = EXP[log_c[:, None] + log_y]
+        terms[zero_y] = 0
+        out[t] = np.bitwise_xor.reduce(terms, axis=0)
+    return out
@@ -0,0 +1,34 @@
+"""PEP 562 lazy re-exports for package `__init__` modules.
+
+A package lists which submodule provides each public name; the submodule is
+imported on first attribute access, so importing the package (or one of its
+submodules) does not pull in every sibling and the tables they build.
+"""
+
+import importlib
+from typing import Callable, Dict, List, Sequence, Tuple
+
+
+def lazy_exports(package: str, exports: Dict[str, Sequence[str]]) -> Tuple[Callable, Callable]:
+    """Return (__getattr__, __dir__) for `package` given {submodule: names}.
+
+    Submodules are relative (".reed_solomon"); a name listed under several
+    submodules resolves to the last one, like consecutive star imports.
+    """
+    owner: Dict[str, str] = {}
+    for module, names in exports.items():
+        for name in names:
+            owner[name] = module
+
+    def __getattr__(name: str):
+        if name not in owner:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(owner[name], package), name)
+        # cache on the package so later lookups skip __getattr__
+        setattr(importlib.import_module(package), name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(importlib.import_module(package))) | set(owner))
+
+    return __getattr__, __dir__
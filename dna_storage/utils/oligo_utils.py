@@ -1,5 +1,12 @@
 from typing import Dict, Optional, Tuple
 
+_COMPLEMENT = str.maketrans("ACGTNacgtn", "TGCANtgcan")
+
+
+def reverse_complement(seq: str) -> str:
+    """Reverse complement of a DNA string (case and N are preserved)."""
+    return seq.translate(_COMPLEMENT)[::-1]
+
 
 def recommend_rs_parameters(
     oligo_len: int,
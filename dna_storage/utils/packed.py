@@ -0,0 +1,203 @@
+"""2-bit packed DNA sequences.
+
+A, C, G, T are stored as the codes 0..3, four bases per byte with the first
+base in the high bits (the layout of `pack_gf4`). The complement of a base
+is 3 - code, so reverse-complementing never goes through a string.
+"""
+
+from typing import Iterable, Iterator, List, Sequence
+
+import numpy as np
+
+from .gf4 import pack_gf4, unpack_gf4
+
+BASES = "ACGT"
+
+# ASCII -> base code (255 marks characters that cannot be packed)
+_BASE_INDEX = np.full(256, 255, dtype=np.uint8)
+_BASE_INDEX[np.frombuffer(BASES.encode("ascii"), dtype=np.uint8)] = np.arange(4, dtype=np.uint8)
+_BASE_ASCII = np.frombuffer(BASES.encode("ascii"), dtype=np.uint8)
+
+
+def _str_codes(seq: str) -> np.ndarray:
+    codes = _BASE_INDEX[np.frombuffer(seq.encode("ascii", "replace"), dtype=np.uint8)]
+    if np.any(codes == 255):
+        raise ValueError("sequence contains a non-ACGT character")
+    return codes
+
+
+class PackedSequence:
+    """Immutable DNA sequence stored at 2 bits per base.
+
+    Supports len, indexing (returns a base letter), slicing and iteration
+    (returns PackedSequence / base letters), `reverse_complement`, hashing
+    and equality with other PackedSequence objects; `str()` gives the bases.
+    `codes()` returns the bases as a uint8 array of 0..3, which is what
+    mappers use directly instead of parsing characters.
+    """
+
+    __slots__ = ("_data", "_len")
+
+    def __init__(self, data: bytes, length: int):
+        assert 0 <= length <= 4 * len(data), "length does not fit the packed data"
+        data = bytes(data[: (length + 3) // 4])
+        rem = length % 4
+        if rem:
+            # zero the padding bits so equal sequences have equal bytes
+            data = data[:-1] + bytes([data[-1] & (0xFF << (8 - 2 * rem)) & 0xFF])
+        self._data = data
+        self._len = length
+
+    @classmethod
+    def from_codes(cls, codes) -> "PackedSequence":
+        codes = np.asarray(codes, dtype=np.uint8)
+        return cls(pack_gf4(codes).tobytes(), len(codes))
+
+    @classmethod
+    def from_str(cls, seq: str) -> "PackedSequence":
+        return cls.from_codes(_str_codes(seq))
+
+    def codes(self) -> np.ndarray:
+        return unpack_gf4(self._data)[: self._len]
+
+    @property
+    def data(self) -> bytes:
+        return self._data
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._data)
+
+    def reverse_complement(self) -> "PackedSequence":
+        return PackedSequence.from_codes(3 - self.codes()[::-1])
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self._len)
+            if step == 1 and start % 4 == 0:
+                # aligned slice: copy whole bytes, no unpacking
+                return PackedSequence(self._data[start // 4 :], max(stop - start, 0))
+            return PackedSequence.from_codes(self.codes()[key])
+        if key < 0:
+            key += self._len
+        if not 0 <= key < self._len:
+            raise IndexError("PackedSequence index out of range")
+        return BASES[(self._data[key // 4] >> (6 - 2 * (key % 4))) & 0x3]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(str(self))
+
+    def __str__(self) -> str:
+        return _BASE_ASCII[self.codes()].tobytes().decode("ascii")
+
+    def __repr__(self) -> str:
+        return f"PackedSequence({str(self)!r})"
+
+    def _key(self):
+        # padding bits beyond the length are always zero (see __init__)
+        return (self._len, self._data)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, PackedSequence):
+            return self._key() == other._key()
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __reduce__(self):
+        return (PackedSequence, (self._data, self._len))
+
+
+class PackedReadSet(Sequence):
+    """Many reads packed into one contiguous buffer.
+
+    Every read starts on a byte boundary; a read of L bases costs ceil(L / 4)
+    bytes plus 12 bytes of offset and length, against ~50 bytes of object
+    overhead plus L bytes for a `str`, or ~120 bytes of objects plus L / 4
+    for a standalone PackedSequence. Indexing returns PackedSequence
+    objects and slicing a PackedReadSet (a view sharing the buffer when
+    the slice is contiguous), so it can be handed to anything that takes a
+    list of reads; `Pipeline(packed=True)` streams its channel output into
+    one and keeps its reads (grouped per strand) in views of it.
+    """
+
+    def __init__(self, reads: Iterable = ()):
+        # reads are consumed one at a time, so a generator (eg. a channel's
+        # output) is packed without ever holding all its reads as objects
+        data = bytearray()
+        lengths: List[int] = []
+        for r in reads:
+            p = r if isinstance(r, PackedSequence) else PackedSequence.from_str(r)
+            data += p.data
+            lengths.append(len(p))
+        self._set(bytes(data), np.array(lengths, dtype=np.uint32))
+
+    def _set(self, data, lengths: np.ndarray, offsets: np.ndarray | None = None) -> None:
+        self._data = data
+        self._lengths = lengths
+        if offsets is None:
+            nbytes = (lengths.astype(np.int64) + 3) // 4
+            offsets = np.concatenate([[0], np.cumsum(nbytes)]).astype(np.int64)
+        self._offsets = offsets
+
+    @classmethod
+    def concat(cls, sets: Iterable["PackedReadSet"]) -> "PackedReadSet":
+        """One PackedReadSet holding the reads of `sets` in order (buffers joined, no per-read objects)."""
+        sets = list(sets)
+        if not sets:
+            return cls()
+        return cls._from_buffer(b"".join(bytes(s._data) for s in sets), np.concatenate([s._lengths for s in sets]))
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._data) + self._lengths.nbytes + self._offsets.nbytes
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            start, stop, step = i.indices(len(self))
+            if step != 1:
+                return PackedReadSet(self[j] for j in range(start, stop, step))
+            # contiguous reads: a view of their bytes, offsets shifted
+            out = PackedReadSet()
+            stop = max(start, stop)
+            lo, hi = int(self._offsets[start]), int(self._offsets[stop])
+            out._set(memoryview(self._data)[lo:hi], self._lengths[start:stop], self._offsets[start : stop + 1] - lo)
+            return out
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("PackedReadSet index out of range")
+        lo, hi = int(self._offsets[i]), int(self._offsets[i + 1])
+        return PackedSequence(self._data[lo:hi], int(self._lengths[i]))
+
+    @classmethod
+    def _from_buffer(cls, data: bytes, lengths: np.ndarray) -> "PackedReadSet":
+        out = cls()
+        out._set(data, lengths)
+        return out
+
+    def __reduce__(self):
+        # memoryview slices do not pickle; send the bytes
+        return (PackedReadSet._from_buffer, (bytes(self._data), self._lengths))
+
+    def __repr__(self) -> str:
+        return f"PackedReadSet({len(self)} reads, {self.nbytes} bytes)"
+
+
+def as_str(seq) -> str:
+    """Return `seq` as a string; str reads (eg. QualityRead) pass through unchanged."""
+    return str(seq) if isinstance(seq, PackedSequence) else seq
+
+
+def seq_codes(seq) -> np.ndarray:
+    """Base codes (0..3) of a str or PackedSequence; raises ValueError on non-ACGT."""
+    if isinstance(seq, PackedSequence):
+        return seq.codes()
+    return _str_codes(seq)
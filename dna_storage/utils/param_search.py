@@ -0,0 +1,201 @@
+"""Analytic search over storage parameters (n, k, coverage, oligo length, outer code).
+
+Model (per strand, bytes mapped 1 -> 4 bases as in RotatingMapper):
+- a read votes for the correct base at a position with probability
+  q = (1 - del_p) * (1 - sub_p); the column majority over j reads is wrong
+  when at most half of them vote correctly (ties count half)
+- a byte is wrong if any of its 4 bases is; bytes fail independently
+- reads per strand are Poisson(coverage) ("poisson") or exactly
+  `coverage` ("fixed"); a strand without reads is lost
+- inner RS over GF(256): "errors" (SystematicReedSolomonDecoder) fails with
+  more than (n - k) // 2 byte errors, "erasure" (ReedSolomonDecoder, which
+  interpolates from the first k bytes) fails on any error among them
+- optional outer erasure code across strands (ReedSolomon16Encoder): a block
+  of outer_n strands carrying outer_k data strands fails when more than
+  outer_n - outer_k strands are lost; the last block is shortened, and its
+  failure probability is bounded by that of a full block
+
+Deletions are treated as independent base errors (no frame shifts), so the
+model is optimistic at high deletion rates; use it to shortlist parameters
+and confirm the best ones with `examples/benchmark_rs.py`.
+"""
+
+from typing import Dict, Iterable, List
+
+import numpy as np
+
+
+def binom_sf(t, n: int, p) -> np.ndarray:
+    """P(X > t) for X ~ Binomial(n, p); the result has shape p.shape + t.shape."""
+    p = np.clip(np.asarray(p, dtype=np.float64), 1e-300, 1 - 1e-16)
+    i = np.arange(n + 1)
+    log_comb = np.concatenate([[0.0], np.cumsum(np.log(np.arange(n, 0, -1)) - np.log(np.arange(1, n + 1)))])
+    log_pmf = log_comb + i * np.log(p)[..., None] + (n - i) * np.log1p(-p)[..., None]
+    # tail sums from the right keep small probabilities accurate
+    tail = np.cumsum(np.exp(log_pmf)[..., ::-1], axis=-1)[..., ::-1]
+    tail = np.concatenate([tail, np.zeros(tail.shape[:-1] + (1,))], axis=-1)
+    return tail[..., np.clip(np.asarray(t) + 1, 0, n + 1)]
+
+
+def consensus_error(sub_p: float, del_p: float, reads) -> np.ndarray:
+    """Per-base majority-vote error rate for each read count in `reads` (ints >= 1)."""
+    q = (1 - del_p) * (1 - sub_p)
+    out = []
+    for j in np.atleast_1d(reads).tolist():
+        # wrong when fewer than half of the votes are correct; a tie is a coin flip
+        below = 1 - binom_sf((j + 1) // 2 - 1, j, q)
+        tie = binom_sf(j // 2 - 1, j, q) - binom_sf(j // 2, j, q) if j % 2 == 0 else 0.0
+        out.append(float(below + 0.5 * tie))
+    return np.array(out)
+
+
+def block_failure_probability(symbol_error, n: int, k, decoder: str = "errors") -> np.ndarray:
+    """Probability that an inner RS(n, k) codeword fails, given the byte error rate.
+
+    The result has shape symbol_error.shape + k.shape.
+    """
+    p = np.asarray(symbol_error, dtype=np.float64)
+    k = np.asarray(k)
+    if decoder == "errors":
+        return binom_sf((n - k) // 2, n, p)
+    if decoder == "erasure":
+        return 1 - np.power.outer(1 - p, k)
+    raise ValueError("decoder must be 'errors' or 'erasure'")
+
+
+def _coverage_weights(coverage: float, model: str, j_max: int) -> np.ndarray:
+    """P(j reads) for j = 0..j_max."""
+    j = np.arange(j_max + 1)
+    if model == "fixed":
+        return (j == int(round(coverage))).astype(np.float64)
+    if model == "poisson":
+        log_fact = np.concatenate([[0.0], np.cumsum(np.log(np.arange(1, j_max + 1)))])
+        w = np.exp(j * np.log(coverage) - coverage - log_fact)
+        # fold the (tiny) tail beyond j_max into j_max
+        w[-1] += max(0.0, 1 - w.sum())
+        return w
+    raise ValueError("coverage_model must be 'poisson' or 'fixed'")
+
+
+def search_parameters(
+    sub_p: float,
+    del_p: float,
+    payload_bytes: int,
+    target: float = 0.99,
+    oligo_lens: Iterable[int] = (100, 150, 200, 250, 300),
+    overhead: int = 20,
+    coverages: Iterable[float] = (2, 3, 4, 5, 6, 8, 10, 12, 15, 20, 25, 30, 40, 50, 60),
+    outer_redundancies: Iterable[float] = (0.0, 0.02, 0.05, 0.1, 0.2, 0.3),
+    outer_k: int = 1000,
+    decoder: str = "errors",
+    coverage_model: str = "poisson",
+    synth_weight: float = 1.0,
+    seq_weight: float = 1.0,
+    top: int = 10,
+) -> Dict[str, object]:
+    """Rank parameter sets that store `payload_bytes` with probability >= target.
+
+    Candidates are all combinations of oligo length, inner k (n is the most
+    bytes that fit the oligo), mean coverage and outer redundancy. The cost
+    of a candidate is the number of bases synthesized (one copy of every
+    strand, primers included) times `synth_weight` plus the bases sequenced
+    (coverage copies) times `seq_weight`, per stored byte.
+
+    Returns a dict with keys: ranked (cheapest feasible candidates, best
+    first), best (ranked[0] or None), evaluated and feasible (counts), and
+    the inputs under `profile`.
+    """
+    assert payload_bytes > 0 and 0 < target < 1
+    coverages = [float(c) for c in coverages]
+    j_max = int(max(coverages) * 2 + 20) if coverage_model == "poisson" else int(max(coverages))
+    j = np.arange(1, j_max + 1)
+    base_err = consensus_error(sub_p, del_p, j)
+    byte_err = 1 - (1 - base_err) ** 4
+    cov_w = np.stack([_coverage_weights(c, coverage_model, j_max) for c in coverages])  # (C, J+1)
+
+    rows: List[Dict[str, object]] = []
+    evaluated = 0
+    for oligo_len in oligo_lens:
+        n = (oligo_len - overhead) // 4
+        if n < 2:
+            continue
+        n = min(n, 255)
+        ks = np.arange(1, n)
+        # inner failure per read count and k; zero reads -> strand lost
+        fail_jk = block_failure_probability(byte_err, n, ks, decoder)  # (J, K)
+        fail_jk = np.vstack([np.ones(len(ks)), fail_jk])
+        strand_fail = cov_w @ fail_jk  # (C, K)
+
+        data_strands = np.ceil(payload_bytes / ks).astype(np.int64)  # (K,)
+        for r in outer_redundancies:
+            evaluated += strand_fail.size
+            if r <= 0:
+                success = (1 - strand_fail) ** data_strands
+                ok_n, ok_k = data_strands, data_strands
+                strands_total = data_strands
+            else:
+                ok_k = np.minimum(data_strands, outer_k)
+                ok_n = np.minimum(np.ceil(ok_k * (1 + r)).astype(np.int64), 65535)
+                blocks = np.ceil(data_strands / ok_k)
+                success = np.empty_like(strand_fail)
+                # group candidates sharing a block layout
+                for bk, bn in set(zip(ok_k.tolist(), ok_n.tolist())):
+                    cols = np.flatnonzero((ok_k == bk) & (ok_n == bn))
+                    block_fail = binom_sf(bn - bk, bn, strand_fail[:, cols])
+                    success[:, cols] = (1 - block_fail) ** blocks[cols]
+                # the last block is shortened (fewer data strands, same parity)
+                strands_total = data_strands + blocks.astype(np.int64) * (ok_n - ok_k)
+
+            synth = strands_total * oligo_len  # (K,)
+            cost = (synth[None, :] * synth_weight + synth[None, :] * np.asarray(coverages)[:, None] * seq_weight) / payload_bytes
+            for ci, ki in zip(*np.nonzero(success >= target)):
+                rows.append(
+                    {
+                        "oligo_len": int(oligo_len),
+                        "n": int(n),
+                        "k": int(ks[ki]),
+                        "coverage": coverages[ci],
+                        "outer_redundancy": float(r),
+                        "outer_k": int(ok_k[ki]),
+                        "outer_n": int(ok_n[ki]),
+                        "strands": int(strands_total[ki]),
+                        "strand_failure": float(strand_fail[ci, ki]),
+                        "success_probability": float(success[ci, ki]),
+                        "bases_per_byte": float(cost[ci, ki]),
+                    }
+                )
+
+    rows.sort(key=lambda row: (row["bases_per_byte"], -row["success_probability"]))
+    return {
+        "profile": {
+            "sub_p": sub_p,
+            "del_p": del_p,
+            "payload_bytes": payload_bytes,
+            "target": target,
+            "decoder": decoder,
+            "coverage_model": coverage_model,
+        },
+        "evaluated": evaluated,
+        "feasible": len(rows),
+        "ranked": rows[:top],
+        "best": rows[0] if rows else None,
+    }
+
+
+def pretty_search_report(result: Dict[str, object]) -> str:
+    prof = result["profile"]
+    lines = [
+        f"sub_p={prof['sub_p']} del_p={prof['del_p']} payload={prof['payload_bytes']} bytes target={prof['target']}",
+        f"decoder={prof['decoder']} coverage={prof['coverage_model']} evaluated={result['evaluated']} feasible={result['feasible']}",
+    ]
+    if not result["ranked"]:
+        lines.append("no parameter set reaches the target; allow more coverage, redundancy or shorter oligos")
+        return "\n".join(lines)
+    lines.append("rank oligo_len   n   k coverage outer(k/n)  strands  P(success)  bases/byte")
+    for i, row in enumerate(result["ranked"], start=1):
+        outer = f"{row['outer_k']}/{row['outer_n']}" if row["outer_redundancy"] > 0 else "-"
+        lines.append(
+            f"{i:>4} {row['oligo_len']:>9} {row['n']:>3} {row['k']:>3} {row['coverage']:>8g} {outer:>10} "
+            f"{row['strands']:>8} {row['success_probability']:>11.6f} {row['bases_per_byte']:>11.1f}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,67 @@
+import numpy as np
+
+
+class QualityRead(str):
+    """A read (DNA string) carrying per-base Phred quality scores.
+
+    Behaves exactly like `str` everywhere reads are used; components that
+    understand qualities (eg. SimpleAligner) look for the `quality`
+    attribute: a uint8 array with one Phred score per base. Slicing or other
+    string operations return plain `str` and drop the qualities.
+    """
+
+    __slots__ = ("quality",)
+
+    def __new__(cls, seq: str, quality=None):
+        obj = super().__new__(cls, seq)
+        if quality is None:
+            quality = np.zeros(len(seq), dtype=np.uint8)
+        elif not (isinstance(quality, np.ndarray) and quality.dtype == np.uint8):
+            quality = np.asarray(quality, dtype=np.uint8)
+        assert len(quality) == len(seq), "quality length must match sequence length"
+        obj.quality = quality
+        return obj
+
+    def __reduce__(self):
+        return (QualityRead, (str(self), self.quality))
+
+
+def phred_to_prob(quality) -> np.ndarray:
+    """Probability that each base is correct for an array of Phred scores."""
+    return 1.0 - np.power(10.0, -np.asarray(quality, dtype=np.float64) / 10.0)
+
+
+def base_weights(read: str) -> np.ndarray | None:
+    """Per-base vote weights for a read, or None if it carries no qualities."""
+    quality = getattr(read, "quality", None)
+    if quality is None:
+        return None
+    return phred_to_prob(quality)
+
+
+def prob_to_phred(prob, cap: int = 60) -> np.ndarray:
+    """Phred scores (uint8, at most `cap`) for an array of probabilities that a base is correct."""
+    err = np.maximum(1.0 - np.asarray(prob, dtype=np.float64), 10.0 ** (-cap / 10.0))
+    return np.minimum(np.round(-10.0 * np.log10(err)), cap).astype(np.uint8)
+
+
+def column_posteriors(codes: np.ndarray, probs: np.ndarray) -> np.ndarray:
+    """Posterior probability of each base per alignment column.
+
+    codes: (C, R) base index (0..3 for ACGT, 4 for a gap) of every read in
+    every column; probs: (C, R) probability that each read base is right.
+    Reads vote independently with a symmetric substitution model,
+    P(b) ~ prod_r (p_r if read r shows b else (1 - p_r) / 3); gaps do not
+    vote. Returns a (C, 4) array whose rows sum to 1.
+    """
+    p = np.clip(np.asarray(probs, dtype=np.float64), 0.25, 1.0 - 1e-9)
+    present = codes < 4
+    hit = np.where(present, np.log(p), 0.0)
+    miss = np.where(present, np.log((1.0 - p) / 3.0), 0.0)
+    # every base starts from the all-miss score; a read showing b swaps its miss for a hit
+    ll = np.repeat(miss.sum(axis=1, keepdims=True), 4, axis=1)
+    for b in range(4):
+        ll[:, b] += np.where(codes == b, hit - miss, 0.0).sum(axis=1)
+    ll -= ll.max(axis=1, keepdims=True)
+    post = np.exp(ll)
+    return post / post.sum(axis=1, keepdims=True)
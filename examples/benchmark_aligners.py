@@ -0,0 +1,56 @@
+"""Benchmark trace reconstruction: SimpleAligner vs ProgressiveAligner vs BeamSearchAligner.
+
+For each coverage and per-base error level, random strands are sent through
+an IDSChannel (sub_p = del_p = error / 2) and every aligner reconstructs the
+strand from the same reads. Reported: mean edit distance to the true strand,
+fraction reconstructed exactly, and time per strand.
+
+Usage:
+  python3 examples/benchmark_aligners.py [strands] [length] [coverages] [errors]
+
+Example:
+  python3 examples/benchmark_aligners.py 20 100 5,10,20 0.04,0.1
+"""
+import random
+import sys
+from pathlib import Path
+from time import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from dna_storage.components.aligner import SimpleAligner, ProgressiveAligner, BeamSearchAligner
+from dna_storage.components.channel.ids_channel import IDSChannel
+from dna_storage.utils.compare import _levenshtein
+
+
+def run(strands=20, length=100, coverages=(5, 10, 20), errors=(0.04, 0.1), beam_width=8):
+    aligners = {
+        "simple": SimpleAligner(),
+        "progressive": ProgressiveAligner(),
+        f"beam(w={beam_width})": BeamSearchAligner(beam_width=beam_width),
+    }
+    print(f"{'coverage':>8} {'error':>6} {'aligner':>12} {'mean_edit':>9} {'exact':>6} {'s/strand':>9}")
+    for cov in coverages:
+        for err in errors:
+            channel = IDSChannel(sub_p=err / 2, del_p=err / 2)
+            truth = ["".join(random.choice("ACGT") for _ in range(length)) for _ in range(strands)]
+            clusters = [list(channel.transmit([s] * cov)) for s in truth]
+            for name, aligner in aligners.items():
+                dist = 0
+                exact = 0
+                start = time()
+                for s, reads in zip(truth, clusters):
+                    cons = list(aligner.align(reads))[0]
+                    d = _levenshtein(cons.encode(), s.encode())
+                    dist += d
+                    exact += d == 0
+                elapsed = time() - start
+                print(f"{cov:>8} {err:>6.2f} {name:>12} {dist / strands:>9.2f} {exact / strands:>6.2f} {elapsed / strands:>9.3f}")
+
+
+if __name__ == "__main__":
+    strands = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    length = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    coverages = [int(x) for x in sys.argv[3].split(",")] if len(sys.argv) > 3 else [5, 10, 20]
+    errors = [float(x) for x in sys.argv[4].split(",")] if len(sys.argv) > 4 else [0.04, 0.1]
+    run(strands, length, coverages, errors)
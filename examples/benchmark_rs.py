@@ -112,7 +112,7 @@ def run_benchmark(
 
                 dup = SoupDuplicator(copies=copies)
                 ids = IDSChannel(sub_p=sub_p, del_p=del_p, seed=None)
-                base_channel = type("Chain", (), {"transmit": lambda self, strands: ids.transmit(dup.transmit(strands))})()
+                base_channel = [dup, ids]
 
                 # ECC pipeline (outer RS across message chunks).
                 # Use n = ceil(k*(1+r)) but ensure n >= k; n==k gives no parity.
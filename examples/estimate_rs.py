@@ -0,0 +1,109 @@
+"""Fast estimate of the outer Reed–Solomon recovery sweep.
+
+Produces the bench_rs.csv columns of examples/benchmark_rs.py, but from the
+semi-analytic model in dna_storage.utils.recovery_model (per-column
+consensus errors with importance sampling, combined analytically with the RS
+decoder) instead of full pipeline runs, so a sweep takes seconds and rare
+failures are resolved. No pipeline trials are run, so the "trials" column is
+replaced by "samples", the importance samples per column estimate. Use
+benchmark_rs.py to spot-check the estimate.
+
+Arguments (all optional, same positions as benchmark_rs.py):
+  samples per column estimate, redundancies (comma separated), copies,
+  payload min, payload max, s-range min:max:step, output csv
+"""
+import sys
+import csv
+from math import ceil
+from pathlib import Path
+from time import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import numpy as np
+
+from dna_storage.utils.oligo_utils import recommend_rs_parameters
+from dna_storage.utils.recovery_model import estimate_recovery
+
+
+def run_estimate(
+    samples=20000,
+    copies=20,
+    oligo_len=158,
+    adapter_overhead=0,
+    redundancies=None,
+    payload_min=500,
+    payload_max=700,
+    s_min=0.02,
+    s_max=0.2,
+    s_step=0.02,
+    out="bench_rs.csv",
+    seed=None,
+):
+    # same code sizing as run_benchmark
+    rec = recommend_rs_parameters(oligo_len, adapter_overhead)
+    n_max = rec["n_max"]
+    max_overhead = 0.30
+    k = max(1, int(n_max / (1 + max_overhead)))
+    redundancy_levels = [r for r in (redundancies or [0.15]) if r > 0.0]
+    S_values = [round(s_min + i * s_step, 5) for i in range(int(round((s_max - s_min) / s_step)) + 1)]
+
+    rng = np.random.default_rng(seed)
+    results = []
+    start = time()
+    for r in redundancy_levels:
+        n = max(k + 1, min(n_max, ceil(k * (1 + r))))
+        for S in S_values:
+            est = estimate_recovery(S, n, k, copies, payload_min, payload_max, samples=samples, rng=rng)
+            print(f"redundancy {r:.2f} S={S:.3f}: mean {est['mean_percent']:.2f}% std {est['std_percent']:.2f}")
+            results.append(
+                {
+                    "redundancy": r,
+                    "error_total": S,
+                    "k": k,
+                    "copies": copies,
+                    "samples": samples,
+                    "mean_percent_recovered_ecc": est["mean_percent"],
+                    "std_percent_recovered_ecc": est["std_percent"],
+                }
+            )
+    print(f"estimated {len(results)} points in {time() - start:.2f}s")
+
+    fieldnames = [
+        "redundancy",
+        "error_total",
+        "k",
+        "copies",
+        "samples",
+        "mean_percent_recovered_ecc",
+        "std_percent_recovered_ecc",
+    ]
+    with open(out, "w", newline="") as fh:
+        w = csv.DictWriter(fh, fieldnames=fieldnames)
+        w.writeheader()
+        w.writerows(results)
+    return results
+
+
+if __name__ == "__main__":
+    samples = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    redundancies = [float(x) for x in sys.argv[2].split(",")] if len(sys.argv) > 2 else None
+    copies = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+    payload_min = int(sys.argv[4]) if len(sys.argv) > 4 else 500
+    payload_max = int(sys.argv[5]) if len(sys.argv) > 5 else 700
+    s_min, s_max, s_step = 0.02, 0.2, 0.02
+    if len(sys.argv) > 6:
+        s_min, s_max, s_step = [float(x) for x in sys.argv[6].split(":")]
+    out = sys.argv[7] if len(sys.argv) > 7 else "bench_rs.csv"
+
+    run_estimate(
+        samples=samples,
+        copies=copies,
+        redundancies=redundancies,
+        payload_min=payload_min,
+        payload_max=payload_max,
+        s_min=s_min,
+        s_max=s_max,
+        s_step=s_step,
+        out=out,
+    )
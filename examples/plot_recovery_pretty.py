@@ -1,6 +1,6 @@
 """Create a modern, clearer plot from bench_rs.csv
 
-This script reads bench_rs.csv (columns: redundancy,k,copies,trials,mean_percent_recovered_ecc,std_percent_recovered_ecc)
+This script reads bench_rs.csv (columns: redundancy,k,copies,trials (samples for estimate_rs.py output),mean_percent_recovered_ecc,std_percent_recovered_ecc)
 and creates an annotated, publication-friendly figure with:
 - mean percent recovered (line + markers)
 - shaded std band
@@ -32,7 +32,9 @@ def read_bench(path):
             if copies is None:
                 copies = int(row.get('copies', 0))
             if trials is None:
-                trials = int(row.get('trials', 0))
+                # estimate_rs.py writes importance samples instead of trials
+                unit = 'trials' if 'trials' in row else 'samples'
+                trials = f"{unit}={int(row.get(unit, 0))}"
     return redundancies, means, stds, copies, trials
 
 
@@ -73,7 +75,7 @@ def pretty_plot(path, out, show_ci=True):
     ax.set_title('Outer RS (message-level) — recovery vs redundancy', fontsize=14, fontweight='bold')
 
     # add some explanatory subtitle with sample size / copies
-    ax.text(0.99, 0.02, f"trials={trials} per point · copies={copies}", transform=ax.transAxes, ha='right', fontsize=9, color='dimgray')
+    ax.text(0.99, 0.02, f"{trials} per point · copies={copies}", transform=ax.transAxes, ha='right', fontsize=9, color='dimgray')
 
     ax.set_ylim(-5, 105)
     ax.set_xticks(xs)
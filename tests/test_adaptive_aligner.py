@@ -0,0 +1,35 @@
+from dna_storage.components.aligner.adaptive_aligner import AdaptiveConsensusAligner
+
+
+def test_adaptive_consensus_stops_early_on_clean_reads():
+    strand = "ACGTTGCAAGCTTACGGATC"
+    consumed = []
+
+    def reads():
+        for i in range(1000):
+            consumed.append(i)
+            yield strand
+
+    al = AdaptiveConsensusAligner(margin=4, min_reads=3)
+    assert al.align(reads()) == [strand]
+    # 4 identical reads give every column a margin of 4
+    assert al.reads_used == [4]
+    assert len(consumed) == 4
+
+
+def test_adaptive_consensus_respects_read_budget():
+    reads = ["ACGTACGT", "ACGAACGT", "ACGTACGA", "TCGTACGT"] * 10
+    al = AdaptiveConsensusAligner(margin=100, min_reads=2, max_reads=6)
+    out = al.align(reads)
+    assert out == ["ACGTACGT"]
+    assert al.reads_used == [6]
+    assert al.last_margin < 100
+
+
+def test_adaptive_consensus_returns_when_consensus_oscillates():
+    # re-centering flips between TCAGTCGGTACCACTC and TCAGTCGGTACCCACTC
+    reads = ["CAGGTCGGTATCATC", "TCAGTCGGTAACCCACTC", "TCAGGGCAGCAGCTACAC"]
+    aligner = AdaptiveConsensusAligner(margin=3, min_reads=3, max_reads=3)
+    out = aligner.align(reads)
+    assert out[0] in ("TCAGTCGGTACCACTC", "TCAGTCGGTACCCACTC")
+    assert aligner.reads_used == [3]
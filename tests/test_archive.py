@@ -0,0 +1,89 @@
+import os
+
+import pytest
+
+from dna_storage.core.archive import ArchiveReader, ArchiveWriter, write_archive
+from dna_storage.components.encoder.reed_solomon import SystematicReedSolomonEncoder
+from dna_storage.components.decoder.reed_solomon import SystematicReedSolomonDecoder
+from dna_storage.components.mapper.rotating import RotatingMapper
+from dna_storage.components.channel.soup_duplicator import SoupDuplicator
+from dna_storage.components.channel.ids_channel import IDSChannel
+from dna_storage.components.aligner.simple_aligner import SimpleAligner
+
+
+def _clusters(strands, copies=3, seed=0):
+    dup, ids = SoupDuplicator(copies), IDSChannel(sub_p=0.01, del_p=0.0, seed=seed)
+    return [list(ids.transmit(dup.transmit([s]))) for s in strands]
+
+
+def _codec():
+    mapper = RotatingMapper()
+    return SystematicReedSolomonEncoder(n=24, k=16), mapper, SystematicReedSolomonDecoder(n=24, k=16, mapper=mapper)
+
+
+def test_archive_roundtrip_and_single_file_extract(tmp_path):
+    files = {f"dir/f{i}.bin": os.urandom(10 + 37 * i) for i in range(6)}
+    files["empty"] = b""
+    enc, mapper, dec = _codec()
+    strands, manifest = write_archive(files, enc, mapper, outer_k=6, outer_n=8)
+    assert len(strands) == manifest.layout.first_id + manifest.layout.total_strands
+
+    reader = ArchiveReader(_clusters(strands), dec, SimpleAligner())
+    assert reader.names() == list(files)
+    # one member decodes only its own strands
+    assert reader.extract("dir/f2.bin") == files["dir/f2.bin"]
+    assert reader.last_stats["strands"] == len(manifest.file_strands("dir/f2.bin"))
+    assert reader.verify() == {name: True for name in files}
+
+    paths = reader.extract_all(str(tmp_path / "out"))
+    assert len(paths) == len(files)
+    assert (tmp_path / "out" / "dir" / "f5.bin").read_bytes() == files["dir/f5.bin"]
+    with pytest.raises(ValueError):
+        reader.extract("missing")
+
+
+def test_manifest_survives_lost_copies_and_checksums_catch_bad_data():
+    enc, mapper, dec = _codec()
+    files = {"a": os.urandom(100), "b": os.urandom(50)}
+    strands, manifest = write_archive(files, enc, mapper, manifest_copies=3)
+    clusters = _clusters(strands)
+    first = manifest.layout.first_id
+    m = (first - 3) // 3
+    # lose the first superblock and the first strand of every manifest copy but one
+    for sid in [0, 3, 3 + m]:
+        clusters[sid] = []
+    reader = ArchiveReader(clusters, dec)
+    assert reader.extract("b") == files["b"]
+
+    # swap the strands of "a" for other data: decodes, but fails its checksum
+    other, _ = write_archive({"a": os.urandom(100), "b": files["b"]}, enc, mapper, manifest_copies=3)
+    for sid in manifest.file_strands("a"):
+        clusters[sid] = [other[sid]]
+    reader = ArchiveReader(clusters, dec)
+    assert reader.verify() == {"a": False, "b": True}
+    with pytest.raises(ValueError, match="checksum"):
+        reader.extract("a")
+    assert len(reader.extract("a", verify=False)) == 100
+
+    with pytest.raises(ValueError, match="superblock"):
+        ArchiveReader([[]] * len(strands), dec)
+
+
+def test_writer_adds_directories_and_encodes_in_workers(tmp_path):
+    src = tmp_path / "src"
+    (src / "sub").mkdir(parents=True)
+    (src / "x.txt").write_bytes(b"x" * 40)
+    (src / "sub" / "y.txt").write_bytes(b"y" * 25)
+    enc, mapper, dec = _codec()
+
+    writer = ArchiveWriter(enc, mapper)
+    writer.add_path(str(src))
+    assert list(writer.files) == ["src/x.txt", "src/sub/y.txt"]
+    with pytest.raises(ValueError):
+        writer.add("src/x.txt", b"")
+    serial, manifest = writer.write()
+
+    writer.workers = 2
+    parallel, _ = writer.write()
+    assert parallel == serial
+    assert ArchiveReader([[s] for s in serial], dec).extract("src/sub/y.txt") == b"y" * 25
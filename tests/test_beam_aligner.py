@@ -0,0 +1,28 @@
+import random
+
+from dna_storage.components.aligner.beam_aligner import BeamSearchAligner
+
+
+def _delete(s, positions):
+    return "".join(c for i, c in enumerate(s) if i not in positions)
+
+
+def test_beam_aligner_reconstructs_from_deletions():
+    rng = random.Random(7)
+    strand = "".join(rng.choice("ACGT") for _ in range(60))
+    reads = [_delete(strand, set(rng.sample(range(60), 3))) for _ in range(8)]
+    out = BeamSearchAligner(length=60).align(reads)
+    assert out == [strand]
+
+
+def test_beam_aligner_estimates_length_and_handles_substitutions():
+    rng = random.Random(11)
+    strand = "".join(rng.choice("ACGT") for _ in range(50))
+    reads = []
+    for i in range(10):
+        r = list(strand)
+        r[rng.randrange(50)] = "A" if i % 2 else "T"
+        reads.append("".join(r))
+    reads[0] = _delete(strand, {10, 30})
+    assert BeamSearchAligner(beam_width=4).align(reads) == [strand]
+    assert BeamSearchAligner().align([]) == []
@@ -0,0 +1,110 @@
+import pytest
+
+from dna_storage.core.checkpoint import CheckpointStore
+from dna_storage.core.pipeline import Pipeline
+from dna_storage.components.inputter.file_inputter import FileInputter
+from dna_storage.components.encoder.reed_solomon import ReedSolomonEncoder
+from dna_storage.components.decoder.reed_solomon import ReedSolomonDecoder
+from dna_storage.components.mapper.rotating import RotatingMapper
+from dna_storage.components.channel.soup_duplicator import SoupDuplicator
+from dna_storage.components.aligner.simple_aligner import SimpleAligner
+from dna_storage.components.aligner.progressive_aligner import ProgressiveAligner
+from dna_storage.components.outputter.yaml_outputter import YamlOutputter
+from dna_storage.utils.packed import PackedSequence
+from dna_storage.utils.reads import QualityRead
+
+
+def test_store_roundtrip_ranges_and_torn_writes(tmp_path):
+    store = CheckpointStore(str(tmp_path / "ck"))
+    records = [[b"\x00\xffraw"], ["ACGTACGTA", "ACGNT"], [], [QualityRead("ACG", [30, 20, 10])]]
+    store.save("reads", records)
+    assert store.is_complete("reads") and store.count("reads") == 4
+    loaded = store.load("reads")
+    assert loaded[:3] == records[:3]
+    assert loaded[3][0] == "ACG" and loaded[3][0].quality.tolist() == [30, 20, 10]
+    assert store.load("reads", 1, 2) == [records[1]]
+    assert store.load("reads", 1, 2, packed=True)[0][0] == PackedSequence.from_str("ACGTACGTA")
+    # the data is 2-bit packed
+    assert (tmp_path / "ck" / "reads.bin").stat().st_size < 60
+
+    # a torn record (crash mid-append) is dropped on resume
+    with open(tmp_path / "ck" / "reads.bin", "ab") as fh:
+        fh.write(b"\x05\x00")
+    w = store.writer("reads", resume=True)
+    w.append(["TTTT"])
+    w.close()
+    assert store.count("reads") == 5 and store.load("reads", 4) == [["TTTT"]]
+
+    # restarting a stage invalidates the later ones
+    store.save("consensus", [["A"]])
+    store.save("reads", [["C"]])
+    assert not store.is_complete("consensus") and store.count("consensus") == 0
+    assert store.latest() == "messages"
+
+
+class _CountingChannel:
+    def __init__(self, copies):
+        self.dup = SoupDuplicator(copies)
+        self.calls = 0
+
+    def transmit(self, strands):
+        self.calls += 1
+        return self.dup.transmit(strands)
+
+
+class _FailingAligner(SimpleAligner):
+    def __init__(self, fail_at):
+        super().__init__()
+        self.fail_at = fail_at
+        self.calls = 0
+
+    def align(self, reads):
+        self.calls += 1
+        if self.calls == self.fail_at:
+            raise RuntimeError("aligner crashed")
+        return super().align(reads)
+
+
+def _pipeline(tmp_path, channel, aligner, store):
+    src = tmp_path / "in.txt"
+    src.write_bytes(b"resume me from any stage, please")
+    mapper = RotatingMapper()
+    return Pipeline(
+        FileInputter(str(src), chunk_size=8),
+        ReedSolomonEncoder(n=12, k=8),
+        mapper,
+        channel,
+        ReedSolomonDecoder(n=12, k=8, mapper=mapper),
+        YamlOutputter(outpath=str(tmp_path / "out.yaml")),
+        aligner=aligner,
+        checkpoint=store,
+    )
+
+
+def test_pipeline_resumes_interrupted_consensus(tmp_path):
+    store = CheckpointStore(str(tmp_path / "ck"))
+    channel = _CountingChannel(3)
+    with pytest.raises(RuntimeError):
+        _pipeline(tmp_path, channel, _FailingAligner(fail_at=3), store).run()
+    assert store.latest() == "consensus" and store.count("consensus") == 2
+
+    aligner = _FailingAligner(fail_at=None)
+    cmp = _pipeline(tmp_path, channel, aligner, store).run(resume_from="latest")
+    assert cmp["equal"] is True
+    # channel ran once; only the two missing strands were aligned
+    assert channel.calls == 1 and aligner.calls == 2
+    assert store.latest() is None
+
+
+def test_pipeline_realigns_saved_reads_with_another_aligner(tmp_path):
+    store = CheckpointStore(str(tmp_path / "ck"))
+    channel = _CountingChannel(3)
+    assert _pipeline(tmp_path, channel, SimpleAligner(), store).run()["equal"] is True
+    cmp = _pipeline(tmp_path, channel, ProgressiveAligner(), store).run(resume_from="consensus")
+    assert cmp["equal"] is True and channel.calls == 1
+    assert _pipeline(tmp_path, channel, None, store).run(resume_from="decode")["equal"] is True
+
+    with pytest.raises(ValueError):
+        _pipeline(tmp_path, channel, None, None).run(resume_from="reads")
+    with pytest.raises(ValueError):
+        _pipeline(tmp_path, channel, None, store).run(resume_from="align")
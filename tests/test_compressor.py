@@ -0,0 +1,105 @@
+import os
+
+import pytest
+
+from dna_storage.components.compressor import BlockCompressor
+from dna_storage.components.encoder.reed_solomon import ReedSolomonEncoder, SystematicReedSolomonEncoder
+from dna_storage.components.decoder.reed_solomon import ReedSolomonDecoder, SystematicReedSolomonDecoder
+from dna_storage.components.mapper.rotating import RotatingMapper
+from dna_storage.components.channel.soup_duplicator import SoupDuplicator
+from dna_storage.components.aligner.simple_aligner import SimpleAligner
+from dna_storage.components.inputter.file_inputter import FileInputter
+from dna_storage.components.outputter.yaml_outputter import YamlOutputter
+from dna_storage.core.archive import ArchiveReader, write_archive
+from dna_storage.core.pipeline import Pipeline
+
+TEXT = b"".join(b"line %d: the quick brown fox jumps over the lazy dog\n" % (i % 50) for i in range(2000))
+
+
+@pytest.mark.parametrize("codec", ["zlib", "lzma", "bz2", "none"])
+def test_codecs_roundtrip(codec):
+    c = BlockCompressor(codec, block_size=4096)
+    packed = c.compress(TEXT)
+    assert c.decompress(packed) == TEXT
+    assert c.last_stats["corrupt"] == []
+    if codec != "none":
+        assert len(packed) < len(TEXT) // 5
+
+
+def test_auto_picks_a_codec_by_sampled_ratio():
+    c = BlockCompressor(block_size=4096)
+    assert c.choose_codec(TEXT) != "none"
+    assert c.choose_codec(os.urandom(20000)) == "none"
+    # incompressible data costs only the framing
+    noise = os.urandom(20000)
+    assert len(c.compress(noise)) < len(noise) + 200
+    assert c.decompress(c.compress(b"")) == b""
+
+
+def test_corrupt_block_is_zero_filled_and_others_survive():
+    c = BlockCompressor("zlib", block_size=1000)
+    packed = bytearray(c.compress(TEXT))
+    # damage the middle of the stream
+    mid = len(packed) // 2
+    packed[mid : mid + 20] = bytes(20)
+    out = c.decompress(bytes(packed))
+    bad = c.last_stats["corrupt"]
+    assert len(out) == len(TEXT) and 1 <= len(bad) <= 2
+    good = [i for i in range(c.last_stats["blocks"]) if i not in bad]
+    for i in good:
+        assert out[i * 1000 : (i + 1) * 1000] == TEXT[i * 1000 : (i + 1) * 1000]
+    assert out[bad[0] * 1000 : bad[0] * 1000 + 10] == bytes(10)
+    with pytest.raises(ValueError):
+        c.decompress(bytes(packed), strict=True)
+    with pytest.raises(ValueError):
+        c.decompress(b"\0" * 40)
+
+
+def test_header_copy_survives_a_lost_first_strand():
+    c = BlockCompressor("zlib", block_size=1000)
+    packed = c.compress(TEXT)
+    # first 24-byte strand zero-filled by the decoder, last one padded with zeros
+    damaged = bytes(24) + packed[24:] + bytes(10)
+    out = c.decompress(damaged)
+    assert len(out) == len(TEXT) and c.last_stats["corrupt"] == [0]
+    assert out[1000:] == TEXT[1000:]
+    # with both copies gone nothing is known about the stream
+    with pytest.raises(ValueError):
+        c.decompress(bytes(24) + packed[24:-20])
+
+
+def test_pipeline_compresses_before_encoding(tmp_path):
+    # small input: the pipeline's comparison report is quadratic
+    text = TEXT[:1500]
+    src = tmp_path / "in.txt"
+    src.write_bytes(text)
+    mapper = RotatingMapper()
+    compressor = BlockCompressor(block_size=512)
+    pipe = Pipeline(
+        FileInputter(str(src), chunk_size=30),
+        ReedSolomonEncoder(n=39, k=30),
+        mapper,
+        SoupDuplicator(2),
+        ReedSolomonDecoder(n=39, k=30, mapper=mapper),
+        YamlOutputter(outpath=str(tmp_path / "out.yaml")),
+        aligner=SimpleAligner(),
+        compressor=compressor,
+    )
+    cmp = pipe.run()
+    assert cmp["equal"]
+    assert compressor.last_stats["corrupt"] == []
+    # strands encode the compressed stream
+    assert len(compressor.compress(text)) < len(text) // 2
+
+
+def test_archive_stores_compressible_files_compressed():
+    mapper = RotatingMapper()
+    files = {"text": TEXT, "noise": os.urandom(300)}
+    enc = SystematicReedSolomonEncoder(n=24, k=16)
+    plain, _ = write_archive(files, enc, mapper)
+    strands, manifest = write_archive(files, enc, mapper, compressor=BlockCompressor())
+    assert manifest.compressed == {"text"}
+    assert len(strands) < len(plain) // 4
+    reader = ArchiveReader([[s] for s in strands], SystematicReedSolomonDecoder(n=24, k=16, mapper=mapper))
+    assert reader.extract("text") == TEXT
+    assert reader.verify() == {"text": True, "noise": True}
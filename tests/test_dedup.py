@@ -0,0 +1,87 @@
+import os
+
+import numpy as np
+
+from dna_storage.core.archive import ArchiveReader, ArchiveWriter, write_archive
+from dna_storage.components.compressor import BlockCompressor
+from dna_storage.components.encoder.reed_solomon import SystematicReedSolomonEncoder
+from dna_storage.components.decoder.reed_solomon import SystematicReedSolomonDecoder
+from dna_storage.components.mapper.rotating import RotatingMapper
+from dna_storage.utils.dedup import _GEAR, DedupIndex, Deduplicator, chunk_boundaries, chunk_digest, gear_hash
+
+
+def test_gear_hash_matches_rolling_definition():
+    data = os.urandom(300)
+    h, expected = gear_hash(data), []
+    acc = 0
+    for b in data:
+        acc = ((acc << 1) + int(_GEAR[b])) & 0xFFFFFFFF
+        expected.append(acc)
+    assert h.tolist() == expected
+
+
+def test_chunk_boundaries_follow_content():
+    data = os.urandom(200_000)
+    ends = chunk_boundaries(data, avg_size=2048)
+    sizes = np.diff([0] + ends)
+    assert ends[-1] == len(data)
+    assert sizes[:-1].min() >= 512 and sizes.max() <= 8192
+    assert 1000 < sizes.mean() < 4000
+    # a prefix insertion only moves the first boundaries
+    shifted = chunk_boundaries(b"inserted" + data, avg_size=2048)
+    assert len({e + 8 for e in ends} & set(shifted)) >= len(ends) - 2
+
+
+def test_index_grows_and_finds_every_key():
+    index = DedupIndex(capacity=4)
+    keys = [chunk_digest(i.to_bytes(4, "little")) for i in range(5000)]
+    for i, key in enumerate(keys):
+        assert index.add(key) == (i, True)
+    assert index.add(keys[123]) == (123, False)
+    assert len(index) == 5000 and index.get(keys[4999]) == 4999
+    assert index.get(chunk_digest(b"absent")) is None
+    # 12 bytes per slot, at most half full
+    assert index.nbytes <= 12 * 4 * 5000
+
+
+def test_deduplicator_stores_repeated_blocks_once():
+    rng = np.random.default_rng(7)
+    block = rng.bytes(50_000)
+    dedup = Deduplicator(avg_size=1024)
+    r1 = dedup.add(block + rng.bytes(3000))
+    r2 = dedup.add(rng.bytes(3000) + block)
+    # the two chunkings fall back into step a few chunks into the block
+    # (>= 83% of it shared over 400 seeds); the rest is stored twice
+    shared = set(r1) & set(r2)
+    assert sum(len(dedup.chunks[c]) for c in shared) >= 0.75 * len(block)
+    assert dedup.stats["unique_bytes"] < 0.7 * dedup.stats["bytes"]
+    assert b"".join(dedup.chunks[c] for c in r2)[3000:] == block
+
+
+def test_archive_dedup_roundtrip_and_bases_saved():
+    mapper = RotatingMapper()
+    enc = SystematicReedSolomonEncoder(n=24, k=16)
+    shared = os.urandom(20_000)
+    files = {"a": shared + b"tail a", "b": b"head b" + shared, "c": os.urandom(500), "empty": b""}
+    plain, _ = write_archive(files, enc, mapper)
+    strands, manifest = write_archive(files, enc, mapper, dedup_chunk_size=1024, compressor=BlockCompressor())
+    assert len(strands) < 0.7 * len(plain)
+    assert set(manifest.recipes) == set(files)
+
+    reader = ArchiveReader([[s] for s in strands], SystematicReedSolomonDecoder(n=24, k=16, mapper=mapper))
+    assert reader.verify() == {name: True for name in files}
+    assert reader.extract("b") == files["b"]
+    assert reader.last_stats["strands"] == len(manifest.file_strands("b"))
+
+
+def test_archive_writer_reports_dedup_stats():
+    mapper = RotatingMapper()
+    writer = ArchiveWriter(SystematicReedSolomonEncoder(n=24, k=16), mapper, outer_k=8, outer_n=10, dedup_chunk_size=512)
+    data = os.urandom(8000)
+    for i in range(4):
+        writer.add(f"copy{i}", data)
+    strands, _ = writer.write()
+    stats = writer.last_stats
+    assert stats["files"] == 4 and stats["unique_bytes"] == 8000 and stats["bytes"] == 32000
+    # 3 of 4 copies not stored: 24000 / 16 rows, scaled by the outer code
+    assert stats["strands_saved"] == 1875 and stats["bases_saved"] == 1875 * len(strands[-1])
@@ -0,0 +1,67 @@
+import json
+
+from dna_storage.cli import main
+from dna_storage.components.decoder.reed_solomon import ReedSolomonDecoder, SystematicReedSolomonDecoder
+from dna_storage.components.encoder.reed_solomon import ReedSolomonEncoder, SystematicReedSolomonEncoder
+from dna_storage.components.mapper.rotating import RotatingMapper
+from dna_storage.utils.diagnostics import CORRECTED, DECODED, ERASED, FAILED, MISSING, DecodeStatus
+
+
+def _flip(strand: str, byte: int) -> str:
+    i = 4 * byte
+    return strand[:i] + ("A" if strand[i] != "A" else "C") + strand[i + 1 :]
+
+
+def test_systematic_decoder_reports_status_per_read():
+    mapper = RotatingMapper()
+    enc = SystematicReedSolomonEncoder(n=24, k=16)
+    dec = SystematicReedSolomonDecoder(n=24, k=16, mapper=mapper)
+    strand = mapper.map(enc.encode(bytes(range(16))))
+    reads = [strand, _flip(_flip(strand, 2), 9), strand[: 4 * 21], _flip(strand[: 4 * 18], 0), "A" * 4 * 24]
+    out = dec.decode(reads)
+    assert len(out) == 5 * 16 and out[-16:] == bytes(16)
+    assert dec.last_status.codes.tolist() == [DECODED, CORRECTED, ERASED, ERASED, FAILED]
+    assert dec.last_status.corrected.tolist()[:4] == [0, 2, 0, 1]
+    assert dec.last_status.erased.tolist()[:4] == [0, 0, 3, 6]
+    assert dec.last_status.lost() == [4]
+
+
+def test_interpolation_decoder_reports_erased_and_failed():
+    mapper = RotatingMapper()
+    dec = ReedSolomonDecoder(n=12, k=8, mapper=mapper)
+    strand = mapper.map(ReedSolomonEncoder(n=12, k=8).encode(bytes(range(8))))
+    out = dec.decode([strand, strand[: 4 * 10], strand[: 4 * 5]])
+    assert out == bytes(range(8)) * 2 + bytes(8)
+    assert dec.last_status.codes.tolist() == [DECODED, ERASED, FAILED]
+    assert dec.last_status.erased.tolist() == [0, 2, 0]
+
+
+def test_status_counts_and_roundtrip(tmp_path):
+    status = DecodeStatus()
+    for code in (DECODED, CORRECTED, FAILED, MISSING, DECODED):
+        status.record(code, corrected=1 if code == CORRECTED else 0)
+    assert status.counts() == {"decoded": 2, "corrected": 1, "erased": 0, "failed": 1, "missing": 1}
+    assert status.ok().tolist() == [True, True, False, False, True]
+    assert status.lost() == [2, 3]
+    for name in ("map.csv", "map.npy"):
+        status.save(str(tmp_path / name))
+        loaded = DecodeStatus.load(str(tmp_path / name))
+        assert [loaded[i] for i in range(len(loaded))] == [status[i] for i in range(len(status))]
+    assert (tmp_path / "map.csv").read_text().splitlines()[3] == "2,failed,0,0"
+
+
+def test_cli_decode_writes_failure_map(tmp_path):
+    cfg = tmp_path / "config.json"
+    cfg.write_text(json.dumps({"encoder": {"type": "ReedSolomonEncoder", "n": 12, "k": 8}}))
+    src = tmp_path / "f.bin"
+    src.write_bytes(bytes(range(1, 33)))
+    main(["encode", str(src), "-o", str(tmp_path), "-c", str(cfg), "-q"])
+    lines = (tmp_path / "f.bin.fa").read_text().splitlines()
+    # drop strand 2
+    (tmp_path / "f.bin.fa").write_text("\n".join(lines[:4] + lines[6:]) + "\n")
+
+    args = ["decode", str(tmp_path / "f.bin.fa"), "-o", str(tmp_path / "out"), "-c", str(cfg), "-q"]
+    assert main(args + ["--failure-map", "csv"]) == 1
+    status = DecodeStatus.load(str(tmp_path / "out" / "f.bin.failures.csv"))
+    assert status.strands.tolist() == [0, 1, 2, 3]
+    assert status.lost() == [2] and status.codes[2] == MISSING
@@ -0,0 +1,73 @@
+import gzip
+
+import numpy as np
+import pytest
+
+from dna_storage.components.channel.fastq_reader import FastqReader
+from dna_storage.components.aligner.simple_aligner import SimpleAligner
+from dna_storage.utils.reads import QualityRead
+
+
+FASTQ = (
+    "@r1 strand=0\nACGTACGT\n+\nIIIIIIII\n"
+    "@r2\nacgtac\n+r2\n#####5\n"
+    "@r3\nTTGCA\n+\n!!!!I\n"
+)
+
+
+def test_fastq_reader_parses_records_across_small_chunks(tmp_path):
+    path = tmp_path / "reads.fastq"
+    path.write_text(FASTQ)
+    # chunk sizes smaller than a record force carry-over between blocks
+    for chunk_size in (1, 7, 64, 1 << 20):
+        recs = list(FastqReader(str(path), chunk_size=chunk_size).read_records())
+        assert [(n, s) for n, s, _ in recs] == [("r1 strand=0", "ACGTACGT"), ("r2", "ACGTAC"), ("r3", "TTGCA")]
+        assert recs[0][2].tolist() == [40] * 8
+        assert recs[1][2].tolist() == [2] * 5 + [20]
+        assert recs[2][2].tolist() == [0, 0, 0, 0, 40]
+
+
+def test_fastq_reader_gzip_fasta_and_transmit(tmp_path):
+    gz = tmp_path / "reads.fastq.gz"
+    with gzip.open(gz, "wt") as fh:
+        fh.write(FASTQ.replace("\n", "\r\n"))
+    reads = list(FastqReader(str(gz), chunk_size=5).transmit(["ignored"]))
+    assert reads == ["ACGTACGT", "ACGTAC", "TTGCA"]
+    assert isinstance(reads[0], QualityRead) and len(reads[0].quality) == 8
+
+    fa = tmp_path / "reads.fa"
+    fa.write_text(">a\nACGT\nTT\n>b desc\nggcc\n")
+    reader = FastqReader(str(fa), chunk_size=3, max_reads=1)
+    assert list(reader.transmit()) == ["ACGTTT"]
+    assert [r for _, r, _ in FastqReader(str(fa)).read_records()] == ["ACGTTT", "GGCC"]
+
+
+def test_fastq_reader_rejects_malformed_input(tmp_path):
+    path = tmp_path / "bad.fastq"
+    path.write_text("@r1\nACGT\n+\nIII\n")
+    with pytest.raises(ValueError):
+        list(FastqReader(str(path)).reads())
+    path.write_text("@r1\nACGT\n+\nIIII\n@r2\nAC\n")
+    with pytest.raises(ValueError):
+        list(FastqReader(str(path)).reads())
+    # quality characters below the offset must not wrap around to high scores
+    path.write_text("@r1\nACGT\n+\nII I\n")
+    with pytest.raises(ValueError, match="phred_offset"):
+        list(FastqReader(str(path)).reads())
+    path.write_text(FASTQ)
+    with pytest.raises(ValueError, match="phred_offset"):
+        list(FastqReader(str(path), phred_offset=64).reads())
+    assert len(list(FastqReader(str(path), phred_offset=64, with_quality=False).reads())) == 3
+
+
+def test_simple_aligner_weights_votes_by_quality():
+    high, low = np.full(6, 40), np.full(6, 3)
+    reads = [
+        QualityRead("ACGTAC", high),
+        QualityRead("ACCTAC", low),
+        QualityRead("ACCTAC", low),
+    ]
+    # two low-quality reads are outvoted by one confident read
+    assert SimpleAligner().align(reads) == ["ACGTAC"]
+    # without qualities the majority wins
+    assert SimpleAligner().align([str(r) for r in reads]) == ["ACCTAC"]
@@ -20,6 +20,23 @@ def test_gf4_roundtrip():
     assert out == b
 
 
+def test_gf4_batch_pack_unpack():
+    import numpy as np
+    from dna_storage.utils.gf4 import pack_gf4, unpack_gf4
+
+    batch = np.frombuffer(b"abcdefgh12345678", dtype=np.uint8).reshape(4, 4)
+    syms = unpack_gf4(batch)
+    assert syms.shape == (4, 16)
+    assert syms[1].tolist() == to_gf4_symbols(b"efgh")
+    assert pack_gf4(syms).tobytes() == batch.tobytes()
+    # partial trailing byte is zero padded like from_gf4_symbols
+    assert pack_gf4([1, 2, 3]).tobytes() == from_gf4_symbols([1, 2, 3]) == bytes([0b01101100])
+    # NumPy symbol arrays of any integer dtype pack by value
+    for dtype in (np.int64, np.uint8):
+        assert from_gf4_symbols(np.array([1, 2, 3, 0], dtype=dtype)) == b"l"
+    assert from_gf4_symbols(syms[1]) == b"efgh"
+
+
 def test_basic_pipeline_roundtrip(tmp_path):
     # create input file
     data = b"small message for pipeline test"
@@ -33,18 +50,8 @@ def test_basic_pipeline_roundtrip(tmp_path):
     mapper = RotatingMapper()
     dup = SoupDuplicator(copies=5)
     ids = IDSChannel(sub_p=0.01, del_p=0.0, seed=42)
-    # a small chain
-    class Chain:
-        def __init__(self, layers):
-            self.layers = layers
-
-        def transmit(self, strands):
-            out = strands
-            for l in self.layers:
-                out = l.transmit(out)
-            return out
-
-    channel = Chain([dup, ids])
+    # channel layers are chained by the pipeline
+    channel = [dup, ids]
     decoder = SimpleGf4ParityDecoder(mapper)
     outputter = YamlOutputter(outpath=str(out_path))
 
@@ -91,18 +98,8 @@ def test_aligner_improves_consensus(tmp_path):
     # set a non-zero deletion rate to simulate indel-heavy channel
     ids = IDSChannel(sub_p=0.01, del_p=0.05, seed=None)
 
-    # chain
-    class Chain:
-        def __init__(self, layers):
-            self.layers = layers
-
-        def transmit(self, strands):
-            out = strands
-            for l in self.layers:
-                out = l.transmit(out)
-            return out
-
-    channel = Chain([dup, ids])
+    # channel layers are chained by the pipeline
+    channel = [dup, ids]
     decoder = SimpleGf4ParityDecoder(mapper)
 
     # pipeline without aligner
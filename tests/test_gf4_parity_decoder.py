@@ -0,0 +1,30 @@
+import numpy as np
+
+from dna_storage.components.encoder.dna_rs_gf4 import SimpleGf4ParityEncoder
+from dna_storage.components.decoder.dna_rs_gf4_decoder import SimpleGf4ParityDecoder, majority_vote
+from dna_storage.components.mapper.rotating import RotatingMapper
+
+
+def test_majority_vote_counts_and_confidence():
+    syms = np.array([[0, 1, 2], [0, 1, 3], [0, 2, 3], [1, 1, 3]])
+    cons, conf = majority_vote(syms)
+    assert cons.tolist() == [0, 1, 3]
+    assert conf.tolist() == [0.75, 0.75, 0.75]
+
+
+def test_parity_repairs_least_confident_column():
+    mapper = RotatingMapper()
+    syms = SimpleGf4ParityEncoder().encode(b"hi")
+    good = mapper.map(syms)
+    # corrupt symbol 2 in two of three reads so the vote picks a wrong value
+    bad_syms = list(syms)
+    bad_syms[2] ^= 1
+    bad = mapper.map(bad_syms)
+
+    dec = SimpleGf4ParityDecoder(mapper)
+    assert dec.decode([good, bad, bad, good, good]) == b"hi"
+    assert dec.last_parity_ok is True
+
+    out = dec.decode([bad, bad, good])
+    assert dec.last_parity_ok is False
+    assert out == b"hi"
@@ -0,0 +1,90 @@
+import os
+
+import pytest
+
+from dna_storage.core.checkpoint import CheckpointStore
+from dna_storage.core.layout import Manifest, RandomAccessReader, StrandLayout, encode_files
+from dna_storage.core.pipeline import Pipeline
+from dna_storage.components.inputter.file_inputter import FileInputter
+from dna_storage.components.encoder.reed_solomon import ReedSolomonEncoder, SystematicReedSolomonEncoder
+from dna_storage.components.decoder.reed_solomon import ReedSolomonDecoder, SystematicReedSolomonDecoder
+from dna_storage.components.mapper.rotating import RotatingMapper
+from dna_storage.components.channel.soup_duplicator import SoupDuplicator
+from dna_storage.components.channel.ids_channel import IDSChannel
+from dna_storage.components.aligner.simple_aligner import SimpleAligner
+from dna_storage.components.outputter.yaml_outputter import YamlOutputter
+
+
+def test_layout_addresses_and_manifest_roundtrip():
+    layout = StrandLayout(k=10, size=95, outer_k=4, outer_n=6)
+    assert layout.data_strands == 10 and layout.blocks == 3 and layout.total_strands == 16
+    # data strand 5 is row 1 of block 1, which starts at strand id 6
+    assert layout.strand_id(5) == 7
+    assert layout.strands_for(38, 5) == [3, 6]
+    data_idx, ids = layout.block_rows(2)
+    assert list(data_idx) == [8, 9] and ids == [12, 13, 14, 15]
+    with pytest.raises(ValueError):
+        layout.data_indices(90, 10)
+
+    m = Manifest(layout, {"a": (0, 38), "b": (38, 57)})
+    m2 = Manifest.from_json(m.to_json())
+    assert m2.files == m.files and m2.layout.to_dict() == layout.to_dict()
+    assert m2.file_strands("b")[0] == 3
+
+
+def _clusters(strands, copies=3):
+    # one read cluster per strand id
+    dup, ids = SoupDuplicator(copies), IDSChannel(sub_p=0.01, del_p=0.0, seed=0)
+    return [list(ids.transmit(dup.transmit([s]))) for s in strands]
+
+
+def test_decode_range_touches_only_needed_strands_and_repairs_with_outer_code():
+    files = {"a.txt": os.urandom(70), "b.bin": os.urandom(130), "c": b"tail"}
+    mapper = RotatingMapper()
+    enc = SystematicReedSolomonEncoder(n=14, k=10)
+    strands, manifest = encode_files(files, enc, mapper, outer_k=5, outer_n=7)
+    assert len(strands) == manifest.layout.total_strands
+    clusters = _clusters(strands)
+    reader = RandomAccessReader(clusters, manifest, SystematicReedSolomonDecoder(n=14, k=10, mapper=mapper), SimpleAligner())
+
+    payload = b"".join(files.values())
+    assert reader.decode_range(65, 10) == payload[65:75]
+    assert reader.last_stats == {"strands": 2, "reads": 6, "repaired_blocks": 0}
+    for name, data in files.items():
+        assert reader.read_file(name) == data
+
+    # lose two data strands of one block: the block's parity recovers them
+    lost = manifest.layout.strands_for(70, 20)
+    damaged = {sid: reads for sid, reads in enumerate(clusters) if sid not in lost}
+    reader = RandomAccessReader(damaged, manifest, SystematicReedSolomonDecoder(n=14, k=10, mapper=mapper))
+    assert reader.read_file("b.bin") == files["b.bin"]
+    assert reader.last_stats["repaired_blocks"] == 1
+
+
+def test_decode_range_from_pipeline_checkpoint(tmp_path):
+    data = bytes(range(256)) * 2
+    src = tmp_path / "in.bin"
+    src.write_bytes(data)
+    mapper = RotatingMapper()
+    store = CheckpointStore(str(tmp_path / "ck"))
+    Pipeline(
+        FileInputter(str(src), chunk_size=16),
+        ReedSolomonEncoder(n=20, k=16),
+        mapper,
+        [SoupDuplicator(4), IDSChannel(0.01, 0.0, seed=5)],
+        ReedSolomonDecoder(n=20, k=16, mapper=mapper),
+        YamlOutputter(outpath=str(tmp_path / "out.yaml")),
+        aligner=SimpleAligner(),
+        checkpoint=store,
+    ).run()
+
+    manifest = Manifest(StrandLayout(16, len(data)), {"in.bin": (0, len(data))})
+    reader = RandomAccessReader(store, manifest, ReedSolomonDecoder(n=20, k=16, mapper=mapper), SimpleAligner())
+    assert reader.decode_range(100, 50) == data[100:150]
+    # 4 strands of 32, each with 4 reads
+    assert reader.last_stats["strands"] == 4 and reader.last_stats["reads"] == 16
+
+    # without an outer code a lost strand is an error
+    no_reads = RandomAccessReader([[]] * 32, manifest, ReedSolomonDecoder(n=20, k=16, mapper=mapper))
+    with pytest.raises(ValueError):
+        no_reads.decode_range(0, 10)
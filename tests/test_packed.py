@@ -0,0 +1,118 @@
+import pickle
+import sys
+
+import pytest
+
+from dna_storage.core.pipeline import Pipeline
+from dna_storage.components.inputter.file_inputter import FileInputter
+from dna_storage.components.encoder.reed_solomon import ReedSolomonEncoder
+from dna_storage.components.decoder.reed_solomon import ReedSolomonDecoder
+from dna_storage.components.mapper.rotating import RotatingMapper
+from dna_storage.components.channel.soup_duplicator import SoupDuplicator
+from dna_storage.components.channel.ids_channel import IDSChannel
+from dna_storage.components.aligner.simple_aligner import SimpleAligner
+from dna_storage.components.outputter.yaml_outputter import YamlOutputter
+from dna_storage.utils.oligo_utils import reverse_complement
+from dna_storage.utils.packed import PackedReadSet, PackedSequence
+
+
+def test_packed_sequence_behaves_like_its_string():
+    s = "ACGTTGCAACGTAGC"
+    p = PackedSequence.from_str(s)
+    assert len(p) == len(s) and str(p) == s and p.nbytes == 4
+    assert p[0] == "A" and p[-1] == "C" and list(p) == list(s)
+    for sl in (slice(4, 11), slice(3, 9), slice(None, None, -1), slice(2, 2)):
+        assert str(p[sl]) == s[sl]
+    assert p[4:11] == PackedSequence.from_str(s[4:11])
+    assert hash(p[0:8]) == hash(PackedSequence.from_str(s[:8]))
+    assert str(p.reverse_complement()) == reverse_complement(s)
+    assert pickle.loads(pickle.dumps(p)) == p
+    assert p != s
+    with pytest.raises(IndexError):
+        p[len(s)]
+    with pytest.raises(ValueError):
+        PackedSequence.from_str("ACGN")
+
+
+def test_packed_read_set_is_compact():
+    reads = ["ACGT" * 37 + "AC"] * 1000
+    packed = PackedReadSet(reads)
+    assert len(packed) == 1000 and str(packed[-1]) == reads[0]
+    assert [str(r) for r in packed[10:12]] == reads[10:12]
+    assert isinstance(packed[10:12], PackedReadSet) and [str(r) for r in packed[5:1:-2]] == reads[5:1:-2]
+    assert packed.nbytes * 3 <= sum(sys.getsizeof(r) for r in reads)
+    # against a list of standalone PackedSequence objects
+    objects = [PackedSequence.from_str(r) for r in reads]
+    assert packed.nbytes * 2 <= sum(sys.getsizeof(r) + sys.getsizeof(r.data) for r in objects)
+    # slices share the buffer; concat and pickling copy it
+    parts = [packed[:400], packed[400:999:2], packed[999:]]
+    joined = PackedReadSet.concat(parts)
+    assert len(joined) == 701 and str(joined[-1]) == reads[-1]
+    assert [str(r) for r in pickle.loads(pickle.dumps(parts[0]))] == reads[:400]
+
+
+def test_mapper_packed_roundtrip():
+    m = RotatingMapper()
+    syms = [0, 3, 2, 1, 1, 0, 2, 3, 3]
+    p = m.map_packed(syms)
+    assert str(p) == m.map(syms)
+    assert m.reverse(p) == m.reverse(m.map(syms)) == syms
+    assert m.reverse_batch([p, p]).tolist() == [syms, syms]
+
+
+def test_pipeline_runs_on_packed_strands(tmp_path):
+    src = tmp_path / "in.txt"
+    src.write_bytes(b"packed strands all the way")
+    mapper = RotatingMapper()
+    channel = [SoupDuplicator(5), IDSChannel(0.01, 0.0, seed=4)]
+    pipe = Pipeline(
+        FileInputter(str(src), chunk_size=8),
+        ReedSolomonEncoder(n=12, k=8),
+        mapper,
+        channel,
+        ReedSolomonDecoder(n=12, k=8, mapper=mapper),
+        YamlOutputter(outpath=str(tmp_path / "out.yaml")),
+        aligner=_PackedGroupAligner(),
+        packed=True,
+    )
+    assert pipe.run()["equal"] is True
+    # each strand's reads arrive as one packed buffer
+    assert pipe.aligner.groups == 4
+
+
+class _PackedGroupAligner(SimpleAligner):
+    groups = 0
+
+    def align(self, reads):
+        assert isinstance(reads, PackedReadSet)
+        self.groups += 1
+        return super().align(reads)
+
+
+class _PackedReadsDecoder(ReedSolomonDecoder):
+    def decode(self, reads):
+        assert isinstance(reads, PackedReadSet)
+        return super().decode(reads)
+
+
+def test_pipeline_streams_packed_reads_to_the_decoder(tmp_path):
+    src = tmp_path / "in.txt"
+    src.write_bytes(b"packed strands, no aligner")
+    mapper = RotatingMapper()
+    pipe = Pipeline(
+        FileInputter(str(src), chunk_size=8),
+        ReedSolomonEncoder(n=12, k=8),
+        mapper,
+        [SoupDuplicator(1), IDSChannel(0.0, 0.0, seed=1)],
+        _PackedReadsDecoder(n=12, k=8, mapper=mapper),
+        YamlOutputter(outpath=str(tmp_path / "out.yaml")),
+        packed=True,
+    )
+    assert pipe.run()["equal"] is True
+
+
+def test_ids_channel_mutates_packed_codes_like_strings():
+    strand = "ACGTTGCAACGTAGC" * 10
+    plain = list(IDSChannel(0.1, 0.05, seed=7).transmit([strand] * 5))
+    packed = list(IDSChannel(0.1, 0.05, seed=7).transmit([PackedSequence.from_str(strand)] * 5))
+    assert [str(r) for r in packed] == plain and all(isinstance(r, PackedSequence) for r in packed)
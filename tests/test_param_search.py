@@ -0,0 +1,50 @@
+from math import comb
+
+import numpy as np
+
+from dna_storage.utils.param_search import (
+    binom_sf,
+    block_failure_probability,
+    consensus_error,
+    pretty_search_report,
+    search_parameters,
+)
+
+
+def test_binomial_tail_matches_direct_sum():
+    n, p = 30, np.array([0.01, 0.2])
+    for t in (-1, 0, 3, 15, 30):
+        direct = [sum(comb(n, i) * q**i * (1 - q) ** (n - i) for i in range(t + 1, n + 1)) for q in p]
+        assert np.allclose(binom_sf(t, n, p), direct, rtol=1e-9, atol=1e-300)
+    assert binom_sf(np.array([1, 2]), n, p).shape == (2, 2)
+
+
+def test_consensus_and_block_failure_models():
+    err = consensus_error(0.1, 0.0, [1, 2, 3])
+    assert np.allclose(err, [0.1, 0.1, 3 * 0.1**2 * 0.9 + 0.1**3])
+    # more reads -> better consensus
+    assert np.all(np.diff(consensus_error(0.05, 0.05, [1, 3, 5, 9, 15])) < 0)
+
+    # RS(10, 6) corrects 2 errors: fails on 3 or more
+    fail = block_failure_probability(0.1, 10, [6, 8], decoder="errors")
+    assert np.isclose(fail[0], 1 - sum(comb(10, i) * 0.1**i * 0.9 ** (10 - i) for i in range(3)))
+    assert fail[1] > fail[0]
+    assert np.isclose(block_failure_probability(0.1, 10, 6, decoder="erasure"), 1 - 0.9**6)
+
+
+def test_search_ranks_feasible_parameters_by_cost():
+    res = search_parameters(0.02, 0.01, 100_000, target=0.999, oligo_lens=(120, 160))
+    ranked = res["ranked"]
+    assert res["best"] == ranked[0] and 0 < len(ranked) <= 10 < res["feasible"] <= res["evaluated"]
+    costs = [r["bases_per_byte"] for r in ranked]
+    assert costs == sorted(costs)
+    assert all(r["success_probability"] >= 0.999 and r["k"] < r["n"] for r in ranked)
+    assert "bases/byte" in pretty_search_report(res)
+
+    # a noisier channel needs at least as much coverage and costs more
+    noisy = search_parameters(0.08, 0.04, 100_000, target=0.999, oligo_lens=(120, 160))
+    assert noisy["best"]["bases_per_byte"] > res["best"]["bases_per_byte"]
+
+    # without an outer code or coverage slack nothing survives dropouts
+    none = search_parameters(0.02, 0.01, 100_000, coverages=(1,), outer_redundancies=(0.0,))
+    assert none["best"] is None and "no parameter set" in pretty_search_report(none)
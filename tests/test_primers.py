@@ -0,0 +1,87 @@
+import random
+
+import numpy as np
+
+from dna_storage.components.channel.ids_channel import IDSChannel
+from dna_storage.components.channel.primers import PrimerAttacher, PrimerTrimmer, StrandFlipper
+from dna_storage.utils.oligo_utils import reverse_complement
+from dna_storage.utils.packed import PackedSequence
+from dna_storage.utils.reads import QualityRead
+
+FWD = "ACACGACGCTCTTCCGATCT"
+REV = "GTTCGTCTTCTGCCGTATGC"
+
+
+def _substitute(s, positions):
+    out = list(s)
+    for p in positions:
+        out[p] = "A" if out[p] != "A" else "C"
+    return "".join(out)
+
+
+def test_reverse_complement():
+    assert reverse_complement("AACGTN") == "NACGTT"
+    assert reverse_complement(reverse_complement(FWD)) == FWD
+
+
+def test_attach_flip_and_trim_roundtrip():
+    rng = random.Random(1)
+    payloads = ["".join(rng.choice("ACGT") for _ in range(40)) for _ in range(50)]
+    attacher = PrimerAttacher(FWD, REV)
+    assert attacher.overhead == 40
+    reads = list(StrandFlipper(p=0.5, seed=3).transmit(attacher.transmit(payloads)))
+    trimmer = PrimerTrimmer(FWD, REV, batch_size=16)
+    assert list(trimmer.transmit(reads)) == payloads
+    stats = trimmer.last_stats
+    assert stats["reads"] == 50 and stats["discarded"] == 0
+    assert 10 < stats["reverse_complemented"] < 40
+
+
+def test_trimmer_tolerates_mismatches_and_shifts_and_discards_junk():
+    payload = "TTGACCATGGCATGCAAGTC"
+    read = "GG" + _substitute(FWD, [3, 11]) + payload + _substitute(reverse_complement(REV), [5])
+    junk = "ACGT" * 15
+    trimmer = PrimerTrimmer(FWD, REV, max_mismatches=2)
+    assert list(trimmer.transmit([read, junk, reverse_complement(read)])) == [payload, payload]
+    assert trimmer.last_stats["discarded"] == 1
+    # too many primer errors -> unrecognized
+    bad = _substitute(FWD, [0, 5, 10]) + payload + reverse_complement(REV)
+    assert list(trimmer.transmit([bad])) == []
+
+
+def test_trimmer_missing_reverse_site_and_qualities():
+    payload = "CCCCGGGGAAAATTTT"
+    damaged = FWD + payload + "A" * len(REV)
+    assert list(PrimerTrimmer(FWD, REV).transmit([damaged])) == [payload]
+    assert list(PrimerTrimmer(FWD, REV, require_reverse=True).transmit([damaged])) == []
+
+    seq = reverse_complement(FWD + payload + reverse_complement(REV))
+    q = np.arange(len(seq), dtype=np.uint8)
+    (out,) = PrimerTrimmer(FWD, REV).transmit([QualityRead(seq, q)])
+    assert out == payload
+    assert out.quality.tolist() == q[::-1][len(FWD) : len(FWD) + len(payload)].tolist()
+
+
+def test_trimmer_handles_indels_inside_primers():
+    payload = "TTGACCATGGCATGCAAGTC"
+    # one base deleted from the forward primer, one inserted into the reverse site
+    tail = reverse_complement(REV)
+    read = FWD[:7] + FWD[8:] + payload + tail[:9] + "G" + tail[9:]
+    trimmer = PrimerTrimmer(FWD, REV, max_mismatches=1)
+    assert list(trimmer.transmit([read, reverse_complement(read)])) == [payload, payload]
+
+
+def test_trimmer_keeps_ids_channel_reads_and_packed_reads():
+    rng = random.Random(4)
+    payloads = ["".join(rng.choice("ACGT") for _ in range(60)) for _ in range(400)]
+    strands = list(PrimerAttacher(FWD, REV).transmit(payloads))
+    reads = list(StrandFlipper(seed=1).transmit(IDSChannel(sub_p=0.0, del_p=0.01, seed=2).transmit(strands)))
+    trimmer = PrimerTrimmer(FWD, REV)
+    out = list(trimmer.transmit(reads))
+    # a Hamming scan loses every read with a deletion inside its forward primer (~15%)
+    assert trimmer.last_stats["discarded"] <= 4
+    assert all(54 <= len(r) <= 60 for r in out)
+
+    packed = list(trimmer.transmit([PackedSequence.from_str(r) for r in reads]))
+    assert all(isinstance(r, PackedSequence) for r in packed)
+    assert [str(r) for r in packed] == out
@@ -0,0 +1,21 @@
+from dna_storage.components.aligner.progressive_aligner import ProgressiveAligner
+
+
+def _delete(s, positions):
+    return "".join(c for i, c in enumerate(s) if i not in positions)
+
+
+def test_progressive_aligner_restores_bases_missing_from_reference():
+    strand = "ACGTTGCAAGCTTACGGATC"
+    # every read (including the longest) lost a different base
+    reads = [_delete(strand, {i}) for i in (2, 7, 11, 15, 18)]
+    al = ProgressiveAligner()
+    assert al.align(reads) == [strand]
+    assert 2 <= al.last_iterations <= 4
+
+
+def test_progressive_aligner_stops_when_stable():
+    al = ProgressiveAligner(max_iter=5)
+    assert al.align(["ACGT", "ACGT", "ACTT"]) == ["ACGT"]
+    assert al.last_iterations == 1
+    assert al.align([]) == []
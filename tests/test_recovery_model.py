@@ -0,0 +1,35 @@
+import numpy as np
+
+from dna_storage.utils.recovery_model import column_error, estimate_recovery, layout_failure, strand_failure
+
+
+def test_importance_sampled_column_error_matches_plain_monte_carlo():
+    rng = np.random.default_rng(7)
+    est, se = column_error(0.1, 0.05, 5, samples=40000, rng=rng)
+    p = [0.95 * 0.9, 0.05] + [0.95 * 0.1 / 3] * 3
+    counts = rng.multinomial(5, p, size=400000)
+    best_wrong, correct = counts[:, 2:].max(axis=1), counts[:, 0]
+    direct = np.where(best_wrong > correct, 1.0, np.where((best_wrong == correct) & (correct > 0), 0.5, 0.0)).mean()
+    assert abs(est - direct) < 4 * se + 1e-3
+
+    # rare tail is resolved instead of rounding to zero
+    tiny, tiny_se = column_error(0.02, 0.01, 30, samples=20000, rng=rng)
+    assert 0 < tiny < 1e-12 and tiny_se < tiny
+    assert column_error(0.0, 0.0, 10) == (0.0, 0.0)
+
+
+def test_layout_and_strand_failure_grow_with_deletions():
+    rates = [layout_failure(d, 60, 39, 30) for d in (0.0, 0.02, 0.04, 0.06)]
+    assert rates[0] == 0.0 and all(a <= b for a, b in zip(rates, rates[1:]))
+    assert rates[-1] > 0.5
+    # the errors decoder corrects scattered byte errors the erasure decoder cannot
+    rng = np.random.default_rng(1)
+    assert strand_failure(0.3, 0.0, 3, 40, 20, "errors", rng=rng) < strand_failure(0.3, 0.0, 3, 40, 20, "erasure", rng=rng)
+
+
+def test_estimate_recovery_shape():
+    rng = np.random.default_rng(3)
+    low = estimate_recovery(0.02, 39, 30, 60, rng=rng)
+    high = estimate_recovery(0.1, 39, 30, 60, rng=rng)
+    assert low["mean_percent"] > 99.9 and low["std_percent"] < 1
+    assert 20 < high["mean_percent"] < 90 and high["std_percent"] > 10
@@ -0,0 +1,39 @@
+import os
+
+import numpy as np
+import pytest
+
+from dna_storage.utils import gf65536
+from dna_storage.components.encoder.reed_solomon16 import ReedSolomon16Encoder
+from dna_storage.components.decoder.reed_solomon16 import ReedSolomon16Decoder
+
+
+def test_gf65536_field_ops():
+    rng = np.random.default_rng(1)
+    a = rng.integers(1, 65536, 500)
+    b = rng.integers(1, 65536, 500)
+    assert np.all(gf65536.div(gf65536.mul(a, b), b) == a)
+    assert np.all(gf65536.mul(a, gf65536.inverse(a)) == 1)
+    assert np.all(gf65536.mul(a, 0) == 0)
+
+
+def test_outer_code_spans_more_than_255_strands():
+    n, k = 300, 270
+    rows = [os.urandom(11) for _ in range(k)]
+    block = ReedSolomon16Encoder(n=n, k=k).encode_rows(rows)
+    assert len(block) == n
+    # systematic: data rows are unchanged (padded to an even length)
+    assert block[0][:11] == rows[0]
+
+    lost = set(range(0, 60, 2))  # 30 erasures == n - k
+    received = [None if i in lost else r for i, r in enumerate(block)]
+    out = ReedSolomon16Decoder(n=n, k=k).decode_rows(received)
+    assert [r[:11] for r in out] == rows
+
+
+def test_outer_code_too_many_erasures():
+    n, k = 8, 6
+    block = ReedSolomon16Encoder(n=n, k=k).encode_rows([b"ab"] * k)
+    received = [None, None, None] + block[3:]
+    with pytest.raises(ValueError):
+        ReedSolomon16Decoder(n=n, k=k).decode_rows(received)
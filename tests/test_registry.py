@@ -0,0 +1,98 @@
+import json
+
+import numpy as np
+import pytest
+
+from dna_storage.core import registry
+from dna_storage.core.pipeline import Pipeline
+from dna_storage.components.channel.chained import ChainedChannel, FusedDuplicateIDS, fuse_layers
+from dna_storage.components.channel.ids_channel import IDSChannel
+from dna_storage.components.channel.soup_duplicator import SoupDuplicator
+from dna_storage.components.channel.rs_inner_channel import RSInnerChannel
+from dna_storage.components.decoder.reed_solomon import ReedSolomonDecoder
+from dna_storage.utils.packed import PackedSequence
+
+
+def test_resolve_builtins_dotted_paths_and_registered():
+    assert registry.resolve("decoder", "ReedSolomonDecoder") is ReedSolomonDecoder
+    assert registry.resolve("decoder", "dna_storage.components.decoder.reed_solomon:ReedSolomonDecoder") is ReedSolomonDecoder
+    with pytest.raises(ValueError):
+        registry.resolve("aligner", "NoSuchAligner")
+    with pytest.raises(ValueError):
+        registry.resolve("nonsense", "X")
+
+    @registry.register("channel", "noop")
+    class Noop:
+        def transmit(self, strands):
+            return strands
+
+    try:
+        assert "noop" in registry.available("channel")
+        assert isinstance(registry.build("channel", "noop"), Noop)
+    finally:
+        registry._REGISTERED["channel"].pop("noop")
+
+
+def test_build_fills_defaults_and_nested_specs():
+    dec = registry.build("decoder", {"type": "ReedSolomonDecoder"}, n=12, k=8, mapper="m", unused=1)
+    assert (dec.n, dec.k, dec.mapper) == (12, 8, "m")
+    ch = registry.build("channel", {"type": "RSInnerChannel", "n": 30, "k": 20, "inner_channel": {"type": "SoupDuplicator", "copies": 2}})
+    assert isinstance(ch, RSInnerChannel) and isinstance(ch.inner, SoupDuplicator)
+
+
+def test_build_pipeline_from_spec_file(tmp_path):
+    src = tmp_path / "in.txt"
+    src.write_bytes(b"declarative pipeline specs")
+    spec = {
+        "inputter": {"type": "FileInputter", "path": str(src)},
+        "encoder": {"type": "ReedSolomonEncoder", "n": 12, "k": 8},
+        "channel": [{"type": "SoupDuplicator", "copies": 5}, {"type": "IDSChannel", "sub_p": 0.01, "del_p": 0.0, "seed": 3}],
+        "aligner": "SimpleAligner",
+        "decoder": "ReedSolomonDecoder",
+        "outputter": {"type": "YamlOutputter"},
+        "pipeline": {"fuse_channels": True},
+    }
+    path = tmp_path / "spec.json"
+    path.write_text(json.dumps(spec))
+    pipe = registry.build_pipeline(str(path), output_path=str(tmp_path / "out.yaml"))
+    assert isinstance(pipe, Pipeline) and pipe.inputter.chunk_size == 8
+    assert isinstance(pipe.channel._stages[0], FusedDuplicateIDS)
+    assert pipe.run()["equal"] is True
+
+    with pytest.raises(ValueError):
+        registry.build_pipeline({"encoder": "ReedSolomonEncoder"})
+
+
+def test_example_toml_spec_loads():
+    pytest.importorskip("tomllib")
+    spec = registry.load_spec("dna_storage/examples/rs_pipeline.toml")
+    assert [c["type"] for c in spec["channel"]] == ["SoupDuplicator", "IDSChannel"]
+    pipe = registry.build_pipeline(spec)
+    assert pipe.decoder.n == 20 and pipe.channel.fuse
+
+
+def test_fused_channel_matches_unfused_model():
+    strands = ["ACGT" * 25, "TTGCA" * 20, "GATTACA" * 10, "ACGT" * 25]
+    layers = [SoupDuplicator(copies=400), IDSChannel(sub_p=0.05, del_p=0.1, seed=1)]
+    fused = ChainedChannel(*layers, fuse=True)
+    assert isinstance(fused._stages[0], FusedDuplicateIDS)
+    reads = list(fused.transmit(strands))
+    assert len(reads) == 4 * 400
+    # same error model: mean read length (1 - del_p) * L, order kept per strand
+    for i, s in enumerate(strands):
+        group = reads[i * 400 : (i + 1) * 400]
+        assert np.mean([len(r) for r in group]) == pytest.approx(0.9 * len(s), rel=0.02)
+    # without deletions only substitutions remain, at rate sub_p
+    sub_only = ChainedChannel(SoupDuplicator(500), IDSChannel(sub_p=0.05, del_p=0.0, seed=2), fuse=True)
+    reads = list(sub_only.transmit(["ACGT" * 25]))
+    diff = np.mean([sum(a != b for a, b in zip(r, "ACGT" * 25)) for r in reads]) / 100
+    assert diff == pytest.approx(0.05, rel=0.1)
+
+    packed = list(ChainedChannel(*layers, fuse=True).transmit([PackedSequence.from_str("ACGT" * 10)]))
+    assert all(isinstance(r, PackedSequence) for r in packed)
+
+
+def test_fuse_layers_only_merges_adjacent_pairs():
+    dup, ids = SoupDuplicator(2), IDSChannel(0.0, 0.0)
+    stages = fuse_layers([ids, dup, ids, dup])
+    assert stages[0] is ids and isinstance(stages[1], FusedDuplicateIDS) and stages[2] is dup
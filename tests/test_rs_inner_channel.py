@@ -0,0 +1,103 @@
+import numpy as np
+import pytest
+
+from dna_storage.components.channel.rs_inner_channel import BatchRSInnerChannel
+from dna_storage.components.channel.soup_duplicator import SoupDuplicator
+from dna_storage.components.mapper.rotating import RotatingMapper
+from dna_storage.components.encoder.reed_solomon import ReedSolomonEncoder
+from dna_storage.components.decoder.reed_solomon import ReedSolomonDecoder
+
+
+def test_batch_rs_matches_scalar_path():
+    enc = ReedSolomonEncoder(n=12, k=8)
+    dec = ReedSolomonDecoder(n=12, k=8)
+    msgs = np.arange(80, dtype=np.uint8).reshape(10, 8)
+    cws = enc.encode_batch(msgs)
+    assert dec.decode([cws[3].tobytes()]) == msgs[3].tobytes()
+    assert np.array_equal(dec.decode_batch(cws), msgs)
+
+    mapper = RotatingMapper()
+    dna = mapper.map_batch(np.tile(np.arange(4), (2, 3)))
+    assert dna[0] == mapper.map(list(range(4)) * 3)
+    assert np.array_equal(mapper.reverse_batch(dna)[1], np.tile(np.arange(4), 3))
+
+
+def test_batch_inner_channel_roundtrip():
+    mapper = RotatingMapper()
+    strands = [mapper.map([(i + j) % 4 for j in range(32)]) for i in range(6)]
+    ch = BatchRSInnerChannel(SoupDuplicator(copies=3), n=12, k=8, mapper=mapper)
+    res = ch.transmit_detailed(strands)
+    assert res["strands"] == strands
+    assert res["failed"] == []
+    assert res["reads_per_strand"].tolist() == [3] * 6
+
+
+class _DropStrand:
+    """Inner channel that truncates every copy of one strand."""
+
+    def __init__(self, victim):
+        self.victim = victim
+        self.seen = 0
+
+    def transmit(self, strands):
+        for s in strands:
+            yield s[:10] if self.seen == self.victim else s
+            self.seen += 1
+
+
+def test_batch_inner_channel_reports_failures_in_place():
+    mapper = RotatingMapper()
+    strands = [mapper.map([i % 4] * 32) for i in range(4)]
+    ch = BatchRSInnerChannel(_DropStrand(victim=1), n=12, k=8, mapper=mapper)
+    res = ch.transmit_detailed(strands)
+    assert res["failed"] == [1]
+    assert res["strands"][1] is None
+    assert res["strands"][2] == strands[2]
+    # transmit keeps one output per strand, so later strands do not shift
+    out = BatchRSInnerChannel(_DropStrand(victim=1), n=12, k=8, mapper=mapper).transmit(strands)
+    assert out[1] == "" and out[3] == strands[3]
+
+
+class _CountingDuplicator(SoupDuplicator):
+    def __init__(self, copies):
+        super().__init__(copies=copies)
+        self.calls = 0
+
+    def transmit(self, strands):
+        self.calls += 1
+        return super().transmit(strands)
+
+
+class _UnevenCopies:
+    """Inner channel that loses a copy of strand 0 and duplicates strand 1 once more."""
+
+    def __init__(self):
+        self.seen = 0
+
+    def transmit(self, strands):
+        for s in strands:
+            yield from [s] * {0: 1, 1: 3}.get(self.seen, 2)
+            self.seen += 1
+
+
+class _DropFirst:
+    """Inner channel that loses the first read."""
+
+    def transmit(self, strands):
+        return list(strands)[1:]
+
+
+def test_batch_inner_channel_ties_reads_to_strands():
+    mapper = RotatingMapper()
+    strands = [mapper.map([(i + j) % 4 for j in range(32)]) for i in range(5)]
+    # the read total (10) divides evenly, but the copies do not
+    res = BatchRSInnerChannel(_UnevenCopies(), n=12, k=8, mapper=mapper).transmit_detailed(strands)
+    assert res["reads_per_strand"].tolist() == [1, 3, 2, 2, 2]
+    assert res["strands"] == strands
+
+    # per_strand=False: one inner-channel call, reads attributed by order
+    inner = _CountingDuplicator(copies=2)
+    res = BatchRSInnerChannel(inner, n=12, k=8, mapper=mapper, per_strand=False).transmit_detailed(strands)
+    assert inner.calls == 1 and res["strands"] == strands
+    with pytest.raises(ValueError, match="per_strand"):
+        BatchRSInnerChannel(_DropFirst(), n=12, k=8, mapper=mapper, per_strand=False).transmit_detailed(strands)
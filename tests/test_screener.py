@@ -0,0 +1,118 @@
+import json
+
+import numpy as np
+
+from dna_storage.cli import main
+from dna_storage.components.decoder.reed_solomon import SystematicReedSolomonDecoder
+from dna_storage.components.encoder.reed_solomon import SystematicReedSolomonEncoder
+from dna_storage.components.mapper import RotatingMapper, ScramblingMapper
+from dna_storage.components.screener import GC, HAIRPIN, HOMOPOLYMER, MOTIF, StrandScreener
+from dna_storage.core.pipeline import Pipeline
+from dna_storage.components.channel.soup_duplicator import SoupDuplicator
+from dna_storage.components.inputter.file_inputter import FileInputter
+from dna_storage.components.outputter.yaml_outputter import YamlOutputter
+
+
+def test_scrambling_mapper_roundtrip_for_every_seed():
+    mapper = ScramblingMapper(seed_bases=1)
+    symbols = np.random.default_rng(2).integers(0, 4, (6, 40))
+    strands = {seed: mapper.map_batch(symbols, seed) for seed in range(mapper.seeds)}
+    assert len({s[0] for s in strands.values()}) == 4
+    for seed, batch in strands.items():
+        assert len(batch[0]) == 41 and mapper.seed_of(batch[0]) == seed
+        assert batch[1] == mapper.map(symbols[1].tolist(), seed)
+        assert mapper.reverse(batch[2]) == symbols[2].tolist()
+    mixed = [strands[i % 4][i] for i in range(6)]
+    assert (mapper.reverse_batch(mixed) == symbols).all()
+
+
+def test_checks_flag_each_constraint():
+    screener = StrandScreener(gc_window=10, gc_min=0.3, gc_max=0.7, max_homopolymer=3, hairpin_stem=5, hairpin_loop=(3, 6))
+    strands = [
+        "ACCTGACCTGACCTGACCTG",  # clean
+        "ACCTGATATATATATACCTG",  # AT-rich window
+        "ACCTGAAAACCTGACCTGAC",  # run of 4
+        "ACCTGGAATTCTGACCTGAC",  # EcoRI site
+        "ACCTGGATCCCTGACCTGAC",  # BamHI site
+        "ACCTGAGGTTCACACCTCTG",  # GAGGT ... ACCTC stem, loop of 4
+    ]
+    flags = screener.check(strands)
+    assert flags.tolist() == [0, GC, HOMOPOLYMER, MOTIF, MOTIF, HAIRPIN]
+    m = screener.metrics(strands)
+    assert m["max_run"].tolist()[:3] == [2, 2, 4] and m["gc_min"][1] == 0.0
+    # motifs match on both strands: GAGACC is BsaI's reverse complement
+    assert screener.check(["ACCTGGAGACCTGACCTGAC"])[0] == MOTIF
+
+
+def test_vectorized_metrics_match_per_strand_reference():
+    screener = StrandScreener(gc_window=12, hairpin_stem=4, hairpin_loop=(3, 8))
+    rng = np.random.default_rng(5)
+    strands = ["".join(rng.choice(list("ACGT"), 60)) for _ in range(40)] + ["ACGT" * 5]
+    m = screener.metrics(strands)
+    comp = str.maketrans("ACGT", "TGCA")
+    for i, s in enumerate(strands):
+        gc = [sum(c in "GC" for c in s[j : j + 12]) / 12 for j in range(len(s) - 11)]
+        runs = [len(r) for r in "".join(a if a == b else a + " " for a, b in zip(s, s[1:] + " ")).split()]
+        hairpins = sum(
+            s[j : j + 4] == s[j + d : j + d + 4][::-1].translate(comp)
+            for d in range(7, 13)
+            for j in range(len(s) - d - 3)
+        )
+        assert (m["gc_min"][i], m["gc_max"][i]) == (min(gc), max(gc))
+        assert m["max_run"][i] == max(runs) and m["hairpins"][i] == hairpins
+
+
+def test_screen_remaps_failing_strands_and_decodes():
+    enc = SystematicReedSolomonEncoder(n=24, k=16)
+    mapper = ScramblingMapper()
+    rng = np.random.default_rng(9)
+    msgs = [rng.integers(0, 256, 16, dtype=np.uint8).tobytes() for _ in range(300)]
+    screener = StrandScreener(gc_window=20)
+    strands = screener.screen([enc.encode(m) for m in msgs], mapper)
+    stats = screener.last_stats
+    assert stats["strands"] == 300 and stats["flagged"] > 50
+    assert stats["remapped"] + stats["unresolved"] == stats["flagged"] and stats["unresolved"] <= 2
+    assert np.count_nonzero(screener.check(strands)) == stats["unresolved"]
+    assert len({mapper.seed_of(s) for s in strands}) > 1
+    dec = SystematicReedSolomonDecoder(n=24, k=16, mapper=mapper)
+    assert dec.decode(strands) == b"".join(msgs)
+    # without seeds to try, strands are only counted
+    screener.screen([enc.encode(m) for m in msgs], RotatingMapper())
+    assert screener.last_stats["remapped"] == 0 and screener.last_stats["unresolved"] > 50
+
+
+def test_pipeline_and_cli_screen_strands(tmp_path):
+    src = tmp_path / "in.bin"
+    src.write_bytes(bytes(np.random.default_rng(4).integers(0, 256, 160, dtype=np.uint8)))
+    mapper = ScramblingMapper()
+    screener = StrandScreener()
+    pipeline = Pipeline(
+        FileInputter(str(src), chunk_size=16),
+        SystematicReedSolomonEncoder(n=24, k=16),
+        mapper,
+        SoupDuplicator(copies=1),
+        SystematicReedSolomonDecoder(n=24, k=16, mapper=mapper),
+        YamlOutputter(outpath=str(tmp_path / "out.yaml")),
+        screener=screener,
+    )
+    assert pipeline.run()["equal"]
+    assert screener.last_stats["strands"] == 10
+
+    cfg = tmp_path / "config.json"
+    cfg.write_text(
+        json.dumps(
+            {
+                "encoder": {"type": "SystematicReedSolomonEncoder", "n": 24, "k": 16},
+                "decoder": {"type": "SystematicReedSolomonDecoder"},
+                "mapper": {"type": "ScramblingMapper"},
+                "screener": {"type": "StrandScreener"},
+                "channel": [{"type": "SoupDuplicator", "copies": 1}],
+                "aligner": None,
+            }
+        )
+    )
+    for batch in ("0", "4"):
+        out = tmp_path / f"b{batch}"
+        assert main(["encode", str(src), "-o", str(out), "-c", str(cfg), "-q", "--batch-size", batch]) == 0
+        assert main(["decode", str(out / "in.bin.fa"), "-o", str(out), "-c", str(cfg), "-q", "--batch-size", batch]) == 0
+        assert (out / "in.bin.decoded").read_bytes() == src.read_bytes()
@@ -0,0 +1,121 @@
+import numpy as np
+
+from dna_storage.components.aligner.simple_aligner import SimpleAligner
+from dna_storage.components.channel.ids_channel import IDSChannel
+from dna_storage.components.channel.soup_duplicator import SoupDuplicator
+from dna_storage.components.decoder.reed_solomon import SystematicReedSolomonDecoder
+from dna_storage.components.encoder.reed_solomon import SystematicReedSolomonEncoder
+from dna_storage.components.mapper.rotating import RotatingMapper
+from dna_storage.components.mapper.scrambling import ScramblingMapper
+from dna_storage.components.screener import StrandScreener
+from dna_storage.utils.reads import QualityRead, column_posteriors, prob_to_phred
+
+
+def test_column_posteriors_weigh_votes_and_qualities():
+    # columns: unanimous, 2-1 split, 2-1 split where the dissent is a gap
+    codes = np.array([[0, 0, 0], [1, 1, 2], [3, 3, 4]], dtype=np.uint8)
+    post = column_posteriors(codes, np.full((3, 3), 0.99))
+    assert np.allclose(post.sum(axis=1), 1)
+    assert post[0, 0] > 0.999999 and 0.5 < post[1, 1] < 0.998 and post[2, 3] > post[1, 1]
+    # a confident dissenting read outweighs two unsure ones
+    post = column_posteriors(np.array([[1, 1, 2]], dtype=np.uint8), np.array([[0.4, 0.4, 0.999]]))
+    assert post[0].argmax() == 2
+    assert prob_to_phred([0.5, 0.999, 1.0]).tolist() == [3, 30, 60]
+
+
+def test_simple_aligner_posteriors_mark_disputed_bases():
+    reads = ["ACGTACGTAC", "ACGTACGTAC", "ACGTTCGTAC"]
+    plain = SimpleAligner().align(reads)[0]
+    (cons,) = SimpleAligner(posteriors=True).align(reads)
+    assert isinstance(cons, QualityRead) and cons == plain == "ACGTACGTAC"
+    assert cons.quality[4] == cons.quality.min() < cons.quality[0]
+
+
+def _noisy_codeword(enc, mapper, msg, errors):
+    strand = list(mapper.map(enc.encode(msg)))
+    quality = np.full(len(strand), 40, dtype=np.uint8)
+    for byte in errors:
+        i = 4 * byte + 1
+        strand[i] = "A" if strand[i] != "A" else "C"
+        quality[i] = 8
+    return QualityRead("".join(strand), quality)
+
+
+def test_soft_decoder_erases_least_reliable_bytes():
+    mapper = RotatingMapper()
+    enc = SystematicReedSolomonEncoder(n=24, k=16)
+    msg = bytes(range(16))
+    # 6 byte errors: beyond the 4 errors hard decoding corrects with 8 parity bytes
+    read = _noisy_codeword(enc, mapper, msg, [0, 3, 7, 12, 18, 21])
+    hard = SystematicReedSolomonDecoder(n=24, k=16, mapper=mapper)
+    soft = SystematicReedSolomonDecoder(n=24, k=16, mapper=mapper, soft=True)
+    assert hard.decode([read]) == bytes(16) and hard.last_stats["failed"] == 1
+    assert soft.decode([read]) == msg
+    assert soft.last_stats == {"reads": 1, "failed": 0, "soft": 1}
+    # without qualities there is nothing to rank: soft mode falls back to hard decoding
+    assert soft.decode([str(read)]) == bytes(16) and soft.last_stats["failed"] == 1
+
+
+def test_soft_decoding_recovers_more_strands_at_low_coverage():
+    mapper = RotatingMapper()
+    enc = SystematicReedSolomonEncoder(n=30, k=24)
+    rng = np.random.default_rng(1)
+    msgs = [rng.integers(0, 256, 24, dtype=np.uint8).tobytes() for _ in range(120)]
+    dup, channel = SoupDuplicator(3), IDSChannel(0.12, 0.0, seed=3)
+    aligner = SimpleAligner(posteriors=True)
+    consensus = [aligner.align(list(channel.transmit(dup.transmit([mapper.map(enc.encode(m))]))))[0] for m in msgs]
+
+    def outcome(decoder):
+        right = wrong = 0
+        for c, m in zip(consensus, msgs):
+            out = decoder.decode([c])
+            if decoder.last_stats["failed"] == 0:
+                right += out == m
+                wrong += out != m
+        return right, wrong
+
+    hard = outcome(SystematicReedSolomonDecoder(n=30, k=24, mapper=mapper))
+    soft = outcome(SystematicReedSolomonDecoder(n=30, k=24, mapper=mapper, soft=True))
+    bold = outcome(SystematicReedSolomonDecoder(n=30, k=24, mapper=mapper, soft=True, soft_margin=1))
+    # whatever is not recovered is reported failed, never returned wrong
+    assert hard[1] == soft[1] == bold[1] == 0
+    assert soft[0] >= hard[0] and bold[0] >= hard[0] + 8
+
+
+def test_soft_decoding_still_fails_on_random_reads():
+    mapper = RotatingMapper()
+    rng = np.random.default_rng(11)
+    reads = [
+        QualityRead("".join(rng.choice(list("ACGT"), 4 * 30)), rng.integers(5, 40, 4 * 30).astype(np.uint8))
+        for _ in range(300)
+    ]
+    soft = SystematicReedSolomonDecoder(n=30, k=24, mapper=mapper, soft=True)
+    assert soft.decode(reads) == bytes(24 * 300)
+    assert soft.last_stats["failed"] == 300 and soft.last_status.counts()["failed"] == 300
+    # without a margin every word fits some codeword: nothing is detected
+    reckless = SystematicReedSolomonDecoder(n=30, k=24, mapper=mapper, soft=True, soft_margin=0)
+    reckless.decode(reads[:20])
+    assert reckless.last_stats["failed"] == 0
+
+
+def test_soft_decoding_skips_the_scrambling_seed_bases():
+    mapper = ScramblingMapper(seed_bases=2)
+    enc = SystematicReedSolomonEncoder(n=24, k=16)
+    rng = np.random.default_rng(6)
+    msgs = [rng.integers(0, 256, 16, dtype=np.uint8).tobytes() for _ in range(40)]
+    strands = StrandScreener(gc_window=20).screen([enc.encode(m) for m in msgs], mapper)
+    assert len({mapper.seed_of(s) for s in strands}) > 1
+    reads = []
+    for strand in strands:
+        bases = list(strand)
+        quality = np.full(len(bases), 40, dtype=np.uint8)
+        # 6 byte errors on each byte's last base: reliabilities read 2 bases
+        # early would blame the next byte instead
+        for byte in (0, 3, 7, 12, 18, 21):
+            i = mapper.prefix_bases + 4 * byte + 3
+            bases[i] = "A" if bases[i] != "A" else "C"
+            quality[i] = 8
+        reads.append(QualityRead("".join(bases), quality))
+    soft = SystematicReedSolomonDecoder(n=24, k=16, mapper=mapper, soft=True)
+    assert soft.decode(reads) == b"".join(msgs)
+    assert soft.last_stats["failed"] == 0
@@ -0,0 +1,73 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+
+from dna_storage.utils import gf256, gf65536
+
+ROOT = str(Path(__file__).resolve().parents[1])
+
+# heavy modules a CLI / worker start-up must not import eagerly
+HEAVY = (
+    "dna_storage.utils.gf65536",
+    "dna_storage.components.channel.rs_inner_channel",
+    "dna_storage.components.aligner.beam_aligner",
+    "dna_storage.components.encoder.reed_solomon16",
+    "multiprocessing",
+    "concurrent.futures",
+)
+
+
+def _run(code: str) -> str:
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return out.stdout
+
+
+def test_cli_import_is_lazy_and_within_budget():
+    out = _run(
+        "import sys, time, numpy\n"
+        "t = time.perf_counter()\n"
+        "import dna_storage.cli\n"
+        "print(time.perf_counter() - t)\n"
+        f"print([m for m in {HEAVY!r} if m in sys.modules])\n"
+    )
+    seconds, loaded = out.splitlines()
+    assert loaded == "[]"
+    # numpy excluded; ~20 ms on a laptop, generous for slow CI machines
+    assert float(seconds) < 0.5
+
+
+def test_lazy_package_exports():
+    out = _run(
+        "import sys\n"
+        "import dna_storage.components.encoder as enc\n"
+        "from dna_storage.utils import add, pack_gf4, recommend_rs_parameters\n"
+        "from dna_storage.utils import gf256\n"
+        "print(add is gf256.add, 'ReedSolomon16Encoder' in dir(enc))\n"
+        "print('dna_storage.components.encoder.reed_solomon16' in sys.modules)\n"
+        "from dna_storage.components.encoder import *\n"
+        "print(ReedSolomon16Encoder.__module__)\n"
+    )
+    assert out.splitlines() == ["True True", "False", "dna_storage.components.encoder.reed_solomon16"]
+
+
+def _lfsr_powers(prim: int, order: int, bits: int) -> list:
+    out, x = [], 1
+    for _ in range(order):
+        out.append(x)
+        x <<= 1
+        if x >> bits:
+            x ^= prim
+    return out
+
+
+def test_precomputed_gf_tables_match_generator():
+    exp = _lfsr_powers(gf256.PRIM, 255, 8)
+    assert gf256.EXP == exp * 2 + exp[:2]
+    assert all(gf256.LOG[x] == i for i, x in enumerate(exp))
+
+    exp16 = np.array(_lfsr_powers(gf65536.PRIM, gf65536.ORDER, 16))
+    assert np.array_equal(gf65536.EXP[: gf65536.ORDER], exp16)
+    assert np.array_equal(gf65536.EXP[gf65536.ORDER :], exp16)
+    assert np.array_equal(gf65536.LOG[exp16], np.arange(gf65536.ORDER))